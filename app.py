@@ -9,7 +9,57 @@ import pandas as pd
 from datetime import datetime
 from urllib.parse import urlparse
 import io
+import hashlib
 from component_crawler import ComponentCrawler
+from component_index import ComponentSearchIndex
+from excel_export import write_excel_streaming
+
+# 이 행 수를 넘는 결과는 버튼을 눌렀을 때만 내보내기 파일을 생성
+LAZY_EXPORT_ROW_THRESHOLD = 5000
+
+
+def fingerprint_dataframe(df):
+    """
+    DataFrame 내용 기반 지문(fingerprint) 생성
+    
+    Args:
+        df (DataFrame): 대상 데이터
+    Returns:
+        str: 내용이 같으면 항상 같은 16진수 문자열
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    digest = hashlib.sha1(row_hashes.tobytes())
+    digest.update('|'.join(map(str, df.columns)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_search_index(fingerprint, _df):
+    """
+    결과 검색 인덱스 (결과 지문 기준으로 한 번만 생성하여 재실행 간 재사용)
+    """
+    return ComponentSearchIndex.from_dataframe(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_excel_export(fingerprint, _df, split_by=None):
+    """
+    엑셀 내보내기 파일 생성 (지문 기준으로 캐시)
+    
+    _df는 해시하지 않으므로 같은 fingerprint의 재실행은 비용이 없음
+    write-only 스트리밍 방식으로 행을 기록하고, split_by 컬럼 값별로 시트를 나눔
+    """
+    output = io.BytesIO()
+    columns = list(_df.columns)
+    rows = (dict(zip(columns, values)) for values in _df.itertuples(index=False, name=None))
+    write_excel_streaming(rows, output, split_by=split_by, columns=columns)
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_csv_export(fingerprint, _df):
+    """CSV 내보내기 파일 생성 (지문 기준으로 캐시)"""
+    return _df.to_csv(index=False, encoding='utf-8-sig')
 
 # 페이지 설정
 st.set_page_config(
@@ -278,6 +328,10 @@ if 'url' not in st.session_state:
     st.session_state.url = None
 if 'crawl_time' not in st.session_state:
     st.session_state.crawl_time = None
+if 'results_fingerprint' not in st.session_state:
+    st.session_state.results_fingerprint = None
+if 'prepared_exports' not in st.session_state:
+    st.session_state.prepared_exports = set()
 
 # 크롤링 실행
 if crawl_button:
@@ -338,6 +392,7 @@ if crawl_button:
                 # 결과 저장
                 if results:
                     st.session_state.results = pd.DataFrame(results)
+                    st.session_state.results_fingerprint = fingerprint_dataframe(st.session_state.results)
                     st.session_state.crawl_time = datetime.now()
                     st.success(f"✅ 크롤링 완료! 총 {len(results)}개의 컴포넌트를 발견했습니다.")
                 else:
@@ -351,6 +406,7 @@ if crawl_button:
                     **예시 패턴:** `hd08-hero-kv-home`, `co76-feature-kv`, `nv16-country-selector`
                     """)
                     st.session_state.results = None
+                    st.session_state.results_fingerprint = None
                 
             except Exception as e:
                 import traceback
@@ -375,6 +431,7 @@ if crawl_button:
                 4. 배포 환경에서는 Chrome 설치가 필요할 수 있습니다
                 """)
                 st.session_state.results = None
+                st.session_state.results_fingerprint = None
             
             finally:
                 # 진행 상황 표시 제거
@@ -490,11 +547,12 @@ if st.session_state.results is not None:
         label_visibility="collapsed"
     )
     
+    if st.session_state.results_fingerprint is None:
+        st.session_state.results_fingerprint = fingerprint_dataframe(df)
+    
     if search_term:
-        filtered_df = df[
-            df['컴포넌트명'].str.contains(search_term, case=False, na=False) | 
-            df['전체 클래스 목록'].str.contains(search_term, case=False, na=False)
-        ]
+        search_index = get_search_index(st.session_state.results_fingerprint, df)
+        filtered_df = df.iloc[search_index.search(search_term)]
         st.markdown(f"""
         <div style="background-color: #d1ecf1; padding: 0.8rem; border-radius: 0.5rem; border-left: 4px solid #0c5460; margin-bottom: 1rem;">
             <p style="color: #0c5460; margin: 0; font-weight: 500;">
@@ -528,38 +586,62 @@ if st.session_state.results is not None:
     </h3>
     """, unsafe_allow_html=True)
     
-    col1, col2 = st.columns(2)
+    # 필터링된 결과의 지문: 원본 지문 + 검색어 (재실행마다 전체 해시를 다시 계산하지 않음)
+    export_fingerprint = hashlib.sha1(
+        f"{st.session_state.results_fingerprint}|{search_term}".encode('utf-8')
+    ).hexdigest()
     
-    with col1:
-        # 엑셀 다운로드 (전체 데이터 포함)
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            filtered_df.to_excel(writer, index=False, sheet_name='Components')
+    domain = urlparse(st.session_state.url).netloc.replace('www.', '').replace('.', '_')
+    timestamp = st.session_state.crawl_time.strftime('%Y%m%d_%H%M%S') if st.session_state.crawl_time else datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f"{domain}_components_{timestamp}.xlsx"
+    csv_filename = filename.replace('.xlsx', '.csv')
+    
+    # 대용량 결과는 사용자가 요청할 때만 생성하여 테이블 표시를 막지 않음
+    export_ready = (
+        len(filtered_df) <= LAZY_EXPORT_ROW_THRESHOLD or
+        export_fingerprint in st.session_state.prepared_exports
+    )
+    
+    if not export_ready:
+        st.info(f"ℹ️ 결과가 {len(filtered_df):,}행으로 많아 다운로드 파일을 요청 시 생성합니다.")
+        if st.button("📦 다운로드 파일 준비", use_container_width=True):
+            st.session_state.prepared_exports.add(export_fingerprint)
+            export_ready = True
+    
+    if export_ready:
+        split_option = st.selectbox(
+            "엑셀 시트 분리",
+            ["분리 안 함", "Site Code", "Page Type"],
+            help="선택한 컬럼 값별로 엑셀 시트를 나눕니다"
+        )
+        split_by = None if split_option == "분리 안 함" else split_option
         
-        domain = urlparse(st.session_state.url).netloc.replace('www.', '').replace('.', '_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{domain}_components_{timestamp}.xlsx"
+        col1, col2 = st.columns(2)
         
-        st.download_button(
-            label="📥 엑셀 다운로드 (.xlsx)",
-            data=output.getvalue(),
-            file_name=filename,
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
-        )
-    
-    with col2:
-        # CSV 다운로드 (전체 데이터 포함)
-        csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
-        csv_filename = filename.replace('.xlsx', '.csv')
+        with col1:
+            # 엑셀 다운로드 (전체 데이터 포함)
+            with st.spinner('📦 엑셀 파일 생성 중...'):
+                excel_data = build_excel_export(export_fingerprint, filtered_df, split_by)
+            
+            st.download_button(
+                label="📥 엑셀 다운로드 (.xlsx)",
+                data=excel_data,
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
         
-        st.download_button(
-            label="📥 CSV 다운로드 (.csv)",
-            data=csv,
-            file_name=csv_filename,
-            mime="text/csv",
-            use_container_width=True
-        )
+        with col2:
+            # CSV 다운로드 (전체 데이터 포함)
+            csv = build_csv_export(export_fingerprint, filtered_df)
+            
+            st.download_button(
+                label="📥 CSV 다운로드 (.csv)",
+                data=csv,
+                file_name=csv_filename,
+                mime="text/csv",
+                use_container_width=True
+            )
 
 else:
     # 초기 화면
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+리소스 기반 동시 실행 수 자동 조절
+병렬 크롤링 중 브라우저별 메모리(RSS), CPU 사용률, 분당 처리 페이지 수를 측정하여
+메모리 한도 안에서 처리량이 가장 높은 Chrome 인스턴스 수를 찾고 계속 조절
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+import browser_processes
+
+# 조절 단계
+PHASE_WARMUP = 'warmup'  # 1개씩 늘리며 처리량이 오르는지 확인
+PHASE_STEADY = 'steady'  # 가장 좋았던 수준 유지 (주기적으로 한 단계 늘려 재확인)
+
+
+class ConcurrencyAutotuner:
+    """
+    동시 실행 수 자동 조절 (hill climbing)
+
+    - 워밍업: min_workers에서 시작하여 측정 구간마다 처리량이 improvement 이상 오르고
+      CPU/메모리 여유가 있으면 1개씩 늘리고, 오르지 않으면 가장 좋았던 수준으로 돌아가 유지
+    - 유지: 메모리 한도 초과나 CPU 포화 시 줄이고, probe_windows 구간마다 여유가 있으면 다시 늘려 확인
+    - 줄어든 작업 스레드의 브라우저는 종료하여 메모리를 반환
+    """
+
+    def __init__(self, crawler_factory=None, min_workers=1, max_workers=None, memory_ceiling_mb=None,
+                 window_seconds=60.0, improvement=0.05, cpu_limit=0.9, probe_windows=5, scheduler=None):
+        """
+        초기화
+        Args:
+            crawler_factory (callable): 크롤러 생성 함수 (None이면 ComponentCrawler())
+            min_workers (int): 최소 동시 실행 수
+            max_workers (int): 최대 동시 실행 수 (None이면 CPU 코어 수)
+            memory_ceiling_mb (float): 브라우저 메모리 합계 한도 (None이면 시스템 메모리의 70%)
+            window_seconds (float): 측정 구간 길이 (초)
+            improvement (float): 늘린 뒤 처리량이 이 비율 이상 올라야 계속 늘림
+            cpu_limit (float): CPU 사용률이 이 값 이상이면 포화로 판단 (0.0 ~ 1.0)
+            probe_windows (int): 유지 단계에서 재확인까지 기다릴 측정 구간 수
+            scheduler (PolitenessScheduler): 호스트별 속도 제한 (None이면 사용하지 않음)
+        """
+        if crawler_factory is None:
+            from component_crawler import ComponentCrawler
+            crawler_factory = ComponentCrawler
+        self.crawler_factory = crawler_factory
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers or os.cpu_count() or 1)
+        if memory_ceiling_mb is None:
+            total, _ = browser_processes.system_memory_mb()
+            memory_ceiling_mb = total * 0.7 if total else None
+        self.memory_ceiling_mb = memory_ceiling_mb
+        self.window_seconds = window_seconds
+        self.improvement = improvement
+        self.cpu_limit = cpu_limit
+        self.probe_windows = probe_windows
+        self.scheduler = scheduler
+
+        self.target = self.min_workers
+        self.phase = PHASE_WARMUP
+        self.best = None  # (동시 실행 수, 분당 페이지)
+        self.decisions = []
+        self.windows = []
+        self.condition = threading.Condition()
+        self.crawlers = {}
+        self.completed = deque()  # 완료 시각
+        self.cpu = browser_processes.CpuSampler()
+        self._windows_since_change = 0
+
+    def browser_rss_mb(self):
+        """
+        실행 중인 브라우저 메모리
+        Returns:
+            tuple: (RSS 합계 MB, 실행 중인 브라우저 수)
+        """
+        total = 0.0
+        browsers = 0
+        for crawler in list(self.crawlers.values()):
+            pid = crawler.driver_process_id() if getattr(crawler, 'driver', None) else None
+            if not pid:
+                continue
+            rss = browser_processes.rss_mb(browser_processes.process_tree(pid))
+            if rss is not None:
+                total += rss
+                browsers += 1
+        return total, browsers
+
+    def _set_target(self, target, reason, metrics):
+        target = max(self.min_workers, min(self.max_workers, target))
+        if target == self.target:
+            return
+        decision = dict(metrics, previous=self.target, target=target, reason=reason, phase=self.phase)
+        self.decisions.append(decision)
+        print(f"🎛️  동시 실행 {self.target} → {target} ({reason})")
+        with self.condition:
+            self.target = target
+            self.condition.notify_all()
+        self._windows_since_change = 0
+
+    def evaluate(self, metrics):
+        """
+        측정 구간 하나의 결과로 동시 실행 수 조절
+        Args:
+            metrics (dict): {'pages_per_minute', 'rss_mb', 'browsers', 'cpu', 'available_mb'}
+        """
+        self._windows_since_change += 1
+        throughput = metrics['pages_per_minute']
+        rss = metrics['rss_mb']
+        per_browser = rss / metrics['browsers'] if metrics['browsers'] else None
+        cpu = metrics['cpu']
+        ceiling = self.memory_ceiling_mb
+
+        over_memory = ceiling is not None and rss > ceiling
+        memory_room = ceiling is None or per_browser is None or rss + per_browser <= ceiling
+        cpu_room = cpu is None or cpu < self.cpu_limit
+
+        if over_memory:
+            self.phase = PHASE_STEADY
+            self._set_target(self.target - 1, f"메모리 한도 초과 {rss:.0f}MB > {ceiling:.0f}MB", metrics)
+            return
+
+        if self.phase == PHASE_WARMUP:
+            if self.best is None or throughput >= self.best[1] * (1 + self.improvement):
+                if self.best is None or throughput > self.best[1]:
+                    self.best = (self.target, throughput)
+                if self.target >= self.max_workers:
+                    self.phase = PHASE_STEADY
+                    print(f"   🎛️  최대 동시 실행 {self.max_workers}개 도달 - 유지")
+                elif not cpu_room:
+                    self.phase = PHASE_STEADY
+                    print(f"   🎛️  CPU 포화 ({cpu * 100:.0f}%) - {self.target}개 유지")
+                elif not memory_room:
+                    self.phase = PHASE_STEADY
+                    print(f"   🎛️  메모리 여유 부족 (브라우저당 {per_browser:.0f}MB) - {self.target}개 유지")
+                else:
+                    self._set_target(self.target + 1, f"처리량 {throughput:.1f}페이지/분, 한 단계 증가", metrics)
+            else:
+                self.phase = PHASE_STEADY
+                self._set_target(self.best[0], f"처리량 개선 없음 ({throughput:.1f} < {self.best[1]:.1f}페이지/분), "
+                                               f"최고 수준으로 복귀", metrics)
+            return
+
+        # 유지 단계
+        if not cpu_room and self.target > self.min_workers and self._windows_since_change >= 2:
+            self._set_target(self.target - 1, f"CPU 포화 {cpu * 100:.0f}%", metrics)
+        elif self._windows_since_change >= self.probe_windows and cpu_room and memory_room \
+                and self.target < self.max_workers:
+            self.phase = PHASE_WARMUP
+            self.best = (self.target, throughput)
+            self._set_target(self.target + 1, "주기적 재확인", metrics)
+
+    def _measure(self, window_start, pages):
+        """측정 구간 지표"""
+        elapsed = time.monotonic() - window_start
+        rss, browsers = self.browser_rss_mb()
+        _, available = browser_processes.system_memory_mb()
+        return {
+            'workers': self.target,
+            'pages': pages,
+            'seconds': round(elapsed, 1),
+            'pages_per_minute': pages / elapsed * 60 if elapsed > 0 else 0.0,
+            'rss_mb': rss,
+            'browsers': browsers,
+            'cpu': self.cpu.utilization(),
+            'available_mb': available,
+        }
+
+    def _work(self, index, urls, results, state):
+        """작업 스레드 (index < target일 때만 실행, 아니면 브라우저를 종료하고 대기)"""
+        crawler = None
+        try:
+            while True:
+                with self.condition:
+                    while index >= self.target and not state['done']:
+                        if crawler is not None:
+                            break
+                        self.condition.wait()
+                    if state['done']:
+                        return
+                    parked = index >= self.target
+                if parked:
+                    # 동시 실행 수가 줄었으므로 브라우저 종료 후 대기
+                    self.crawlers.pop(index, None)
+                    crawler.close()
+                    crawler = None
+                    continue
+
+                try:
+                    position, url = urls.get_nowait()
+                except queue.Empty:
+                    return
+
+                try:
+                    if crawler is None:
+                        crawler = self.crawler_factory()
+                        self.crawlers[index] = crawler
+                    # crawl_page는 실패 시 예외를 전달 (스케줄러가 오류로 기록하도록)
+                    if self.scheduler is not None:
+                        with self.scheduler.slot(url):
+                            results[position] = crawler.crawl_page(url)
+                    else:
+                        results[position] = crawler.crawl_page(url)
+                except Exception as e:
+                    print(f"   ❌ 실패 ({url}): {str(e)}")
+                finally:
+                    with self.condition:
+                        self.completed.append(time.monotonic())
+                        self.condition.notify_all()
+        finally:
+            if crawler is not None:
+                self.crawlers.pop(index, None)
+                crawler.close()
+
+    def run(self, urls):
+        """
+        URL 목록을 자동 조절되는 동시 실행 수로 크롤링
+        Args:
+            urls (list): URL 목록
+        Returns:
+            list: 모든 페이지의 결과 딕셔너리 리스트 (URL 목록 순서)
+        """
+        url_queue = queue.Queue()
+        for position, url in enumerate(urls):
+            url_queue.put((position, url))
+        results = {}
+        state = {'done': False}
+
+        threads = [
+            threading.Thread(target=self._work, args=(index, url_queue, results, state),
+                             name=f"autotune-worker-{index}", daemon=True)
+            for index in range(self.max_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        print(f"🎛️  자동 조절 시작: {self.min_workers}~{self.max_workers}개"
+              f"{f', 메모리 한도 {self.memory_ceiling_mb:.0f}MB' if self.memory_ceiling_mb else ''}")
+        window_start = time.monotonic()
+        window_pages = 0
+        finished = 0
+        try:
+            while finished < len(urls) and any(thread.is_alive() for thread in threads):
+                with self.condition:
+                    self.condition.wait(timeout=1.0)
+                    while self.completed:
+                        self.completed.popleft()
+                        window_pages += 1
+                        finished += 1
+
+                # 구간 길이가 지나고 현재 동시 실행 수만큼은 페이지가 끝났을 때 평가
+                if time.monotonic() - window_start >= self.window_seconds and window_pages >= self.target:
+                    metrics = self._measure(window_start, window_pages)
+                    self.windows.append(metrics)
+                    cpu = f"{metrics['cpu'] * 100:.0f}%" if metrics['cpu'] is not None else "N/A"
+                    print(f"   📏 동시 {metrics['workers']}개: {metrics['pages_per_minute']:.1f}페이지/분, "
+                          f"브라우저 {metrics['browsers']}개 {metrics['rss_mb']:.0f}MB, CPU {cpu}")
+                    self.evaluate(metrics)
+                    window_start = time.monotonic()
+                    window_pages = 0
+        finally:
+            with self.condition:
+                state['done'] = True
+                self.condition.notify_all()
+            for thread in threads:
+                thread.join()
+
+        rows = []
+        for position in range(len(urls)):
+            rows.extend(results.get(position) or [])
+        return rows
+
+
+def main():
+    """
+    URL 목록 파일을 자동 조절로 병렬 크롤링
+    사용법: python autotune.py [URL 목록 파일] [최대 동시 실행 수] [메모리 한도(MB)]
+    """
+    from excel_export import write_csv_streaming
+
+    path = sys.argv[1] if len(sys.argv) > 1 else 'urls.txt'
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    memory_ceiling_mb = float(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    with open(path, encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    tuner = ConcurrencyAutotuner(max_workers=max_workers, memory_ceiling_mb=memory_ceiling_mb)
+    rows = tuner.run(urls)
+    if rows:
+        from component_crawler import ComponentCrawler
+        filename = ComponentCrawler().save_to_excel(rows, urls[0])
+        log_file = f"{filename.rsplit('.', 1)[0]}_autotune.csv"
+        write_csv_streaming(tuner.windows, log_file)
+        print(f"🎛️  측정 기록 저장: {log_file}")
+
+
+if __name__ == "__main__":
+    main()
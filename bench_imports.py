@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+import 시간 벤치마크
+각 모듈을 새 인터프리터에서 import하여 시간을 재고, 무거운 패키지(selenium, pandas 등)가
+함께 로드되지 않는지 확인 (기준을 넘으면 종료 코드 1)
+
+사용법: python bench_imports.py [기준 시간(ms)] [반복 횟수]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+# 브라우저 없이 사용하는 경로에서 로드되면 안 되는 패키지
+HEAVY_PACKAGES = ('selenium', 'webdriver_manager', 'pandas', 'numpy', 'openpyxl', 'streamlit')
+
+# 가볍게 import되어야 하는 모듈
+LIGHT_MODULES = (
+    'component_core',
+    'component_patterns',
+    'component_crawler',
+    'component_index',
+    'dom_archive',
+    'offline_extract',
+    'excel_export',
+    'fetch_cache',
+    'browser_processes',
+    'crawl_scheduler',
+    'crawl_policy',
+    'component_stats',
+    'template_sampler',
+    'crawl_service',
+    'url_frontier',
+    'browser_profiles',
+    'crawl_pipeline',
+    'autotune',
+)
+
+DEFAULT_BUDGET_MS = 150
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{'ms': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure(module, repeat=3):
+    """
+    새 인터프리터에서 모듈 import 시간 측정
+    Args:
+        module (str): 모듈 이름
+        repeat (int): 반복 횟수 (가장 빠른 값 사용)
+    Returns:
+        dict: {'ms': import 시간(ms), 'heavy': 함께 로드된 무거운 패키지 목록}
+    """
+    script = MEASURE_SCRIPT.format(module=module, heavy=HEAVY_PACKAGES)
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=here, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['ms'] < best['ms']:
+            best = result
+    return best
+
+
+def main():
+    """벤치마크 실행"""
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    print(f"⏱️  import 시간 (기준 {budget:.0f}ms, {repeat}회 중 최소)")
+    failed = False
+    for module in LIGHT_MODULES:
+        result = measure(module, repeat)
+        problems = []
+        if result['ms'] > budget:
+            problems.append("기준 초과")
+        if result['heavy']:
+            problems.append(f"무거운 패키지 로드: {', '.join(result['heavy'])}")
+        mark = "❌" if problems else "✅"
+        print(f"   {mark} {module:<20} {result['ms']:7.1f}ms {' / '.join(problems)}")
+        failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+브라우저 프로세스 관리
+ChromeDriver와 그 하위 Chrome 프로세스의 목록, 메모리(RSS) 확인, 남은 프로세스 정리
+psutil이 있으면 사용하고, 없으면 Linux /proc을 직접 읽음
+"""
+
+import os
+import signal
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROC_DIR = '/proc'
+
+
+def _proc_parent_map():
+    """/proc에서 pid -> 부모 pid 맵 생성 (Linux)"""
+    parents = {}
+    for name in os.listdir(PROC_DIR):
+        if not name.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC_DIR, name, 'stat'), 'rb') as f:
+                stat = f.read().decode('utf-8', errors='replace')
+        except OSError:
+            continue
+        # 프로세스 이름에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤부터 분리
+        fields = stat[stat.rfind(')') + 2:].split()
+        if len(fields) > 1:
+            parents[int(name)] = int(fields[1])
+    return parents
+
+
+def available():
+    """프로세스 정보를 읽을 수 있는 환경인지 여부"""
+    return psutil is not None or os.path.isdir(PROC_DIR)
+
+
+def process_tree(pid):
+    """
+    프로세스와 모든 하위 프로세스 pid 목록
+    Args:
+        pid (int): 루트 프로세스 pid (예: ChromeDriver)
+    Returns:
+        set: pid 집합 (확인할 수 없으면 빈 집합)
+    """
+    if not pid:
+        return set()
+
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            return {pid} | {child.pid for child in root.children(recursive=True)}
+        except psutil.Error:
+            return set()
+
+    if not os.path.isdir(PROC_DIR):
+        return set()
+
+    children = {}
+    for child, parent in _proc_parent_map().items():
+        children.setdefault(parent, []).append(child)
+
+    tree = set()
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        if current in tree:
+            continue
+        tree.add(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def rss_mb(pids):
+    """
+    프로세스들의 메모리 사용량(RSS) 합계
+    Args:
+        pids (iterable): pid 목록
+    Returns:
+        float: RSS 합계 (MB), 확인할 수 없으면 None
+    """
+    if not available():
+        return None
+
+    total = 0
+    for pid in pids:
+        try:
+            if psutil is not None:
+                total += psutil.Process(pid).memory_info().rss
+            else:
+                with open(os.path.join(PROC_DIR, str(pid), 'statm')) as f:
+                    total += int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except Exception:
+            # 이미 종료된 프로세스
+            continue
+    return total / (1024 * 1024)
+
+
+def alive(pid):
+    """프로세스가 살아 있는지 여부 (좀비 제외)"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    try:
+        with open(os.path.join(PROC_DIR, str(pid), 'stat'), 'rb') as f:
+            stat = f.read().decode('utf-8', errors='replace')
+        return stat[stat.rfind(')') + 2:].split()[0] != 'Z'
+    except OSError:
+        return True
+
+
+def is_browser_process(pid):
+    """Chrome/Chromium/ChromeDriver 프로세스인지 여부 (pid 재사용 시 다른 프로세스를 종료하지 않도록 확인)"""
+    try:
+        if psutil is not None:
+            command = ' '.join(psutil.Process(pid).cmdline())
+        else:
+            with open(os.path.join(PROC_DIR, str(pid), 'cmdline'), 'rb') as f:
+                command = f.read().decode('utf-8', errors='replace')
+    except Exception:
+        return False
+    return 'chrom' in command.lower()
+
+
+def kill_processes(pids):
+    """
+    남아 있는 브라우저 프로세스 강제 종료
+    Args:
+        pids (iterable): pid 목록
+    Returns:
+        int: 종료한 프로세스 수
+    """
+    killed = 0
+    for pid in pids:
+        if pid == os.getpid() or not alive(pid) or not is_browser_process(pid):
+            continue
+        try:
+            os.kill(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            killed += 1
+        except OSError:
+            continue
+    return killed
+
+
+def system_memory_mb():
+    """
+    시스템 메모리
+    Returns:
+        tuple: (전체 MB, 사용 가능 MB), 확인할 수 없으면 (None, None)
+    """
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        return memory.total / (1024 * 1024), memory.available / (1024 * 1024)
+    try:
+        values = {}
+        with open(os.path.join(PROC_DIR, 'meminfo')) as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                values[key] = int(rest.split()[0]) / 1024
+        return values['MemTotal'], values.get('MemAvailable', values.get('MemFree'))
+    except (OSError, KeyError, ValueError, IndexError):
+        return None, None
+
+
+class CpuSampler:
+    """
+    시스템 CPU 사용률 측정 (이전 호출 이후 구간의 평균)
+    psutil이 있으면 사용하고, 없으면 /proc/stat, 그것도 없으면 load average / 코어 수
+    """
+
+    def __init__(self):
+        self.last = self._proc_times()
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+
+    @staticmethod
+    def _proc_times():
+        try:
+            with open(os.path.join(PROC_DIR, 'stat')) as f:
+                fields = [int(value) for value in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        return sum(fields), idle
+
+    def utilization(self):
+        """
+        CPU 사용률
+        Returns:
+            float: 0.0 ~ 1.0, 확인할 수 없으면 None
+        """
+        if psutil is not None:
+            return psutil.cpu_percent(interval=None) / 100
+        current = self._proc_times()
+        if current is not None and self.last is not None:
+            total, idle = current[0] - self.last[0], current[1] - self.last[1]
+            self.last = current
+            if total > 0:
+                return 1 - idle / total
+        if hasattr(os, 'getloadavg'):
+            return min(1.0, os.getloadavg()[0] / (os.cpu_count() or 1))
+        return None
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+사이트별 브라우저 프로필 관리
+사이트(호스트)마다 기준(master) 프로필을 두고, 드라이버를 시작할 때마다 복제본(clone)을 만들어 사용
+복제본에는 디스크 캐시(CSS/JS 번들)와 쿠키(쿠키 동의, 지역 선택)가 남아 있어 다음 크롤링의 첫 페이지 로드가 빨라지고,
+작업자마다 별도 복제본을 쓰므로 동시에 실행해도 프로필이 손상되지 않음
+
+디렉토리 구조:
+    <root>/<사이트>/versions/<버전>/   기준 프로필 (읽기 전용으로 사용)
+    <root>/<사이트>/CURRENT             현재 기준 프로필 버전 (원자적으로 교체)
+    <root>/<사이트>/clones/<ID>/        드라이버별 복제본 (종료 시 삭제)
+"""
+
+import os
+import shutil
+import time
+import uuid
+from urllib.parse import urlparse
+
+import browser_processes
+
+# 복제하지 않을 파일 (실행 중인 Chrome의 잠금/충돌 보고 파일 등)
+IGNORED_PROFILE_FILES = (
+    'Singleton*', 'lockfile', 'LOCK', '*.lock', 'DevToolsActivePort',
+    'Crashpad', 'Crash Reports', 'BrowserMetrics*', 'ShaderCache', 'GrShaderCache', 'GraphiteDawnCache',
+)
+
+CACHE_DIR_NAME = 'DiskCache'
+
+
+class BrowserProfile:
+    """드라이버 하나가 사용하는 프로필 복제본"""
+
+    def __init__(self, site, path, version):
+        self.site = site
+        self.path = path
+        self.version = version  # 복제한 기준 프로필 버전 (없으면 None)
+        self.healthy = True     # 브라우저 크래시가 있었으면 False (기준 프로필로 승격하지 않음)
+
+    @property
+    def cache_dir(self):
+        return os.path.join(self.path, CACHE_DIR_NAME)
+
+    def chrome_arguments(self, cache_size_mb=None):
+        """Chrome 실행 인자 (--user-data-dir, --disk-cache-dir)"""
+        arguments = [f'--user-data-dir={self.path}', f'--disk-cache-dir={self.cache_dir}']
+        if cache_size_mb:
+            arguments.append(f'--disk-cache-size={int(cache_size_mb * 1024 * 1024)}')
+        return arguments
+
+
+class BrowserProfileManager:
+    """
+    사이트별 재사용 프로필 관리
+
+    - checkout(url): 사이트의 현재 기준 프로필을 복제하여 새 BrowserProfile 반환 (없으면 빈 프로필)
+    - release(profile): 복제본 삭제. 기준 프로필이 없거나 refresh_seconds보다 오래되었으면
+                        정상 종료된 복제본을 새 버전으로 승격 (CURRENT 파일을 원자적으로 교체)
+    """
+
+    def __init__(self, root='browser_profiles', refresh_seconds=24 * 3600, cache_size_mb=None,
+                 keep_versions=2, lock_timeout=600):
+        """
+        초기화
+        Args:
+            root (str): 프로필 저장 디렉토리
+            refresh_seconds (float): 기준 프로필을 새 복제본으로 갱신하는 주기 (초)
+            cache_size_mb (float): Chrome 디스크 캐시 최대 크기 (MB, None이면 Chrome 기본값)
+            keep_versions (int): 남겨 둘 기준 프로필 버전 수 (복제 중인 작업자를 위해 2 이상 권장)
+            lock_timeout (float): 승격 잠금 파일이 이 시간(초)보다 오래되면 비정상 종료로 보고 삭제
+        """
+        # Chrome에 넘기는 경로는 작업 디렉토리와 무관하도록 절대 경로로 사용
+        self.root = os.path.abspath(root)
+        self.refresh_seconds = refresh_seconds
+        self.cache_size_mb = cache_size_mb
+        self.keep_versions = max(1, keep_versions)
+        self.lock_timeout = lock_timeout
+        # 크래시/강제 종료로 남은 복제본 정리 (프로필 전체와 디스크 캐시 사본이 계속 쌓이지 않도록)
+        removed = self.cleanup_clones()
+        if removed:
+            print(f"   🗂️  남은 프로필 복제본 {removed}개 정리")
+
+    @staticmethod
+    def site_key(url):
+        """프로필을 공유할 사이트 키 (호스트, 'www.' 제외)"""
+        host = (urlparse(url).hostname or 'default').lower()
+        return host[4:] if host.startswith('www.') else host
+
+    def _site_dir(self, site):
+        return os.path.join(self.root, site)
+
+    def current_version(self, site):
+        """현재 기준 프로필 버전 (없으면 None)"""
+        try:
+            with open(os.path.join(self._site_dir(site), 'CURRENT'), encoding='utf-8') as f:
+                version = f.read().strip()
+        except OSError:
+            return None
+        if version and os.path.isdir(os.path.join(self._site_dir(site), 'versions', version)):
+            return version
+        return None
+
+    def checkout(self, url):
+        """
+        드라이버 시작용 프로필 복제본 생성
+        Args:
+            url (str): 크롤링할 URL (사이트 판별용)
+        Returns:
+            BrowserProfile: 복제본
+        """
+        site = self.site_key(url)
+        clone_path = os.path.join(self._site_dir(site), 'clones', f"{os.getpid()}-{uuid.uuid4().hex[:8]}")
+        version = self.current_version(site)
+
+        if version:
+            source = os.path.join(self._site_dir(site), 'versions', version)
+            try:
+                start = time.perf_counter()
+                shutil.copytree(source, clone_path, ignore=shutil.ignore_patterns(*IGNORED_PROFILE_FILES),
+                                ignore_dangling_symlinks=True)
+                print(f"   🗂️  프로필 복제 ({site} v{version}, {time.perf_counter() - start:.2f}초)")
+            except (OSError, shutil.Error) as e:
+                # 복제 중 이전 버전이 정리된 경우 등: 빈 프로필로 시작
+                print(f"   ⚠️  프로필 복제 실패 - 빈 프로필 사용: {str(e)}")
+                shutil.rmtree(clone_path, ignore_errors=True)
+                version = None
+
+        os.makedirs(clone_path, exist_ok=True)
+        return BrowserProfile(site, clone_path, version)
+
+    def _version_age(self, site, version):
+        try:
+            return time.time() - os.path.getmtime(os.path.join(self._site_dir(site), 'versions', version))
+        except OSError:
+            return None
+
+    def should_promote(self, profile):
+        """복제본을 새 기준 프로필로 승격할지 여부"""
+        if not profile.healthy:
+            return False
+        current = self.current_version(profile.site)
+        if current is None:
+            return True
+        age = self._version_age(profile.site, current)
+        return age is not None and age >= self.refresh_seconds
+
+    def release(self, profile, promote=True):
+        """
+        브라우저 종료 후 복제본 정리 (필요하면 기준 프로필로 승격)
+        Args:
+            profile (BrowserProfile): 복제본
+            promote (bool): 승격 허용 여부 (페이지를 하나도 열지 않았으면 False)
+        """
+        try:
+            if promote and self.should_promote(profile):
+                self._promote(profile)
+        finally:
+            shutil.rmtree(profile.path, ignore_errors=True)
+
+    def _acquire_lock(self, site):
+        """승격 잠금 (다른 작업자가 승격 중이면 None)"""
+        lock_path = os.path.join(self._site_dir(site), 'promote.lock')
+        try:
+            if time.time() - os.path.getmtime(lock_path) > self.lock_timeout:
+                os.remove(lock_path)
+        except OSError:
+            pass
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None
+        os.close(fd)
+        return lock_path
+
+    def _promote(self, profile):
+        """복제본을 새 버전으로 복사하고 CURRENT를 원자적으로 교체"""
+        site_dir = self._site_dir(profile.site)
+        lock_path = self._acquire_lock(profile.site)
+        if lock_path is None:
+            return
+        try:
+            # 다른 작업자가 먼저 승격했을 수 있으므로 잠금 후 다시 확인
+            if not self.should_promote(profile):
+                return
+            version = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:6]}"
+            target = os.path.join(site_dir, 'versions', version)
+            staging = f"{target}.tmp"
+            shutil.copytree(profile.path, staging, ignore=shutil.ignore_patterns(*IGNORED_PROFILE_FILES),
+                            ignore_dangling_symlinks=True)
+            os.replace(staging, target)
+
+            pointer = os.path.join(site_dir, f'CURRENT.{uuid.uuid4().hex[:6]}.tmp')
+            with open(pointer, 'w', encoding='utf-8') as f:
+                f.write(version)
+            os.replace(pointer, os.path.join(site_dir, 'CURRENT'))
+            print(f"   🗂️  기준 프로필 갱신: {profile.site} v{version}")
+            self._prune_versions(profile.site, keep=version)
+        except (OSError, shutil.Error) as e:
+            print(f"   ⚠️  프로필 승격 실패: {str(e)}")
+        finally:
+            try:
+                os.remove(lock_path)
+            except OSError:
+                pass
+
+    def _prune_versions(self, site, keep):
+        """오래된 기준 프로필 버전 삭제 (최근 keep_versions개 유지)"""
+        versions_dir = os.path.join(self._site_dir(site), 'versions')
+        versions = sorted(name for name in os.listdir(versions_dir) if not name.endswith('.tmp'))
+        for name in versions[:max(0, len(versions) - self.keep_versions)]:
+            if name != keep:
+                shutil.rmtree(os.path.join(versions_dir, name), ignore_errors=True)
+
+    def cleanup_clones(self, max_age=6 * 3600):
+        """
+        비정상 종료로 남은 복제본 정리
+        복제본 이름의 프로세스 ID(<PID>-<ID>)로 만든 프로세스가 이미 종료된 복제본은 바로 삭제하고,
+        이름에서 프로세스 ID를 알 수 없으면 max_age보다 오래된 복제본을 삭제합니다.
+        Args:
+            max_age (float): 프로세스 ID가 없는 복제본을 삭제할 기준 시간 (초)
+        Returns:
+            int: 삭제한 복제본 수
+        """
+        removed = 0
+        if not os.path.isdir(self.root):
+            return removed
+        for site in os.listdir(self.root):
+            clones_dir = os.path.join(self.root, site, 'clones')
+            if not os.path.isdir(clones_dir):
+                continue
+            for name in os.listdir(clones_dir):
+                path = os.path.join(clones_dir, name)
+                owner = name.split('-', 1)[0]
+                try:
+                    if owner.isdigit():
+                        pid = int(owner)
+                        stale = pid != os.getpid() and not browser_processes.alive(pid)
+                    else:
+                        stale = time.time() - os.path.getmtime(path) > max_age
+                except OSError:
+                    continue
+                if stale:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+        return removed
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+컴포넌트 분류 핵심 로직
+브라우저 없이 사용할 수 있는 추출/분류 기능 (selenium, pandas 등 무거운 패키지를 import하지 않음)
+"""
+
+from urllib.parse import urlparse
+from component_patterns import SAMSUNG_RULES, default_engine
+
+# 결과 행 기본 컬럼 (뷰포트를 여러 개 쓰면 뒤에 'Display (<이름>)' 컬럼 추가)
+RESULT_COLUMNS = ('번호', 'Site Code', 'Page Type', 'URL', '컴포넌트명', '전체 클래스 목록', 'Display')
+
+
+def result_columns(viewport_names=()):
+    """
+    결과 행 컬럼 목록
+    Args:
+        viewport_names (list): 뷰포트 이름 목록 (2개 이상일 때만 뷰포트별 Display 컬럼 추가)
+    Returns:
+        list: 컬럼 이름 리스트
+    """
+    columns = list(RESULT_COLUMNS)
+    if len(viewport_names) > 1:
+        columns.extend(f"Display ({name})" for name in viewport_names)
+    return columns
+
+
+class ComponentClassifier:
+    """class 문자열에서 컴포넌트를 추출하고 페이지별 결과 행을 만드는 분류기"""
+    
+    def __init__(self, pattern_engine=None):
+        """
+        초기화
+        Args:
+            pattern_engine (PatternEngine): 사이트별 컴포넌트 네이밍 규칙 (None이면 Samsung 규칙)
+        """
+        self.pattern_engine = pattern_engine or default_engine()
+    
+    def extract_component_name(self, class_string, site=None):
+        """
+        class 문자열에서 주요 컴포넌트 이름 추출
+        Samsung 컴포넌트 네이밍 규칙: AA##- 또는 AAA##- 패턴
+        예: hd08-hero-kv-home, co76-feature-kv, co78-recommended-product-carousel
+        
+        Args:
+            class_string (str): class 속성 문자열
+            site (str): URL 또는 호스트명 (사이트별 규칙 적용, None이면 공통 규칙)
+        Returns:
+            str: 주요 컴포넌트 클래스명 (패턴에 맞지 않으면 None)
+        """
+        matched = self.pattern_engine.matcher(site).match(class_string)
+        return matched[0] if matched else None
+    
+    def extract_bem_component(self, class_name, site=None):
+        """
+        BEM 패턴에서 컴포넌트명 추출
+        예: nv16-country-selector__content-wrap -> nv16-country-selector
+        
+        Args:
+            class_name (str): 클래스명
+            site (str): URL 또는 호스트명 (사이트별 규칙 적용, None이면 공통 규칙)
+        Returns:
+            str: 컴포넌트명 (BEM의 Block 부분)
+        """
+        matched = self.pattern_engine.matcher(site).match(class_name)
+        if matched and matched[0] == class_name:
+            return matched[1].block(class_name)
+        return SAMSUNG_RULES.block(class_name)
+    
+    def extract_site_code(self, url):
+        """
+        URL에서 Site Code 추출
+        예: https://www.samsung.com/uk/ -> UK
+        
+        Args:
+            url (str): URL
+        Returns:
+            str: Site Code (대문자)
+        """
+        try:
+            parsed = urlparse(url)
+            path_parts = [p for p in parsed.path.split('/') if p]
+            if path_parts:
+                return path_parts[0].upper()
+            return "GLOBAL"
+        except:
+            return "UNKNOWN"
+    
+    def collect_components(self, div_records, site=None, matcher=None):
+        """
+        div 정보를 컴포넌트별로 집계
+        Args:
+            div_records (iterable): (class 속성 문자열, 표시 여부) 튜플
+            site (str): URL 또는 호스트명 (사이트별 규칙 적용)
+            matcher (CompiledMatcher): 사용할 매처 (None이면 사이트 규칙의 매처)
+        Returns:
+            tuple: (컴포넌트명별 집계 딕셔너리, 패턴에 맞는 클래스 개수)
+        """
+        # 컴포넌트별로 데이터를 수집하기 위한 딕셔너리
+        components_data = {}
+        processed_classes = set()  # 중복 제거를 위한 세트 (클래스명 기준)
+        matched_count = 0  # 패턴에 맞는 클래스 개수
+        # 활성 규칙 전체를 하나로 컴파일한 매처 (class 문자열당 한 번만 스캔)
+        matcher = matcher or self.pattern_engine.matcher(site)
+        
+        for class_attr, is_displayed in div_records:
+            if not class_attr or not class_attr.strip():
+                continue
+            
+            component_class, component_name = matcher.classify(class_attr)
+            
+            # 컴포넌트 패턴에 맞는 것만 추출
+            if not component_class:
+                continue
+            
+            matched_count += 1
+            # 중복 체크 (클래스명 기준)
+            if component_class in processed_classes:
+                continue
+            
+            processed_classes.add(component_class)
+            
+            # 컴포넌트별로 데이터 그룹화
+            if component_name not in components_data:
+                components_data[component_name] = {
+                    'classes': [],
+                    'display_y': 0,
+                    'display_n': 0,
+                    'all_classes': set()
+                }
+            
+            data = components_data[component_name]
+            data['classes'].append(component_class)
+            
+            if is_displayed:
+                data['display_y'] += 1
+            else:
+                data['display_n'] += 1
+            
+            # 전체 클래스 목록 수집
+            data['all_classes'].update(class_attr.split())
+        
+        return components_data, matched_count
+    
+    def build_results(self, components_data, site_code, page_type, url):
+        """
+        컴포넌트 집계를 결과 행 리스트로 변환
+        Args:
+            components_data (dict): collect_components 결과
+            site_code (str): Site Code
+            page_type (str): Page Type
+            url (str): URL
+        Returns:
+            list: 결과 딕셔너리 리스트 (코드 내 순서대로)
+        """
+        results = []
+        for idx, (component_name, data) in enumerate(components_data.items(), 1):
+            results.append({
+                '번호': idx,
+                'Site Code': site_code,
+                'Page Type': page_type,
+                'URL': url,
+                '컴포넌트명': component_name,
+                '전체 클래스 목록': ', '.join(data['classes']),
+                'Display': f"Y:{data['display_y']} / N:{data['display_n']}"
+            })
+        return results
+    
+    def build_viewport_results(self, viewport_components, site_code, page_type, url):
+        """
+        뷰포트별 컴포넌트 집계를 결과 행 리스트로 변환
+        첫 번째 뷰포트가 기준이며 'Display' 컬럼은 기준 뷰포트 값, 뷰포트별 값은 'Display (<이름>)' 컬럼에 기록합니다.
+        다른 뷰포트에만 있는 컴포넌트는 뒤에 추가됩니다 (기준 뷰포트 Display는 Y:0 / N:0).
+        
+        Args:
+            viewport_components (list): (뷰포트 이름, collect_components 결과) 리스트
+            site_code (str): Site Code
+            page_type (str): Page Type
+            url (str): URL
+        Returns:
+            list: 결과 딕셔너리 리스트
+        """
+        merged = dict(viewport_components[0][1])
+        for _, components_data in viewport_components[1:]:
+            for component_name, data in components_data.items():
+                if component_name not in merged:
+                    merged[component_name] = dict(data, display_y=0, display_n=0)
+        
+        results = self.build_results(merged, site_code, page_type, url)
+        for row in results:
+            for name, components_data in viewport_components:
+                data = components_data.get(row['컴포넌트명'])
+                display = f"Y:{data['display_y']} / N:{data['display_n']}" if data else "Y:0 / N:0"
+                row[f"Display ({name})"] = display
+        return results
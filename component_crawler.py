@@ -4,34 +4,146 @@
 특정 URL의 div class 명을 추출하여 엑셀 파일로 저장하는 프로그램
 """
 
-import re
 import os
+import re
 from datetime import datetime
 from urllib.parse import urlparse
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import browser_processes
+from component_core import ComponentClassifier, result_columns
+from component_patterns import CompiledMatcher, RuleSet
+from url_frontier import same_site
+from excel_export import (
+    measure_export, format_export_stats, write_excel_streaming, write_csv_streaming
+)
+
+# 모든 div의 class 속성과 계산된 display 값을 수집하는 스크립트
+# arguments[0]이 true이면 display 값을 data-cc-display 속성으로 기록한 DOM(outerHTML)도 반환
+# arguments[1]이 true이면 a[href]의 절대 URL 목록도 함께 반환
+DIV_SNAPSHOT_SCRIPT = """
+    var stamp = arguments[0];
+    var harvest = arguments[1];
+    var divs = document.getElementsByTagName('div');
+    var records = new Array(divs.length);
+    for (var i = 0; i < divs.length; i++) {
+        var display = window.getComputedStyle(divs[i]).display;
+        records[i] = [divs[i].getAttribute('class') || '', display];
+        if (stamp) {
+            divs[i].setAttribute('data-cc-display', display);
+        }
+    }
+    var links = null;
+    if (harvest) {
+        var anchors = document.querySelectorAll('a[href]');
+        links = new Array(anchors.length);
+        for (var j = 0; j < anchors.length; j++) {
+            links[j] = anchors[j].href;
+        }
+    }
+    return {divs: records, html: stamp ? document.documentElement.outerHTML : null, links: links};
+"""
 
+# 지정한 접두사의 컴포넌트 div만 속성 선택자로 찾는 비동기 스크립트 (감사 모드)
+# 모든 접두사를 찾거나, 로딩이 끝나고(readyState complete) 요소 수가 두 번 연속 그대로이거나,
+# 제한 시간(arguments[1]초)이 지나면 일치한 div의 class와 display 값만 반환
+AUDIT_SCRIPT = """
+    var prefixes = arguments[0];
+    var budget = arguments[1] * 1000;
+    var done = arguments[arguments.length - 1];
+    var selector = prefixes.map(function (prefix) {
+        return 'div[class^="' + prefix + '"], div[class*=" ' + prefix + '"]';
+    }).join(', ');
+    var start = Date.now();
+    var lastCount = -1;
+    var stablePolls = 0;
+    function scan() {
+        var nodes = document.querySelectorAll(selector);
+        var found = {};
+        for (var i = 0; i < nodes.length; i++) {
+            var cls = ' ' + (nodes[i].getAttribute('class') || '');
+            for (var j = 0; j < prefixes.length; j++) {
+                if (cls.indexOf(' ' + prefixes[j]) >= 0) {
+                    found[prefixes[j]] = true;
+                }
+            }
+        }
+        var complete = prefixes.every(function (prefix) { return found[prefix]; });
+        // 접두사가 없는 페이지는 DOM이 더 바뀌지 않으면 제한 시간까지 기다리지 않음
+        var count = document.getElementsByTagName('*').length;
+        stablePolls = (document.readyState === 'complete' && count === lastCount) ? stablePolls + 1 : 0;
+        lastCount = count;
+        var settled = stablePolls >= 2;
+        if (!complete && !settled && Date.now() - start < budget) {
+            setTimeout(scan, 250);
+            return;
+        }
+        var records = new Array(nodes.length);
+        for (var k = 0; k < nodes.length; k++) {
+            records[k] = [nodes[k].getAttribute('class') || '', window.getComputedStyle(nodes[k]).display];
+        }
+        done({divs: records, found: Object.keys(found), settled: settled, elapsed: Date.now() - start});
+    }
+    scan();
+"""
 
-class ComponentCrawler:
-    """웹사이트 컴포넌트 크롤러 클래스"""
+# 감사 모드 접두사 형식 (선택자에 그대로 들어가므로 영문/숫자/_/-만 허용)
+AUDIT_PREFIX_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# 기본 뷰포트 (이름, 너비, 높이) - 첫 번째가 페이지를 로드하는 기준 뷰포트
+DEFAULT_VIEWPORTS = (('desktop', 1920, 1080), ('mobile', 390, 844))
+
+# 이 너비보다 좁은 뷰포트는 모바일(터치, viewport meta 적용)로 에뮬레이션
+MOBILE_MAX_WIDTH = 767
+
+
+class ComponentCrawler(ComponentClassifier):
+    """
+    웹사이트 컴포넌트 크롤러 클래스
+    selenium/webdriver_manager는 브라우저를 실제로 사용할 때만 import합니다.
+    """
     
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, page_cache=None, dom_archive=None, pattern_engine=None,
+                 max_pages_per_driver=None, max_driver_rss_mb=None, viewports=None, viewport_settle=1.0,
+                 profile_manager=None):
         """
         초기화
         Args:
             headless (bool): 브라우저를 보이지 않게 실행할지 여부
+            page_cache (PageCache): 변경 여부 사전 확인용 캐시 (None이면 항상 렌더링)
+            dom_archive (DomArchive): 렌더링된 DOM 저장소 (None이면 저장하지 않음)
+            pattern_engine (PatternEngine): 사이트별 컴포넌트 네이밍 규칙 (None이면 Samsung 규칙)
+            max_pages_per_driver (int): 이 페이지 수를 처리하면 드라이버 재시작 (None이면 제한 없음)
+            max_driver_rss_mb (float): 브라우저 프로세스 메모리 합계가 이 값(MB)을 넘으면 드라이버 재시작
+            viewports (list): (이름, 너비, 높이) 리스트. 지정하면 페이지를 한 번만 로드하고
+                              뷰포트를 바꿔 가며 Display 상태를 추출 (예: DEFAULT_VIEWPORTS)
+            viewport_settle (float): 뷰포트 변경 후 레이아웃 반영 대기 시간 (초)
+            profile_manager (BrowserProfileManager): 사이트별 재사용 프로필 (None이면 매번 빈 프로필)
         """
+        super().__init__(pattern_engine)
         self.headless = headless
         self.driver = None
+        self.page_cache = page_cache
+        self.dom_archive = dom_archive
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_driver_rss_mb = max_driver_rss_mb
+        self.pages_on_driver = 0
+        self.driver_pids = set()  # ChromeDriver와 하위 Chrome 프로세스 (종료 시 정리용)
+        self.last_links = []  # 마지막 페이지에서 수집한 같은 사이트 링크 (harvest_links 사용 시)
+        self.viewports = list(viewports) if viewports else None
+        self.viewport_settle = viewport_settle
+        self.profile_manager = profile_manager
+        self.profile = None  # 현재 드라이버가 사용하는 프로필 복제본
+        
+    def setup_driver(self, url=None):
+        """
+        Chrome 드라이버 설정
+        Args:
+            url (str): 처음 열 URL (profile_manager 사용 시 사이트별 프로필 선택용)
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from webdriver_manager.chrome import ChromeDriverManager
         
-    def setup_driver(self):
-        """Chrome 드라이버 설정"""
         chrome_options = Options()
         
         # 헤드리스 모드 설정 (사용자 선택 반영)
@@ -49,7 +161,15 @@ class ComponentCrawler:
         
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--window-size=1920,1080')
+        width, height = self.viewports[0][1:] if self.viewports else (1920, 1080)
+        chrome_options.add_argument(f'--window-size={width},{height}')
+        
+        # 사이트별 프로필 복제본 (디스크 캐시, 쿠키 재사용)
+        if self.profile_manager is not None and url:
+            self.profile = self.profile_manager.checkout(url)
+            for argument in self.profile.chrome_arguments(self.profile_manager.cache_size_mb):
+                chrome_options.add_argument(argument)
+        
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         
         # Chrome 바이너리 경로 설정 (클라우드 환경 대응)
@@ -159,76 +279,94 @@ class ComponentCrawler:
         
         self.driver.implicitly_wait(10)
         self.driver.set_page_load_timeout(30)
-        
-    def extract_component_name(self, class_string):
+        self.pages_on_driver = 0
+        self.driver_pids = browser_processes.process_tree(self.driver_process_id())
+    
+    def driver_process_id(self):
+        """ChromeDriver 프로세스 pid (확인할 수 없으면 None)"""
+        try:
+            return self.driver.service.process.pid
+        except AttributeError:
+            return None
+    
+    def driver_rss_mb(self):
         """
-        class 문자열에서 주요 컴포넌트 이름 추출
-        Samsung 컴포넌트 네이밍 규칙: AA##- 또는 AAA##- 패턴
-        예: hd08-hero-kv-home, co76-feature-kv, co78-recommended-product-carousel
-        
-        Args:
-            class_string (str): class 속성 문자열
+        현재 브라우저(ChromeDriver + 하위 Chrome 프로세스) 메모리 사용량
         Returns:
-            str: 주요 컴포넌트 클래스명 (패턴에 맞지 않으면 None)
+            float: RSS 합계 (MB), 확인할 수 없으면 None
         """
-        if not class_string:
+        if not self.driver:
             return None
-        
-        classes = class_string.split()
-        
-        # AA##- 또는 AAA##- 패턴을 따르는 컴포넌트만 찾기
-        # 예: hd08-, co76-, srd19-, nv19-, pd21- 등
-        component_pattern = re.compile(r'^[a-z]{2,3}\d{2}-')
-        
-        for cls in classes:
-            # 패턴 매칭 확인
-            if component_pattern.match(cls):
-                return cls
-        
-        # 패턴에 맞는 컴포넌트가 없으면 None 반환
-        return None
+        # 페이지를 열 때마다 렌더러 프로세스가 바뀌므로 매번 프로세스 목록을 갱신
+        tree = browser_processes.process_tree(self.driver_process_id())
+        self.driver_pids |= tree
+        return browser_processes.rss_mb(tree)
     
-    def extract_bem_component(self, class_name):
+    def recycle_reason(self):
         """
-        BEM 패턴에서 컴포넌트명 추출
-        예: nv16-country-selector__content-wrap -> nv16-country-selector
-        
-        Args:
-            class_name (str): 클래스명
+        드라이버 재시작이 필요한 이유
         Returns:
-            str: 컴포넌트명 (BEM의 Block 부분)
+            str: 재시작 이유 (필요 없으면 None)
         """
-        if not class_name:
-            return class_name
-        
-        # __ 기준으로 분리 (BEM의 Block__Element 패턴)
-        if '__' in class_name:
-            return class_name.split('__')[0]
-        
-        # -- 기준으로 분리 (BEM의 Block--Modifier 패턴)
-        if '--' in class_name:
-            return class_name.split('--')[0]
-        
-        return class_name
+        if not self.driver:
+            return None
+        if self.max_pages_per_driver and self.pages_on_driver >= self.max_pages_per_driver:
+            return f"페이지 {self.pages_on_driver}개 처리"
+        if self.max_driver_rss_mb:
+            rss = self.driver_rss_mb()
+            if rss is not None and rss >= self.max_driver_rss_mb:
+                return f"메모리 {rss:.0f}MB 사용"
+        return None
     
-    def extract_site_code(self, url):
+    def recycle_driver(self, reason):
         """
-        URL에서 Site Code 추출
-        예: https://www.samsung.com/uk/ -> UK
-        
+        드라이버 재시작 (종료만 하고, 다음 페이지에서 새로 설정)
         Args:
-            url (str): URL
+            reason (str): 재시작 이유
+        """
+        print(f"   ♻️  브라우저 재시작 ({reason})")
+        self.quit_driver()
+    
+    def set_viewport(self, width, height):
+        """
+        페이지를 다시 로드하지 않고 뷰포트 변경
+        CDP 기기 에뮬레이션을 우선 사용하고(모바일 너비는 터치/viewport meta 포함), 없으면 창 크기 변경
+        """
+        try:
+            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+                'width': width,
+                'height': height,
+                'deviceScaleFactor': 0,
+                'mobile': width <= MOBILE_MAX_WIDTH,
+            })
+        except Exception:
+            self.driver.set_window_size(width, height)
+    
+    def reset_viewport(self):
+        """기준 뷰포트로 복원"""
+        try:
+            self.driver.execute_cdp_cmd('Emulation.clearDeviceMetricsOverride', {})
+        except Exception:
+            self.driver.set_window_size(*self.viewports[0][1:])
+    
+    def capture_viewports(self):
+        """
+        기준 뷰포트 이외의 뷰포트에서 div 스냅샷 수집 (페이지 재로드 없음)
         Returns:
-            str: Site Code (대문자)
+            list: (뷰포트 이름, div 레코드) 리스트
         """
+        import time
+        
+        viewport_records = []
         try:
-            parsed = urlparse(url)
-            path_parts = [p for p in parsed.path.split('/') if p]
-            if path_parts:
-                return path_parts[0].upper()
-            return "GLOBAL"
-        except:
-            return "UNKNOWN"
+            for name, width, height in self.viewports[1:]:
+                self.set_viewport(width, height)
+                time.sleep(self.viewport_settle)
+                snapshot = self.driver.execute_script(DIV_SNAPSHOT_SCRIPT, False, False)
+                viewport_records.append((name, snapshot['divs']))
+        finally:
+            self.reset_viewport()
+        return viewport_records
     
     def extract_page_type(self):
         """
@@ -265,168 +403,371 @@ class ComponentCrawler:
             print(f"   ⚠️  Page Type 추출 실패: {str(e)}")
             return "Unknown"
     
-    def crawl_divs(self, url):
+    def crawl_page(self, url, harvest_links=False):
         """
-        URL의 div 요소들의 class 추출
+        URL의 div 요소들의 class 추출 (오류 발생 시 예외를 그대로 전달)
+        처리한 페이지 수나 브라우저 메모리가 기준을 넘으면 드라이버를 재시작합니다.
+        
         Args:
             url (str): 크롤링할 URL
+            harvest_links (bool): 같은 추출 과정에서 같은 사이트 링크도 수집하여 self.last_links에 저장
         Returns:
             list: div 정보가 담긴 딕셔너리 리스트
+        Raises:
+            Exception: 드라이버 설정, 페이지 로드, 스크립트 실행 실패
+        """
+        self.last_links = []
+        page = self.fetch_page(url, harvest_links)
+        if page['rows'] is not None:
+            return page['rows']
+        self.extract_snapshot(page)
+        self.last_links = page['links']
+        return self.classify_snapshot(page)
+    
+    def fetch_page(self, url, harvest_links=False, audit_prefixes=None, audit_budget=5.0):
+        """
+        브라우저 단계: 페이지 로드 및 스냅샷 수집 (드라이버 재시작/크래시 처리 포함)
+        분석(extract_snapshot, classify_snapshot)은 브라우저 없이 다른 스레드에서 실행할 수 있습니다.
+        
+        Args:
+            url (str): 크롤링할 URL
+            harvest_links (bool): a[href] 링크도 수집
+            audit_prefixes (list): 감사 모드 - 이 접두사의 컴포넌트 div만 수집 (예: ['co76-', 'hd08-'])
+            audit_budget (float): 감사 모드에서 접두사를 기다리는 최대 시간 (초)
+        Returns:
+            dict: 페이지 스냅샷 (변경이 없어 캐시를 재사용하면 'rows'에 이전 결과)
+        Raises:
+            Exception: 드라이버 설정, 페이지 로드, 스크립트 실행 실패
         """
+        reason = self.recycle_reason()
+        if not reason and self.profile is not None and self.driver \
+                and self.profile_manager.site_key(url) != self.profile.site:
+            reason = f"사이트 변경: {self.profile.site} → {self.profile_manager.site_key(url)}"
+        if reason:
+            self.recycle_driver(reason)
+        
+        try:
+            if audit_prefixes:
+                return self._fetch_audit(url, audit_prefixes, audit_budget)
+            return self._fetch_page(url, harvest_links)
+        except Exception as e:
+            # 브라우저가 죽었으면 남은 프로세스를 정리하고 다음 페이지에서 새로 시작
+            if self.driver and self._driver_crashed(e):
+                if self.profile is not None:
+                    # 손상되었을 수 있는 프로필은 기준 프로필로 승격하지 않음
+                    self.profile.healthy = False
+                self.recycle_driver(f"크래시: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+            raise
+    
+    def result_columns(self):
+        """이 크롤러가 만드는 결과 행의 컬럼 목록 (뷰포트 설정 반영)"""
+        return result_columns([name for name, _, _ in self.viewports or ()])
+    
+    def cache_config(self):
+        """
+        페이지 캐시 재사용 조건 (뷰포트와 네이밍 규칙이 같을 때만 이전 결과 재사용)
+        Returns:
+            str: 설정 문자열
+        """
+        viewports = ','.join(f"{name}:{width}x{height}" for name, width, height in self.viewports or ())
+        return f"viewports={viewports};rules={self.pattern_engine.signature()}"
+    
+    def _driver_crashed(self, error):
+        """예외가 브라우저/드라이버 종료로 인한 것인지 여부"""
+        message = str(error).lower()
+        if any(keyword in message for keyword in ('crashed', 'not reachable', 'invalid session id', 'disconnected')):
+            return True
+        pid = self.driver_process_id()
+        return pid is not None and not browser_processes.alive(pid)
+    
+    def _fetch_page(self, url, harvest_links=False):
+        """fetch_page 본문 (페이지 하나 로드 및 스냅샷 수집)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        import time
+        
         print(f"🔍 크롤링 시작: {url}")
+        page = {
+            'url': url, 'rows': None, 'validators': None, 'site_code': None, 'page_type': None,
+            'divs': [], 'html': None, 'links': [], 'viewports': [],
+        }
+        
+        # 변경 여부 사전 확인 (변경이 없으면 브라우저 렌더링 생략)
+        # 캐시에는 링크가 없으므로 링크 수집 시에는 결과를 재사용하지 않음
+        if self.page_cache is not None:
+            page['cache_config'] = self.cache_config()
+            precheck = self.page_cache.precheck(url, page['cache_config'])
+            if precheck.unchanged and not harvest_links:
+                print(f"♻️  변경 없음 - 이전 결과 재사용 ({len(precheck.rows)}개 컴포넌트)")
+                page['rows'] = precheck.rows
+                return page
+            page['validators'] = precheck.validators
+        
+        if not self.driver:
+            self.setup_driver(url)
         
+        # 페이지 로드
+        print(f"   📄 페이지 로딩 중...")
+        load_start = time.monotonic()
+        self.driver.get(url)
+        # 실제로 페이지를 연 경우만 집계 (캐시 재사용/로드 실패는 제외, 재시작 주기와 프로필 승격 기준)
+        self.pages_on_driver += 1
+        print(f"   ⏱️  페이지 로드 {time.monotonic() - load_start:.1f}초")
+        
+        # 페이지 로딩 대기
+        print(f"   ⏳ 요소 대기 중...")
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            # 페이지 로드
-            print(f"   📄 페이지 로딩 중...")
-            self.driver.get(url)
-            
-            # 페이지 로딩 대기
-            print(f"   ⏳ 요소 대기 중...")
+            WebDriverWait(self.driver, 20).until(
+                EC.presence_of_element_located((By.TAG_NAME, "div"))
+            )
+            print(f"   ✅ div 요소 발견")
+        except Exception as e:
+            print(f"   ⚠️  div 요소 대기 타임아웃: {str(e)}")
+            # 계속 진행
+        
+        # JavaScript 실행 완료 대기
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            print(f"   ✅ 페이지 로딩 완료")
+        except:
+            print(f"   ⚠️  페이지 로딩 완료 대기 타임아웃 (계속 진행)")
+        
+        # 추가 로딩 시간 (동적 콘텐츠)
+        print(f"   ⏳ 동적 콘텐츠 로딩 대기 중...")
+        time.sleep(5)  # 3초 → 5초로 증가
+        
+        # Site Code 추출
+        page['site_code'] = self.extract_site_code(url)
+        print(f"🌍 Site Code: {page['site_code']}")
+        
+        # Page Type 추출
+        page['page_type'] = self.extract_page_type()
+        print(f"📄 Page Type: {page['page_type']}")
+        
+        # 모든 div 요소의 class와 display 상태를 한 번의 스크립트 실행으로 수집
+        # (아카이브 사용 시 display 상태를 data-cc-display 속성으로 남긴 DOM도 함께 반환)
+        snapshot = self.driver.execute_script(DIV_SNAPSHOT_SCRIPT, self.dom_archive is not None, harvest_links)
+        page['divs'] = snapshot['divs']
+        page['html'] = snapshot.get('html')
+        page['links'] = snapshot.get('links') or []
+        
+        # 같은 페이지에서 뷰포트만 바꿔 스냅샷 추가 수집
+        if self.viewports and len(self.viewports) > 1 and page['divs']:
+            page['viewports'] = self.capture_viewports()
+        
+        return page
+    
+    def _fetch_audit(self, url, prefixes, budget):
+        """
+        감사 모드 페이지 로드: 고정 대기 없이 접두사 div를 브라우저에서 찾고,
+        모두 찾으면 바로 반환 (캐시, DOM 아카이브, 뷰포트는 사용하지 않음)
+        """
+        import time
+        
+        print(f"🔎 감사: {url} ({', '.join(prefixes)})")
+        if not self.driver:
+            self.setup_driver(url)
+        
+        load_start = time.monotonic()
+        self.driver.get(url)
+        # 실제로 페이지를 연 경우만 집계 (캐시 재사용/로드 실패는 제외, 재시작 주기와 프로필 승격 기준)
+        self.pages_on_driver += 1
+        print(f"   ⏱️  페이지 로드 {time.monotonic() - load_start:.1f}초")
+        
+        self.driver.set_script_timeout(budget + 10)
+        snapshot = self.driver.execute_async_script(AUDIT_SCRIPT, prefixes, budget)
+        missing = [prefix for prefix in prefixes if prefix not in snapshot['found']]
+        print(f"   🔎 일치 div {len(snapshot['divs'])}개 ({snapshot['elapsed'] / 1000:.1f}초)"
+              f"{f' / 없음: ' + ', '.join(missing) if missing else ''}")
+        
+        return {
+            'url': url, 'rows': None, 'validators': None,
+            'site_code': self.extract_site_code(url), 'page_type': self.extract_page_type(),
+            'divs': snapshot['divs'], 'html': None, 'links': [], 'viewports': [], 'audit': prefixes,
+        }
+    
+    @staticmethod
+    def normalize_audit_prefixes(prefixes):
+        """
+        감사 접두사 정규화 ('-'로 끝나도록) 및 검증 (선택자에 넣을 수 없는 접두사는 제외)
+        Args:
+            prefixes (list): 컴포넌트 접두사 목록
+        Returns:
+            list: 정규화된 접두사 목록
+        Raises:
+            ValueError: 사용할 수 있는 접두사가 없는 경우
+        """
+        normalized = []
+        for prefix in prefixes:
+            prefix = prefix.strip()
+            prefix = prefix if prefix.endswith('-') else f"{prefix}-"
+            if not AUDIT_PREFIX_PATTERN.match(prefix):
+                print(f"   ⚠️  잘못된 접두사 제외: {prefix}")
+                continue
+            if prefix not in normalized:
+                normalized.append(prefix)
+        if not normalized:
+            raise ValueError("사용할 수 있는 접두사가 없습니다")
+        return normalized
+    
+    def audit_page(self, url, prefixes, budget=5.0):
+        """
+        감사 모드: 지정한 접두사의 컴포넌트만 확인 (오류 발생 시 예외를 그대로 전달)
+        전체 div를 수집/분류하지 않고 속성 선택자로 브라우저에서 걸러내며,
+        모든 접두사를 찾거나 로딩이 끝난 뒤 DOM이 더 바뀌지 않으면 제한 시간 전에 바로 끝납니다.
+        
+        Args:
+            url (str): 확인할 URL
+            prefixes (list): 컴포넌트 접두사 목록 (예: ['co76', 'hd08'] 또는 ['co76-', 'hd08-'])
+            budget (float): 접두사를 기다리는 최대 시간 (초)
+        Returns:
+            list: 일치한 컴포넌트의 결과 딕셔너리 리스트 (표준 결과 형식)
+        """
+        prefixes = self.normalize_audit_prefixes(prefixes)
+        page = self.fetch_page(url, audit_prefixes=prefixes, audit_budget=budget)
+        self.extract_snapshot(page)
+        return self.classify_snapshot(page)
+    
+    def audit(self, urls, prefixes, budget=5.0):
+        """
+        여러 URL 감사 (실패한 URL은 건너뜀)
+        Args:
+            urls (list): URL 목록
+            prefixes (list): 컴포넌트 접두사 목록
+            budget (float): 페이지별 최대 대기 시간 (초)
+        Returns:
+            list: 모든 페이지의 결과 딕셔너리 리스트
+        """
+        # 접두사는 한 번만 검증 (페이지마다 실패하지 않도록)
+        prefixes = self.normalize_audit_prefixes(prefixes)
+        rows = []
+        for url in urls:
             try:
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "div"))
-                )
-                print(f"   ✅ div 요소 발견")
+                rows.extend(self.audit_page(url, prefixes, budget))
             except Exception as e:
-                print(f"   ⚠️  div 요소 대기 타임아웃: {str(e)}")
-                # 계속 진행
-            
-            # JavaScript 실행 완료 대기
-            import time
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: driver.execute_script("return document.readyState") == "complete"
-                )
-                print(f"   ✅ 페이지 로딩 완료")
-            except:
-                print(f"   ⚠️  페이지 로딩 완료 대기 타임아웃 (계속 진행)")
-            
-            # 추가 로딩 시간 (동적 콘텐츠)
-            print(f"   ⏳ 동적 콘텐츠 로딩 대기 중...")
-            time.sleep(5)  # 3초 → 5초로 증가
-            
-            # Site Code 추출
-            site_code = self.extract_site_code(url)
-            print(f"🌍 Site Code: {site_code}")
-            
-            # Page Type 추출
-            page_type = self.extract_page_type()
-            print(f"📄 Page Type: {page_type}")
-            
-            # 모든 div 요소 찾기
-            divs = self.driver.find_elements(By.TAG_NAME, "div")
-            
-            print(f"✅ 총 {len(divs)}개의 div 요소 발견")
-            
-            if len(divs) == 0:
-                print("   ⚠️  div 요소를 찾을 수 없습니다. 페이지가 제대로 로드되었는지 확인하세요.")
-                return []
-            
-            # 컴포넌트별로 데이터를 수집하기 위한 딕셔너리
-            components_data = {}
-            processed_classes = set()  # 중복 제거를 위한 세트 (클래스명 기준)
-            matched_count = 0  # 패턴에 맞는 클래스 개수
-            
-            for idx, div in enumerate(divs, 1):
-                try:
-                    class_attr = div.get_attribute("class")
-                    
-                    if class_attr and class_attr.strip():
-                        component_class = self.extract_component_name(class_attr)
-                        
-                        # 컴포넌트 패턴에 맞는 것만 추출
-                        if component_class:
-                            matched_count += 1
-                            # 중복 체크 (클래스명 기준)
-                            if component_class in processed_classes:
-                                continue
-                            
-                            processed_classes.add(component_class)
-                            
-                            # display 스타일 체크
-                            try:
-                                display_style = div.value_of_css_property("display")
-                                is_displayed = display_style != "none"
-                            except:
-                                is_displayed = True  # 기본값
-                            
-                            # BEM 컴포넌트명 추출
-                            component_name = self.extract_bem_component(component_class)
-                            
-                            # 컴포넌트별로 데이터 그룹화
-                            if component_name not in components_data:
-                                components_data[component_name] = {
-                                    'classes': [],
-                                    'display_y': 0,
-                                    'display_n': 0,
-                                    'all_classes': set()
-                                }
-                            
-                            components_data[component_name]['classes'].append(component_class)
-                            
-                            if is_displayed:
-                                components_data[component_name]['display_y'] += 1
-                            else:
-                                components_data[component_name]['display_n'] += 1
-                            
-                            # 전체 클래스 목록 수집
-                            for cls in class_attr.split():
-                                components_data[component_name]['all_classes'].add(cls)
-                except Exception as e:
-                    # 개별 div 처리 중 에러는 무시하고 계속 진행
-                    continue
-            
-            print(f"   └ 패턴에 맞는 클래스: {matched_count}개")
-            
-            if len(components_data) == 0:
-                print("   ⚠️  컴포넌트 패턴(AA##- 또는 AAA##-)에 맞는 클래스를 찾을 수 없습니다.")
-                print("   └ 예시 패턴: hd08-, co76-, nv16-, srd19- 등")
-                return []
-            
-            # 결과 리스트 생성 (코드 내 순서대로)
-            results = []
-            for idx, (component_name, data) in enumerate(components_data.items(), 1):
-                results.append({
-                    '번호': idx,
-                    'Site Code': site_code,
-                    'Page Type': page_type,
-                    'URL': url,
-                    '컴포넌트명': component_name,
-                    '전체 클래스 목록': ', '.join(data['classes']),
-                    'Display': f"Y:{data['display_y']} / N:{data['display_n']}"
-                })
-            
-            total_classes = sum(len(data['classes']) for data in components_data.values())
-            total_y = sum(data['display_y'] for data in components_data.values())
-            total_n = sum(data['display_n'] for data in components_data.values())
-            
-            print(f"📊 총 {len(results)}개의 고유 컴포넌트")
-            print(f"   └ 총 클래스 수: {total_classes}개")
-            print(f"   └ Display Y: {total_y}개")
-            print(f"   └ Display N: {total_n}개")
-            
-            if len(results) == 0:
-                print(f"   ⚠️  패턴에 맞는 클래스를 찾을 수 없습니다!")
-                print(f"   💡 찾는 패턴: AA##- 또는 AAA##- (예: co77-, nv19-, pd21-, hd08-)")
-                # 디버깅: 샘플 클래스 출력
-                sample_classes = []
-                for div in divs[:50]:
-                    try:
-                        class_attr = div.get_attribute("class")
-                        if class_attr and class_attr.strip():
-                            sample_classes.append(class_attr[:80])
-                    except:
-                        continue
-                if sample_classes:
-                    print(f"   🔍 샘플 클래스 (처음 10개):")
-                    for i, cls in enumerate(sample_classes[:10], 1):
-                        print(f"      {i}. {cls}")
-            
-            return results
-            
+                print(f"❌ 감사 실패 ({url}): {str(e)}")
+        return rows
+    
+    def extract_snapshot(self, page):
+        """
+        추출 단계: 스냅샷을 div 레코드로 변환, DOM 아카이브 저장, 같은 사이트 링크 선별 (브라우저 불필요)
+        Args:
+            page (dict): fetch_page 결과 (제자리에서 갱신)
+        Returns:
+            dict: page
+        """
+        url = page['url']
+        page['div_records'] = [(class_attr, display != 'none') for class_attr, display in page['divs']]
+        page['viewport_records'] = [
+            (name, [(class_attr, display != 'none') for class_attr, display in divs])
+            for name, divs in page['viewports']
+        ]
+        
+        print(f"✅ 총 {len(page['div_records'])}개의 div 요소 발견")
+        
+        if page['links']:
+            page['links'] = list(dict.fromkeys(
+                link for link in page['links'] if link and same_site(url, link)
+            ))
+            print(f"   🔗 같은 사이트 링크: {len(page['links'])}개")
+        
+        if self.dom_archive is not None and page['html']:
+            digest = self.dom_archive.store(url, page['html'], page['site_code'], page['page_type'])
+            print(f"   🗄️  DOM 아카이브 저장: {digest[:12]}")
+        page['html'] = None
+        return page
+    
+    def classify_snapshot(self, page):
+        """
+        분류 단계: div 레코드에서 컴포넌트 집계 및 결과 행 생성 (브라우저 불필요)
+        Args:
+            page (dict): extract_snapshot 결과
+        Returns:
+            list: div 정보가 담긴 딕셔너리 리스트
+        """
+        url = page['url']
+        site_code = page['site_code']
+        page_type = page['page_type']
+        div_records = page['div_records']
+        
+        if page.get('audit') and len(div_records) == 0:
+            print("   🔎 대상 컴포넌트 없음")
+            return []
+        
+        if len(div_records) == 0:
+            print("   ⚠️  div 요소를 찾을 수 없습니다. 페이지가 제대로 로드되었는지 확인하세요.")
+            return []
+        
+        # 감사 모드: 사이트 규칙 대신 요청한 접두사로만 분류 (한 div에 다른 컴포넌트 클래스가 먼저 있어도 요청한 클래스 선택)
+        matcher = None
+        if page.get('audit'):
+            matcher = CompiledMatcher([RuleSet('audit', [re.escape(prefix) for prefix in page['audit']])])
+        
+        components_data, matched_count = self.collect_components(div_records, site=url, matcher=matcher)
+        
+        print(f"   └ 패턴에 맞는 클래스: {matched_count}개")
+        
+        # 뷰포트별 Display 상태
+        viewport_components = None
+        if page['viewport_records']:
+            viewport_components = [(self.viewports[0][0], components_data)]
+            for name, records in page['viewport_records']:
+                viewport_data, _ = self.collect_components(records, site=url)
+                viewport_components.append((name, viewport_data))
+                print(f"   📱 {name}: {len(viewport_data)}개 컴포넌트")
+        
+        if len(components_data) == 0 and not (viewport_components and any(data for _, data in viewport_components)):
+            print("   ⚠️  컴포넌트 패턴(AA##- 또는 AAA##-)에 맞는 클래스를 찾을 수 없습니다.")
+            print("   └ 예시 패턴: hd08-, co76-, nv16-, srd19- 등")
+            return []
+        
+        # 결과 리스트 생성 (코드 내 순서대로)
+        if viewport_components:
+            results = self.build_viewport_results(viewport_components, site_code, page_type, url)
+        else:
+            results = self.build_results(components_data, site_code, page_type, url)
+        
+        total_classes = sum(len(data['classes']) for data in components_data.values())
+        total_y = sum(data['display_y'] for data in components_data.values())
+        total_n = sum(data['display_n'] for data in components_data.values())
+        
+        print(f"📊 총 {len(results)}개의 고유 컴포넌트")
+        print(f"   └ 총 클래스 수: {total_classes}개")
+        print(f"   └ Display Y: {total_y}개")
+        print(f"   └ Display N: {total_n}개")
+        
+        if len(results) == 0:
+            print(f"   ⚠️  패턴에 맞는 클래스를 찾을 수 없습니다!")
+            print(f"   💡 찾는 패턴: AA##- 또는 AAA##- (예: co77-, nv19-, pd21-, hd08-)")
+            # 디버깅: 샘플 클래스 출력
+            sample_classes = [
+                class_attr[:80] for class_attr, _ in div_records[:50]
+                if class_attr and class_attr.strip()
+            ]
+            if sample_classes:
+                print(f"   🔍 샘플 클래스 (처음 10개):")
+                for i, cls in enumerate(sample_classes[:10], 1):
+                    print(f"      {i}. {cls}")
+        
+        if self.page_cache is not None and page['validators'] and results:
+            self.page_cache.store(url, results, page['validators'], page.get('cache_config'))
+        
+        return results
+    
+    def crawl_divs(self, url, harvest_links=False):
+        """
+        URL의 div 요소들의 class 추출
+        Args:
+            url (str): 크롤링할 URL
+            harvest_links (bool): 같은 사이트 링크도 수집하여 self.last_links에 저장
+        Returns:
+            list: div 정보가 담긴 딕셔너리 리스트 (오류 발생 시 빈 리스트)
+        """
+        try:
+            return self.crawl_page(url, harvest_links)
         except Exception as e:
             import traceback
             error_msg = str(e)
@@ -435,12 +776,13 @@ class ComponentCrawler:
             traceback.print_exc()
             return []
     
-    def save_to_excel(self, data, url):
+    def save_to_excel(self, data, url, split_by=None):
         """
-        데이터를 엑셀 파일로 저장
+        데이터를 엑셀 파일로 저장 (write-only 스트리밍 방식)
         Args:
             data (list): 저장할 데이터
             url (str): 크롤링한 URL
+            split_by (str): 시트를 나눌 컬럼 ('Site Code' 또는 'Page Type'), None이면 단일 시트
         Returns:
             str: 저장된 파일명
         """
@@ -453,25 +795,50 @@ class ComponentCrawler:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{domain}_components_{timestamp}.xlsx"
         
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-        
         # 엑셀 파일로 저장
         try:
-            df.to_excel(filename, index=False, engine='openpyxl')
+            stats = measure_export(write_excel_streaming, data, filename, split_by=split_by, measure_memory=False)
             print(f"✅ 파일 저장 완료: {filename}")
+            print(f"   └ {stats['rows']}행 / 시트 {len(stats['sheets'])}개 / {format_export_stats(stats)}")
             return filename
         except Exception as e:
             # Excel 저장 실패시 CSV로 저장
+            print(f"   ⚠️  엑셀 저장 실패: {str(e)}")
             csv_filename = filename.replace('.xlsx', '.csv')
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+            stats = measure_export(write_csv_streaming, data, csv_filename, measure_memory=False)
             print(f"✅ CSV 파일로 저장 완료: {csv_filename}")
+            print(f"   └ {stats['rows']}행 / {format_export_stats(stats)}")
             return csv_filename
     
+    def quit_driver(self):
+        """드라이버 종료 및 남은 Chrome 프로세스 정리"""
+        if self.driver:
+            self.driver_pids |= browser_processes.process_tree(self.driver_process_id())
+            driver, self.driver = self.driver, None
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"   ⚠️  브라우저 종료 실패: {str(e)}")
+        
+        # quit 이후에도 남아 있는 (고아) Chrome 프로세스 강제 종료
+        killed = browser_processes.kill_processes(self.driver_pids)
+        if killed:
+            print(f"   🧹 남은 브라우저 프로세스 {killed}개 정리")
+        self.driver_pids = set()
+        
+        # 브라우저가 완전히 종료된 뒤 프로필 복제본 정리 (정상 사용한 복제본은 기준 프로필로 승격)
+        if self.profile is not None:
+            profile, self.profile = self.profile, None
+            self.profile_manager.release(profile, promote=self.pages_on_driver > 0)
+        self.pages_on_driver = 0
+    
     def close(self):
         """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
+        if self.page_cache is not None:
+            self.page_cache.save()
+        had_driver = self.driver is not None
+        self.quit_driver()
+        if had_driver:
             print("🔒 브라우저 종료")
 
 
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+컴포넌트 검색 인덱스
+크롤링 결과(컴포넌트명, 전체 클래스 목록)에 대한 부분 문자열/접두사 검색 인덱스
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+
+# 컴포넌트 접두사 (예: co76, hd08, srd19)
+PREFIX_PATTERN = re.compile(r'^([a-z]{2,3}\d{2})-')
+
+# 부분 문자열 검색에 사용하는 n-gram 길이
+NGRAM_SIZE = 3
+
+
+class ComponentSearchIndex:
+    """
+    크롤링 결과 검색 인덱스
+
+    컴포넌트명, 개별 클래스, BEM Block, 접두사(co76, hd08 등)를 토큰으로 색인합니다.
+    검색은 행 전체가 아닌 고유 토큰 단위로 수행되므로 행 수가 많아도 빠르게 동작합니다.
+    공백이나 ','가 들어간 검색어(클래스 구분자 ", "에 걸치는 검색어)는 고유 (컴포넌트명, 클래스 목록) 값을
+    직접 스캔하여 기존 부분 문자열 검색과 같은 결과를 반환합니다.
+    여러 세션/스레드가 같은 인덱스를 공유할 수 있으므로 결과 캐시는 잠금으로 보호합니다.
+    """
+
+    def __init__(self, component_names, class_lists, cache_size=64):
+        """
+        인덱스 생성
+        Args:
+            component_names (iterable): 행별 컴포넌트명
+            class_lists (iterable): 행별 전체 클래스 목록 (", " 구분 문자열)
+            cache_size (int): 최근 검색 결과 캐시 크기
+        """
+        token_ids = {}
+        postings = []
+        row_count = 0
+        # 여러 페이지에 걸쳐 같은 클래스 목록이 반복되므로 토큰화 결과를 재사용
+        row_token_cache = {}
+        # 고유 (컴포넌트명, 클래스 목록) 소문자 값과 행별 값 ID (구분자에 걸치는 검색어 스캔용)
+        values = []
+        value_ids = array('I')
+
+        for row, (name, class_list) in enumerate(zip(component_names, class_lists)):
+            row_count += 1
+            cached = row_token_cache.get((name, class_list))
+            if cached is None:
+                cached = (self._row_tokens(name, class_list), len(values))
+                values.append(tuple(value.lower() if isinstance(value, str) else '' for value in (name, class_list)))
+                row_token_cache[(name, class_list)] = cached
+            row_tokens, value_id = cached
+            value_ids.append(value_id)
+            for token in row_tokens:
+                token_id = token_ids.get(token)
+                if token_id is None:
+                    token_id = len(postings)
+                    token_ids[token] = token_id
+                    postings.append(array('I'))
+                row_postings = postings[token_id]
+                # 같은 행의 중복 토큰은 한 번만 기록
+                if not row_postings or row_postings[-1] != row:
+                    row_postings.append(row)
+
+        self.row_count = row_count
+        self.tokens = list(token_ids)
+        self.token_ids = token_ids
+        self.postings = postings
+
+        # 접두사 검색용 정렬 토큰 목록
+        self.sorted_tokens = sorted(token_ids)
+
+        # 부분 문자열 검색용 n-gram -> 토큰 ID 목록
+        ngrams = {}
+        for token, token_id in token_ids.items():
+            for gram in {token[i:i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}:
+                ngrams.setdefault(gram, array('I')).append(token_id)
+        self.ngrams = ngrams
+
+        self.values = values
+        self.value_ids = value_ids
+
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_dataframe(cls, df, **kwargs):
+        """
+        크롤링 결과 DataFrame으로부터 인덱스 생성
+        Args:
+            df (DataFrame): '컴포넌트명', '전체 클래스 목록' 컬럼을 가진 결과
+        Returns:
+            ComponentSearchIndex: 검색 인덱스
+        """
+        return cls(df['컴포넌트명'].tolist(), df['전체 클래스 목록'].tolist(), **kwargs)
+
+    @staticmethod
+    def _row_tokens(name, class_list):
+        """행에서 색인할 토큰(소문자) 생성"""
+        values = []
+        if isinstance(name, str) and name:
+            values.append(name)
+        if isinstance(class_list, str) and class_list:
+            values.extend(cls for cls in class_list.split(', ') if cls)
+
+        tokens = set()
+        for value in values:
+            value = value.strip().lower()
+            if not value:
+                continue
+            tokens.add(value)
+            # BEM Block (Block__Element, Block--Modifier)
+            tokens.add(value.split('__')[0].split('--')[0])
+            prefix_match = PREFIX_PATTERN.match(value)
+            if prefix_match:
+                tokens.add(prefix_match.group(1))
+        return tokens
+
+    def _matching_tokens(self, query):
+        """부분 문자열을 포함하는 토큰 ID 목록"""
+        if len(query) < NGRAM_SIZE:
+            # 짧은 검색어는 고유 토큰을 직접 스캔
+            return [token_id for token, token_id in self.token_ids.items() if query in token]
+
+        grams = {query[i:i + NGRAM_SIZE] for i in range(len(query) - NGRAM_SIZE + 1)}
+        candidate_lists = []
+        for gram in grams:
+            gram_tokens = self.ngrams.get(gram)
+            if gram_tokens is None:
+                return []
+            candidate_lists.append(gram_tokens)
+
+        # 가장 짧은 목록부터 교집합 계산 후 실제 포함 여부 확인
+        candidate_lists.sort(key=len)
+        candidates = set(candidate_lists[0])
+        for gram_tokens in candidate_lists[1:]:
+            candidates.intersection_update(gram_tokens)
+            if not candidates:
+                return []
+        return [token_id for token_id in candidates if query in self.tokens[token_id]]
+
+    def _rows_for_tokens(self, token_ids):
+        """토큰 ID 목록에 해당하는 행 번호 (오름차순)"""
+        if len(token_ids) == 1:
+            return list(self.postings[token_ids[0]])
+        rows = set()
+        for token_id in token_ids:
+            rows.update(self.postings[token_id])
+        return sorted(rows)
+
+    def _scan_rows(self, query):
+        """고유 값을 직접 스캔하여 부분 문자열을 포함하는 행 번호 (구분자에 걸치는 검색어용)"""
+        matched = {
+            value_id for value_id, (name, class_list) in enumerate(self.values)
+            if query in name or query in class_list
+        }
+        return [row for row, value_id in enumerate(self.value_ids) if value_id in matched]
+
+    def _cached(self, key, compute):
+        """최근 검색 결과 캐시 (키 입력마다 같은 검색어가 반복되는 경우 대응)"""
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        # 계산은 잠금 밖에서 (다른 검색을 막지 않도록)
+        result = compute()
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def search(self, query):
+        """
+        부분 문자열 검색 (대소문자 무시)
+        Args:
+            query (str): 검색어
+        Returns:
+            list: 일치하는 행 번호 (0부터 시작, 오름차순)
+        """
+        query = (query or '').lower()
+        if not query.strip():
+            return list(range(self.row_count))
+        if query != query.strip() or ' ' in query or ',' in query:
+            # 토큰은 공백/','를 포함하지 않으므로 이런 검색어는 원래 문자열에서 직접 검색
+            return self._cached(('scan', query), lambda: self._scan_rows(query))
+        return self._cached(('search', query), lambda: self._rows_for_tokens(self._matching_tokens(query)))
+
+    def search_prefix(self, prefix):
+        """
+        접두사 검색 (대소문자 무시)
+        예: "co7" -> co76-feature-kv, co78-recommended-product-carousel 등
+
+        Args:
+            prefix (str): 접두사
+        Returns:
+            list: 일치하는 행 번호 (0부터 시작, 오름차순)
+        """
+        prefix = (prefix or '').strip().lower()
+        if not prefix:
+            return list(range(self.row_count))
+
+        def compute():
+            token_ids = []
+            position = bisect_left(self.sorted_tokens, prefix)
+            while position < len(self.sorted_tokens) and self.sorted_tokens[position].startswith(prefix):
+                token_ids.append(self.token_ids[self.sorted_tokens[position]])
+                position += 1
+            return self._rows_for_tokens(token_ids)
+
+        return self._cached(('prefix', prefix), compute)
+
+    def __len__(self):
+        return self.row_count
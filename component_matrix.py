@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+컴포넌트 동시 출현(co-occurrence) 분석
+컴포넌트명을 정수 ID로 바꾸고 페이지 x 컴포넌트 출현 행렬을 만들어
+동시 출현 횟수와 유사도(Jaccard, cosine)를 NumPy 행렬 연산으로 계산
+scipy가 있으면 희소 행렬(CSR)을 사용하고, 없으면 페이지 묶음 단위로 나누어 계산
+"""
+
+import csv
+import sys
+from array import array
+
+import numpy as np
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+from component_stats import PageBoundary, parse_display
+
+# scipy가 없을 때 한 번에 dense로 만들 페이지 수
+DENSE_CHUNK_PAGES = 4096
+
+
+class ComponentVocabulary:
+    """컴포넌트명 <-> 정수 ID"""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def intern(self, name):
+        """컴포넌트명의 ID (처음이면 새로 부여)"""
+        component_id = self.ids.get(name)
+        if component_id is None:
+            component_id = len(self.names)
+            self.ids[name] = component_id
+            self.names.append(name)
+        return component_id
+
+    def __len__(self):
+        return len(self.names)
+
+
+class ComponentMatrix:
+    """
+    페이지 x 컴포넌트 출현 행렬
+
+    결과 행을 한 번 읽으면서 (페이지 ID, 컴포넌트 ID) 쌍만 정수 배열로 모으고,
+    동시 출현은 X.T @ X로 계산합니다.
+    """
+
+    def __init__(self, page_ids, component_ids, vocabulary, urls):
+        """
+        초기화 (보통 from_rows로 생성)
+        Args:
+            page_ids (np.ndarray): 출현 쌍의 페이지 ID
+            component_ids (np.ndarray): 출현 쌍의 컴포넌트 ID
+            vocabulary (ComponentVocabulary): 컴포넌트명 사전
+            urls (list): 페이지 ID -> URL
+        """
+        self.page_ids = page_ids
+        self.component_ids = component_ids
+        self.vocabulary = vocabulary
+        self.urls = urls
+        self._cooccurrence = None
+
+    @classmethod
+    def from_rows(cls, rows, displayed_only=False, vocabulary=None):
+        """
+        결과 행으로 행렬 생성 (결과 행은 페이지 단위로 연속되므로 URL이 바뀌거나 '번호'가 1로 돌아가면 새 페이지)
+        Args:
+            rows (iterable): crawl_divs 결과 행
+            displayed_only (bool): Display Y가 1개 이상인 컴포넌트만 포함
+            vocabulary (ComponentVocabulary): 기존 사전 (여러 행렬의 ID를 맞출 때)
+        Returns:
+            ComponentMatrix
+        """
+        vocabulary = vocabulary or ComponentVocabulary()
+        page_ids = array('i')
+        component_ids = array('i')
+        urls = []
+        boundary = PageBoundary()
+
+        for row in rows:
+            if boundary.is_new_page(row):
+                urls.append(row.get('URL'))
+            name = row.get('컴포넌트명')
+            if not name:
+                continue
+            if displayed_only:
+                display = parse_display(row.get('Display'))
+                if display is not None and display[0] == 0:
+                    continue
+            page_ids.append(len(urls) - 1)
+            component_ids.append(vocabulary.intern(name))
+
+        return cls(
+            np.frombuffer(page_ids, dtype=np.int32) if page_ids else np.zeros(0, dtype=np.int32),
+            np.frombuffer(component_ids, dtype=np.int32) if component_ids else np.zeros(0, dtype=np.int32),
+            vocabulary,
+            urls,
+        )
+
+    @property
+    def shape(self):
+        return len(self.urls), len(self.vocabulary)
+
+    def incidence(self):
+        """
+        페이지 x 컴포넌트 출현 행렬 (scipy가 있으면 CSR, 없으면 dense uint8)
+        같은 페이지에 같은 컴포넌트가 여러 번 있어도 1로 기록
+        """
+        if sparse is not None:
+            matrix = sparse.csr_matrix(
+                (np.ones(len(self.page_ids), dtype=np.int32), (self.page_ids, self.component_ids)),
+                shape=self.shape,
+            )
+            matrix.data[:] = 1
+            return matrix
+        matrix = np.zeros(self.shape, dtype=np.uint8)
+        matrix[self.page_ids, self.component_ids] = 1
+        return matrix
+
+    def page_counts(self):
+        """컴포넌트별 사용 페이지 수 (X의 열 합계)"""
+        pairs = np.unique(self.page_ids.astype(np.int64) * len(self.vocabulary) + self.component_ids)
+        return np.bincount(pairs % len(self.vocabulary), minlength=len(self.vocabulary)) if len(pairs) else \
+            np.zeros(len(self.vocabulary), dtype=np.int64)
+
+    def cooccurrence(self):
+        """
+        동시 출현 행렬 C = X.T @ X (C[i, j] = 두 컴포넌트가 함께 나온 페이지 수, 대각선 = 사용 페이지 수)
+        Returns:
+            np.ndarray: 컴포넌트 x 컴포넌트 int64 행렬
+        """
+        if self._cooccurrence is not None:
+            return self._cooccurrence
+
+        size = len(self.vocabulary)
+        if sparse is not None:
+            matrix = self.incidence().astype(np.int64)
+            result = (matrix.T @ matrix).toarray()
+        else:
+            # 페이지를 묶음 단위로 dense 행렬로 만들어 누적 (메모리 = 묶음 페이지 수 x 컴포넌트 수)
+            result = np.zeros((size, size), dtype=np.float64)
+            order = np.argsort(self.page_ids, kind='stable')
+            page_ids = self.page_ids[order]
+            component_ids = self.component_ids[order]
+            for start in range(0, len(self.urls), DENSE_CHUNK_PAGES):
+                lo, hi = np.searchsorted(page_ids, [start, start + DENSE_CHUNK_PAGES])
+                if lo == hi:
+                    continue
+                chunk = np.zeros((DENSE_CHUNK_PAGES, size), dtype=np.float32)
+                chunk[page_ids[lo:hi] - start, component_ids[lo:hi]] = 1
+                result += chunk.T @ chunk
+            result = np.rint(result).astype(np.int64)
+
+        self._cooccurrence = result
+        return result
+
+    def similarity(self, metric='jaccard'):
+        """
+        컴포넌트 간 유사도 행렬
+        Args:
+            metric (str): 'jaccard' (|A∩B| / |A∪B|) 또는 'cosine' (|A∩B| / sqrt(|A||B|))
+        Returns:
+            np.ndarray: 컴포넌트 x 컴포넌트 float64 행렬
+        """
+        counts = self.cooccurrence().astype(np.float64)
+        pages = np.diag(counts)
+        if metric == 'jaccard':
+            denominator = pages[:, None] + pages[None, :] - counts
+        elif metric == 'cosine':
+            denominator = np.sqrt(pages[:, None] * pages[None, :])
+        else:
+            raise ValueError(f"지원하지 않는 유사도: {metric}")
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator > 0, counts / denominator, 0.0)
+
+    def top_pairs(self, k=20, metric='count', min_pages=1):
+        """
+        함께 자주 나오는 컴포넌트 쌍
+        Args:
+            k (int): 반환할 쌍 수
+            metric (str): 정렬 기준 ('count', 'jaccard', 'cosine')
+            min_pages (int): 함께 나온 페이지 수 최소값
+        Returns:
+            list: 쌍 딕셔너리 리스트 (점수 내림차순)
+        """
+        counts = self.cooccurrence()
+        scores = counts.astype(np.float64) if metric == 'count' else self.similarity(metric)
+        first, second = np.triu_indices(len(self.vocabulary), k=1)
+        pair_counts = counts[first, second]
+        keep = pair_counts >= max(1, min_pages)
+        first, second = first[keep], second[keep]
+        pair_scores = scores[first, second]
+
+        if len(pair_scores) > k:
+            top = np.argpartition(-pair_scores, k - 1)[:k]
+        else:
+            top = np.arange(len(pair_scores))
+        top = top[np.lexsort((-counts[first[top], second[top]], -pair_scores[top]))]
+
+        names = self.vocabulary.names
+        return [
+            {
+                '컴포넌트 A': names[first[i]],
+                '컴포넌트 B': names[second[i]],
+                '함께 나온 페이지': int(counts[first[i], second[i]]),
+                'A 페이지': int(counts[first[i], first[i]]),
+                'B 페이지': int(counts[second[i], second[i]]),
+                '점수': round(float(pair_scores[i]), 4),
+            }
+            for i in top
+        ]
+
+    def neighbors(self, component, k=10, metric='jaccard'):
+        """
+        특정 컴포넌트와 함께 자주 나오는 컴포넌트
+        Args:
+            component (str): 컴포넌트명
+            k (int): 반환할 개수
+            metric (str): 'count', 'jaccard', 'cosine'
+        Returns:
+            list: (컴포넌트명, 점수) 리스트
+        """
+        index = self.vocabulary.ids[component]
+        scores = (self.cooccurrence()[index].astype(np.float64) if metric == 'count'
+                  else self.similarity(metric)[index]).copy()
+        scores[index] = -1
+        order = np.argsort(-scores)[:k]
+        return [(self.vocabulary.names[i], float(scores[i])) for i in order if scores[i] > 0]
+
+
+def main():
+    """
+    CSV 결과 파일의 컴포넌트 동시 출현 분석
+    사용법: python component_matrix.py 결과.csv [정렬 기준(count/jaccard/cosine)] [쌍 수]
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else input("결과 CSV 파일 경로를 입력하세요: ").strip()
+    metric = sys.argv[2] if len(sys.argv) > 2 else 'count'
+    k = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        matrix = ComponentMatrix.from_rows(csv.DictReader(f))
+
+    pages, components = matrix.shape
+    print(f"📊 {pages}개 페이지 x {components}개 컴포넌트 ({'희소 행렬' if sparse is not None else '묶음 dense'})")
+    for pair in matrix.top_pairs(k=k, metric=metric):
+        print(f"   └ {pair['컴포넌트 A']} + {pair['컴포넌트 B']}: {pair['함께 나온 페이지']}페이지 (점수 {pair['점수']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+컴포넌트 네이밍 규칙 엔진
+사이트별로 여러 네이밍 규칙(접두사 패턴, BEM 분리 규칙, 제외 목록)을 등록하고
+하나의 정규식으로 컴파일하여 class 문자열을 한 번만 스캔
+"""
+
+import hashlib
+import re
+from urllib.parse import urlparse
+
+# 모든 사이트에 적용되는 규칙의 키
+ALL_SITES = '*'
+
+
+class RuleSet:
+    """컴포넌트 네이밍 규칙 하나 (예: Samsung AA##- 규칙)"""
+
+    def __init__(self, name, prefix_patterns, element_separator='__', modifier_separator='--', ignore=()):
+        """
+        초기화
+        Args:
+            name (str): 규칙 이름
+            prefix_patterns (list): 클래스 시작 부분에 매칭할 정규식 목록 (예: r'[a-z]{2,3}\\d{2}-')
+            element_separator (str): BEM Block__Element 구분자 (None이면 분리하지 않음)
+            modifier_separator (str): BEM Block--Modifier 구분자 (None이면 분리하지 않음)
+            ignore (list): 제외할 클래스 정규식 목록 (클래스 전체와 일치해야 제외)
+        """
+        self.name = name
+        self.prefix_patterns = list(prefix_patterns)
+        self.element_separator = element_separator
+        self.modifier_separator = modifier_separator
+        self.ignore = list(ignore)
+
+    def block(self, class_name):
+        """
+        BEM 패턴에서 컴포넌트명(Block) 추출
+        예: nv16-country-selector__content-wrap -> nv16-country-selector
+
+        Args:
+            class_name (str): 클래스명
+        Returns:
+            str: 컴포넌트명 (BEM의 Block 부분)
+        """
+        if not class_name:
+            return class_name
+        # __ 기준으로 분리 (BEM의 Block__Element 패턴)
+        if self.element_separator and self.element_separator in class_name:
+            return class_name.split(self.element_separator)[0]
+        # -- 기준으로 분리 (BEM의 Block--Modifier 패턴)
+        if self.modifier_separator and self.modifier_separator in class_name:
+            return class_name.split(self.modifier_separator)[0]
+        return class_name
+
+    def signature(self):
+        """규칙 내용 문자열 (규칙이 바뀌었는지 비교용)"""
+        return repr((self.name, self.prefix_patterns, self.element_separator, self.modifier_separator, self.ignore))
+
+    def __repr__(self):
+        return f"RuleSet({self.name!r})"
+
+
+# Samsung 컴포넌트 네이밍 규칙: AA##- 또는 AAA##- 패턴
+# 예: hd08-hero-kv-home, co76-feature-kv, srd19-gnb-search
+SAMSUNG_RULES = RuleSet('samsung', [r'[a-z]{2,3}\d{2}-'])
+
+
+class CompiledMatcher:
+    """여러 규칙을 하나의 정규식으로 합친 매처"""
+
+    def __init__(self, rulesets):
+        """
+        초기화
+        Args:
+            rulesets (list): 적용할 RuleSet 목록 (앞쪽 규칙이 우선)
+        """
+        self.rulesets = list(rulesets)
+        self.groups = {}
+        alternatives = []
+
+        for idx, ruleset in enumerate(self.rulesets):
+            group = f"_rule{idx}"
+            self.groups[group] = ruleset
+            prefixes = '|'.join(f"(?:{pattern})" for pattern in ruleset.prefix_patterns)
+            if ruleset.ignore:
+                # 규칙별 제외 목록은 해당 규칙의 분기에서만 적용
+                ignore = '|'.join(f"(?:{pattern})" for pattern in ruleset.ignore)
+                alternatives.append(f"(?P<{group}>(?!(?:{ignore})(?!\\S))(?:{prefixes}))")
+            else:
+                alternatives.append(f"(?P<{group}>(?:{prefixes}))")
+
+        if alternatives:
+            # 클래스 경계(공백 또는 문자열 시작)에서 시작하는 클래스 하나 전체를 매칭
+            self.pattern = re.compile(f"(?<!\\S)(?:{'|'.join(alternatives)})\\S*")
+        else:
+            self.pattern = None
+
+    def match(self, class_string):
+        """
+        class 문자열에서 규칙에 맞는 첫 번째 클래스 찾기
+        Args:
+            class_string (str): class 속성 문자열
+        Returns:
+            tuple: (클래스명, RuleSet) 또는 None
+        """
+        if not class_string or self.pattern is None:
+            return None
+        found = self.pattern.search(class_string)
+        if not found:
+            return None
+        return found.group(0), self.groups[found.lastgroup]
+
+    def classify(self, class_string):
+        """
+        class 문자열에서 (컴포넌트 클래스, 컴포넌트명) 추출
+        Args:
+            class_string (str): class 속성 문자열
+        Returns:
+            tuple: (컴포넌트 클래스, BEM Block 컴포넌트명) 또는 (None, None)
+        """
+        matched = self.match(class_string)
+        if not matched:
+            return None, None
+        class_name, ruleset = matched
+        return class_name, ruleset.block(class_name)
+
+
+class PatternEngine:
+    """사이트별 네이밍 규칙 레지스트리"""
+
+    def __init__(self, rulesets=()):
+        """
+        초기화
+        Args:
+            rulesets (list): 모든 사이트에 적용할 기본 RuleSet 목록
+        """
+        self._rules = {}
+        self._matchers = {}
+        for ruleset in rulesets:
+            self.register(ruleset)
+
+    @staticmethod
+    def site_key(site):
+        """
+        사이트 키 정규화 (URL 또는 호스트명 -> 'www.' 제외 소문자 호스트명)
+        예: https://www.lg.com/uk/ -> lg.com
+        """
+        if not site or site == ALL_SITES:
+            return ALL_SITES
+        host = urlparse(site).netloc if '://' in site else site
+        host = host.lower().split(':')[0]
+        return host[4:] if host.startswith('www.') else host
+
+    def register(self, ruleset, sites=None):
+        """
+        규칙 등록
+        Args:
+            ruleset (RuleSet): 등록할 규칙
+            sites (list): 적용할 사이트 호스트명 목록 (None이면 모든 사이트)
+        """
+        for site in (sites or [ALL_SITES]):
+            self._rules.setdefault(self.site_key(site), []).append(ruleset)
+        self._matchers.clear()
+
+    def rulesets(self, site=None):
+        """
+        사이트에 적용되는 규칙 목록 (사이트 전용 규칙 우선, 그 다음 공통 규칙)
+        Args:
+            site (str): URL 또는 호스트명
+        Returns:
+            list: RuleSet 목록
+        """
+        key = self.site_key(site)
+        active = list(self._rules.get(key, [])) if key != ALL_SITES else []
+        active.extend(self._rules.get(ALL_SITES, []))
+        return active
+
+    def signature(self):
+        """
+        등록된 전체 규칙의 지문 (규칙이 바뀌면 이전 결과를 재사용하지 않도록 캐시 키에 사용)
+        Returns:
+            str: 12자리 해시
+        """
+        parts = [
+            f"{site}={'|'.join(ruleset.signature() for ruleset in rulesets)}"
+            for site, rulesets in sorted(self._rules.items())
+        ]
+        return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:12]
+
+    def matcher(self, site=None):
+        """
+        사이트용 컴파일된 매처 (사이트별로 캐시)
+        Args:
+            site (str): URL 또는 호스트명
+        Returns:
+            CompiledMatcher: 매처
+        """
+        key = self.site_key(site)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = CompiledMatcher(self.rulesets(key))
+            self._matchers[key] = matcher
+        return matcher
+
+
+def default_engine():
+    """Samsung 규칙만 등록된 기본 엔진 생성"""
+    return PatternEngine([SAMSUNG_RULES])
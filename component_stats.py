@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+페이지 간 컴포넌트 사용 통계 집계
+병합 가능한 부분 집계(partial aggregate)로 작업자/샤드별 결과를 순서와 관계없이 합칠 수 있으며,
+결과 행을 한 번 읽으면서(streaming reduce) 집계
+"""
+
+import csv
+import re
+import sys
+from functools import reduce
+
+DISPLAY_PATTERN = re.compile(r'Y:(\d+)\s*/\s*N:(\d+)')
+
+# 카운터 순서: [사용 페이지 수, 총 인스턴스, Display Y, Display N]
+PAGES, INSTANCES, DISPLAY_Y, DISPLAY_N = range(4)
+
+
+def _new_counters():
+    return [0, 0, 0, 0]
+
+
+def _add_counters(target, source):
+    for i in range(4):
+        target[i] += source[i]
+
+
+def parse_display(display):
+    """
+    'Y:2 / N:1' 형식 문자열 파싱
+    Returns:
+        tuple: (Display Y, Display N), 형식이 다르면 None
+    """
+    found = DISPLAY_PATTERN.search(display or '')
+    if not found:
+        return None
+    return int(found.group(1)), int(found.group(2))
+
+
+class PageBoundary:
+    """
+    결과 행 스트림에서 페이지 경계 판별
+    결과 행은 페이지 단위로 연속되며 '번호'가 1부터 다시 시작하므로,
+    URL이 바뀌거나 '번호'가 이전 행보다 커지지 않으면 새 페이지로 봅니다.
+    (같은 URL의 페이지가 연속되어도 구분)
+    """
+
+    def __init__(self):
+        self.last_url = None
+        self.last_number = None
+        self.started = False
+
+    @staticmethod
+    def _number(row):
+        try:
+            return int(row.get('번호'))
+        except (TypeError, ValueError):
+            return None
+
+    def is_new_page(self, row):
+        """행이 새 페이지의 첫 행인지 여부 (상태 갱신)"""
+        url = row.get('URL')
+        number = self._number(row)
+        new_page = (not self.started or url != self.last_url
+                    or (number is not None and self.last_number is not None and number <= self.last_number))
+        self.started = True
+        self.last_url = url
+        self.last_number = number
+        return new_page
+
+    def reset(self):
+        self.__init__()
+
+
+class ComponentUsageStats:
+    """
+    컴포넌트 사용 통계 (병합 가능)
+
+    컴포넌트별로 사용 페이지 수, 총 인스턴스 수, Display Y/N 합계와
+    Site Code별 / Page Type별 분류를 유지합니다.
+    각 결과 행은 "한 페이지의 한 컴포넌트"이므로 행 하나가 사용 페이지 1개에 해당합니다.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.components = {}      # 컴포넌트명 -> 카운터
+        self.by_site = {}         # 컴포넌트명 -> {Site Code -> 카운터}
+        self.by_page_type = {}    # 컴포넌트명 -> {Page Type -> 카운터}
+        self._boundary = PageBoundary()
+
+    def add_page(self, rows):
+        """
+        페이지 하나의 결과 행 반영 (페이지 경계를 호출하는 쪽이 지정, 컴포넌트가 없는 페이지도 1페이지)
+        Args:
+            rows (list): 한 페이지의 crawl_divs 결과 행
+        Returns:
+            ComponentUsageStats: self
+        """
+        self.pages += 1
+        for row in rows:
+            self._add_component(row)
+        self._boundary.reset()
+        return self
+
+    def add_row(self, row):
+        """
+        결과 행 하나 반영 (URL 변경 또는 '번호'가 1로 돌아가면 새 페이지)
+        Args:
+            row (dict): crawl_divs 결과 행
+        """
+        if self._boundary.is_new_page(row):
+            self.pages += 1
+        self._add_component(row)
+
+    def _add_component(self, row):
+        name = row.get('컴포넌트명')
+        if not name:
+            return
+
+        display = parse_display(row.get('Display'))
+        if display is None:
+            classes = [cls for cls in (row.get('전체 클래스 목록') or '').split(', ') if cls]
+            display = (len(classes) or 1, 0)
+        counters = [1, display[0] + display[1], display[0], display[1]]
+
+        _add_counters(self.components.setdefault(name, _new_counters()), counters)
+        site = self.by_site.setdefault(name, {})
+        _add_counters(site.setdefault(row.get('Site Code') or 'UNKNOWN', _new_counters()), counters)
+        page_type = self.by_page_type.setdefault(name, {})
+        _add_counters(page_type.setdefault(row.get('Page Type') or 'Unknown', _new_counters()), counters)
+
+    def add_rows(self, rows):
+        """
+        결과 행 여러 개 반영 (제너레이터 가능)
+        Returns:
+            ComponentUsageStats: self
+        """
+        for row in rows:
+            self.add_row(row)
+        return self
+
+    def merge(self, other):
+        """
+        다른 부분 집계 병합 (서로 다른 페이지를 집계한 결과끼리 병합, 순서 무관)
+        Args:
+            other (ComponentUsageStats): 병합할 집계
+        Returns:
+            ComponentUsageStats: self
+        """
+        self.pages += other.pages
+        for name, counters in other.components.items():
+            _add_counters(self.components.setdefault(name, _new_counters()), counters)
+        for mine, theirs in ((self.by_site, other.by_site), (self.by_page_type, other.by_page_type)):
+            for name, groups in theirs.items():
+                target = mine.setdefault(name, {})
+                for key, counters in groups.items():
+                    _add_counters(target.setdefault(key, _new_counters()), counters)
+        # 병합 후에는 이어서 들어오는 행이 새 페이지로 시작하도록 초기화
+        self._boundary.reset()
+        return self
+
+    def __add__(self, other):
+        return ComponentUsageStats().merge(self).merge(other)
+
+    def __iadd__(self, other):
+        return self.merge(other)
+
+    def to_dict(self):
+        """JSON/프로세스 간 전달용 딕셔너리"""
+        return {
+            'pages': self.pages,
+            'components': self.components,
+            'by_site': self.by_site,
+            'by_page_type': self.by_page_type,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict 결과로부터 복원"""
+        stats = cls()
+        stats.pages = data['pages']
+        stats.components = {name: list(counters) for name, counters in data['components'].items()}
+        stats.by_site = {
+            name: {key: list(counters) for key, counters in groups.items()}
+            for name, groups in data['by_site'].items()
+        }
+        stats.by_page_type = {
+            name: {key: list(counters) for key, counters in groups.items()}
+            for name, groups in data['by_page_type'].items()
+        }
+        return stats
+
+    def to_rows(self):
+        """
+        컴포넌트별 통계 행 (사용 페이지 수 내림차순)
+        Returns:
+            list: 통계 딕셔너리 리스트
+        """
+        rows = []
+        ordered = sorted(self.components.items(), key=lambda item: (-item[1][PAGES], item[0]))
+        for name, counters in ordered:
+            sites = sorted(self.by_site.get(name, {}).items(), key=lambda item: -item[1][PAGES])
+            page_types = sorted(self.by_page_type.get(name, {}).items(), key=lambda item: -item[1][PAGES])
+            rows.append({
+                '컴포넌트명': name,
+                '사용 페이지 수': counters[PAGES],
+                '사용 비율': f"{counters[PAGES] / self.pages * 100:.1f}%" if self.pages else "0.0%",
+                '총 인스턴스': counters[INSTANCES],
+                'Display Y': counters[DISPLAY_Y],
+                'Display N': counters[DISPLAY_N],
+                'Site Code별 페이지': ', '.join(f"{key}:{value[PAGES]}" for key, value in sites),
+                'Page Type별 페이지': ', '.join(f"{key}:{value[PAGES]}" for key, value in page_types),
+            })
+        return rows
+
+    def breakdown_rows(self, by='Site Code'):
+        """
+        컴포넌트 x (Site Code 또는 Page Type) 세부 통계 행
+        Args:
+            by (str): 'Site Code' 또는 'Page Type'
+        Returns:
+            list: 통계 딕셔너리 리스트
+        """
+        source = self.by_site if by == 'Site Code' else self.by_page_type
+        rows = []
+        for name in sorted(source):
+            for key, counters in sorted(source[name].items()):
+                rows.append({
+                    '컴포넌트명': name,
+                    by: key,
+                    '사용 페이지 수': counters[PAGES],
+                    '총 인스턴스': counters[INSTANCES],
+                    'Display Y': counters[DISPLAY_Y],
+                    'Display N': counters[DISPLAY_N],
+                })
+        return rows
+
+
+def aggregate_rows(rows):
+    """결과 행을 한 번 읽으면서 집계"""
+    return ComponentUsageStats().add_rows(rows)
+
+
+def merge_all(partials):
+    """
+    부분 집계 목록 병합
+    Args:
+        partials (iterable): ComponentUsageStats 목록
+    Returns:
+        ComponentUsageStats: 전체 집계
+    """
+    return reduce(lambda total, partial: total.merge(partial), partials, ComponentUsageStats())
+
+
+def main():
+    """
+    CSV 결과 파일들의 컴포넌트 사용 통계 출력
+    사용법: python component_stats.py 결과1.csv [결과2.csv ...]
+    """
+    partials = []
+    for path in sys.argv[1:]:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            partials.append(aggregate_rows(csv.DictReader(f)))
+    stats = merge_all(partials)
+
+    print(f"📊 {stats.pages}개 페이지 / {len(stats.components)}개 컴포넌트")
+    for row in stats.to_rows()[:30]:
+        print(f"   └ {row['컴포넌트명']}: {row['사용 페이지 수']}페이지 ({row['사용 비율']}), "
+              f"Y:{row['Display Y']} / N:{row['Display N']}")
+
+
+if __name__ == "__main__":
+    main()
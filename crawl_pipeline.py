@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+단계별 크롤링 파이프라인
+로드(브라우저) → 추출 → 분류 → 저장 단계를 크기가 제한된 큐로 연결하여,
+N+1번째 페이지를 로드하는 동안 N번째 페이지를 분류하고 저장
+단계별 큐 길이로 병목 단계를 확인할 수 있음
+"""
+
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+# 단계 종료 표시
+_DONE = object()
+
+
+class StageQueue(queue.Queue):
+    """단계 사이 큐 (최대 길이 기록)"""
+
+    def __init__(self, name, maxsize):
+        super().__init__(maxsize)
+        self.name = name
+        self.max_depth = 0
+
+    def _put(self, item):
+        super()._put(item)
+        self.max_depth = max(self.max_depth, len(self.queue))
+
+
+class StageStats:
+    """단계 하나의 처리 통계"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.errors = 0
+        self.busy = 0.0  # 실제 처리에 쓴 시간 (초)
+
+
+class CrawlPipeline:
+    """
+    단계별 크롤링 파이프라인
+
+    - fetch: 브라우저로 페이지 로드 + 스냅샷 (fetch_workers개 스레드, 스레드별 크롤러)
+    - extract: div 레코드 변환, DOM 아카이브 저장
+    - classify: 컴포넌트 집계, 결과 행 생성
+    - write: 호출한 스레드에서 결과 행을 소비 (예: write_excel_streaming)
+
+    각 단계 사이 큐는 queue_size로 제한되어, 뒤 단계가 느리면 앞 단계가 기다립니다.
+    fetch_workers가 1이면 결과는 URL 순서, 2 이상이면 완료 순서입니다.
+    """
+
+    STAGES = ('fetch', 'extract', 'classify', 'write')
+
+    def __init__(self, crawler_factory=None, fetch_workers=1, queue_size=4, monitor_interval=10.0):
+        """
+        초기화
+        Args:
+            crawler_factory (callable): 크롤러 생성 함수 (None이면 ComponentCrawler())
+            fetch_workers (int): 페이지 로드 스레드 수 (= 최대 Chrome 인스턴스 수)
+            queue_size (int): 단계 사이 큐 최대 길이
+            monitor_interval (float): 큐 길이 출력 간격 (초, None이면 출력하지 않음)
+        """
+        if crawler_factory is None:
+            from component_crawler import ComponentCrawler
+            crawler_factory = ComponentCrawler
+        self.crawler_factory = crawler_factory
+        self.fetch_workers = max(1, fetch_workers)
+        self.queue_size = queue_size
+        self.monitor_interval = monitor_interval
+        self.queues = {}
+        self.stage_stats = {}
+        self.crawlers = []
+        self.stop_event = threading.Event()
+
+    def queue_depths(self):
+        """
+        단계별 대기 중인 항목 수 (앞 단계가 넣고 해당 단계가 아직 꺼내지 않은 수)
+        Returns:
+            dict: 단계 이름 -> 큐 길이
+        """
+        return {name: stage_queue.qsize() for name, stage_queue in self.queues.items()}
+
+    def stats(self):
+        """
+        단계별 통계
+        Returns:
+            dict: 단계 이름 -> {'items', 'errors', 'busy', 'depth', 'max_depth'}
+        """
+        result = {}
+        for name in self.STAGES:
+            stage = self.stage_stats.get(name)
+            if stage is None:
+                continue
+            stage_queue = self.queues.get(name)
+            result[name] = {
+                'items': stage.items,
+                'errors': stage.errors,
+                'busy': round(stage.busy, 3),
+                'depth': stage_queue.qsize() if stage_queue else None,
+                'max_depth': stage_queue.max_depth if stage_queue else None,
+            }
+        return result
+
+    def _put(self, stage_queue, item):
+        """큐에 넣기 (파이프라인이 중단되면 포기)"""
+        while not self.stop_event.is_set():
+            try:
+                stage_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, stage_queue):
+        """큐에서 꺼내기 (파이프라인이 중단되면 _DONE)"""
+        while not self.stop_event.is_set():
+            try:
+                return stage_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _fetch(self, urls, remaining, lock):
+        """로드 단계 (스레드별 크롤러)"""
+        stage = self.stage_stats['fetch']
+        crawler = None
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    url = urls.get_nowait()
+                except queue.Empty:
+                    break
+                if crawler is None:
+                    crawler = self.crawler_factory()
+                    with lock:
+                        self.crawlers.append(crawler)
+                start = time.perf_counter()
+                try:
+                    page = crawler.fetch_page(url)
+                except Exception as e:
+                    stage.errors += 1
+                    print(f"   ❌ 로드 실패 ({url}): {str(e)}")
+                    continue
+                finally:
+                    stage.busy += time.perf_counter() - start
+                stage.items += 1
+                if not self._put(self.queues['extract'], (crawler, page)):
+                    break
+        finally:
+            # 브라우저만 먼저 종료 (추출/분류 단계가 아직 이 크롤러의 페이지 캐시를 사용하므로 close는 rows()에서)
+            if crawler is not None:
+                crawler.quit_driver()
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self._put(self.queues['extract'], _DONE)
+
+    def _process(self, name, source, target, handle):
+        """추출/분류 단계 (단일 스레드)"""
+        stage = self.stage_stats[name]
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                self._put(target, _DONE)
+                return
+            crawler, page = item
+            start = time.perf_counter()
+            try:
+                result = handle(crawler, page)
+            except Exception as e:
+                stage.errors += 1
+                print(f"   ❌ {name} 실패 ({page['url']}): {str(e)}")
+                continue
+            finally:
+                stage.busy += time.perf_counter() - start
+            stage.items += 1
+            if not self._put(target, result):
+                return
+
+    @staticmethod
+    def _extract(crawler, page):
+        if page['rows'] is None:
+            crawler.extract_snapshot(page)
+        return crawler, page
+
+    @staticmethod
+    def _classify(crawler, page):
+        if page['rows'] is not None:
+            return page['rows']
+        return crawler.classify_snapshot(page)
+
+    def _monitor(self):
+        """주기적으로 큐 길이 출력"""
+        while not self.stop_event.wait(self.monitor_interval):
+            depths = ' | '.join(f"{name} {depth}/{self.queue_size}" for name, depth in self.queue_depths().items())
+            print(f"   📶 대기열 {depths}")
+
+    def rows(self, urls):
+        """
+        파이프라인 실행 (결과 행을 하나씩 반환하는 제너레이터, 소비하는 쪽이 저장 단계)
+        Args:
+            urls (list): URL 목록
+        Returns:
+            generator: 결과 딕셔너리
+        """
+        self.stop_event.clear()
+        self.queues = {name: StageQueue(name, self.queue_size) for name in ('extract', 'classify', 'write')}
+        self.stage_stats = {name: StageStats(name) for name in self.STAGES}
+        self.crawlers = []
+
+        url_queue = queue.Queue()
+        for url in urls:
+            url_queue.put(url)
+
+        workers = min(self.fetch_workers, max(1, len(urls)))
+        remaining = [workers]
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(target=self._fetch, args=(url_queue, remaining, lock), name=f"pipeline-fetch-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        threads.append(threading.Thread(
+            target=self._process, args=('extract', self.queues['extract'], self.queues['classify'], self._extract),
+            name="pipeline-extract", daemon=True
+        ))
+        threads.append(threading.Thread(
+            target=self._process, args=('classify', self.queues['classify'], self.queues['write'], self._classify),
+            name="pipeline-classify", daemon=True
+        ))
+        if self.monitor_interval:
+            threads.append(threading.Thread(target=self._monitor, name="pipeline-monitor", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        write_stage = self.stage_stats['write']
+        try:
+            while True:
+                rows = self._get(self.queues['write'])
+                if rows is _DONE:
+                    break
+                write_stage.items += 1
+                start = time.perf_counter()
+                for row in rows:
+                    # 소비하는 쪽(저장)에서 걸린 시간도 저장 단계 시간에 포함
+                    yield row
+                write_stage.busy += time.perf_counter() - start
+        finally:
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+            # 모든 단계가 끝난 뒤 크롤러 종료 (페이지 캐시 저장 포함)
+            for crawler in self.crawlers:
+                try:
+                    crawler.close()
+                except Exception as e:
+                    print(f"   ⚠️  크롤러 종료 실패: {str(e)}")
+
+    def run(self, urls, output=None):
+        """
+        파이프라인 실행
+        Args:
+            urls (list): URL 목록
+            output (str): 저장할 엑셀 파일 경로 (None이면 결과 리스트 반환)
+        Returns:
+            list 또는 dict: output이 없으면 결과 딕셔너리 리스트, 있으면 저장 결과
+        """
+        start = time.perf_counter()
+        if output:
+            from excel_export import write_excel_streaming
+            result = write_excel_streaming(self.rows(urls), output)
+        else:
+            result = list(self.rows(urls))
+        elapsed = time.perf_counter() - start
+
+        print(f"🏁 {len(urls)}개 URL / {elapsed:.1f}초")
+        for name, stage in self.stats().items():
+            utilization = stage['busy'] / elapsed * 100 if elapsed else 0
+            depth = f", 최대 대기 {stage['max_depth']}" if stage['max_depth'] is not None else ""
+            errors = f", 오류 {stage['errors']}건" if stage['errors'] else ""
+            print(f"   └ {name:<8} {stage['items']}건 / 처리 {stage['busy']:.1f}초 ({utilization:.0f}%){depth}{errors}")
+        return result
+
+
+def main():
+    """
+    URL 목록 파일을 파이프라인으로 크롤링
+    사용법: python crawl_pipeline.py [URL 목록 파일] [저장 파일(.xlsx)] [로드 스레드 수]
+    """
+    path = sys.argv[1] if len(sys.argv) > 1 else 'urls.txt'
+    output = sys.argv[2] if len(sys.argv) > 2 else f"pipeline_components_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    fetch_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    with open(path, encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    result = CrawlPipeline(fetch_workers=fetch_workers).run(urls, output)
+    print(f"✅ 파일 저장 완료: {output} ({result['rows']}행)")
+
+
+if __name__ == "__main__":
+    main()
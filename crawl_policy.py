@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+페이지 실행 정책 (타임아웃, 재시도, 헤징)
+페이지별 강제 마감 시간, 실패 유형 분류, 백오프 재시도, 그리고 느린 페이지에 대해
+새 드라이버로 두 번째 시도를 띄우는 헤징(hedging)으로 배치의 꼬리 지연을 제한
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+
+from component_core import ComponentClassifier, result_columns
+
+# 결과 상태
+STATUS_OK = 'ok'            # 컴포넌트 추출 성공
+STATUS_EMPTY = 'empty'      # 페이지는 열렸지만 패턴에 맞는 컴포넌트 없음
+STATUS_TIMEOUT = 'timeout'  # 마감 시간 초과 또는 페이지 로드 타임아웃
+STATUS_ERROR = 'error'      # 드라이버/네트워크 등 기타 오류
+
+
+class PageResult:
+    """페이지 하나의 실행 결과"""
+
+    def __init__(self, url, status, rows=None, error=None, attempts=0, elapsed=0.0, hedged=False, columns=None):
+        """
+        초기화
+        Args:
+            url (str): URL
+            status (str): 결과 상태 (ok, empty, timeout, error)
+            rows (list): 결과 딕셔너리 리스트
+            error (str): 오류 메시지
+            attempts (int): 시도 횟수 (헤징 시도 포함)
+            elapsed (float): 전체 소요 시간 (초)
+            hedged (bool): 헤징 시도를 띄웠는지 여부
+            columns (list): 결과 행 컬럼 목록 (실패 행에 사용, None이면 기본 컬럼)
+        """
+        self.url = url
+        self.status = status
+        self.rows = rows or []
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.hedged = hedged
+        self.columns = columns
+
+    @property
+    def ok(self):
+        return self.status == STATUS_OK
+
+    def to_rows(self):
+        """
+        결과 행 리스트 ('Status' 컬럼 포함)
+        실패한 페이지도 한 행으로 남겨 결과 파일에서 빈 페이지와 구분할 수 있게 합니다.
+        스트리밍 저장은 첫 행의 컬럼을 사용하므로 실패 행도 정상 행과 같은 컬럼을 가집니다.
+        """
+        if self.rows:
+            return [dict(row, Status=self.status) for row in self.rows]
+        status = self.status if not self.error else f"{self.status}: {self.error}"
+        row = dict.fromkeys(self.columns or result_columns(), '')
+        row.update({
+            '번호': 0,
+            'Site Code': ComponentClassifier().extract_site_code(self.url),
+            'Page Type': 'Unknown',
+            'URL': self.url,
+            'Status': status,
+        })
+        return [row]
+
+    def __repr__(self):
+        return f"PageResult({self.url!r}, {self.status!r}, rows={len(self.rows)}, attempts={self.attempts})"
+
+
+def classify_exception(error):
+    """예외를 결과 상태로 분류"""
+    if isinstance(error, TimeoutError) or type(error).__name__ == 'TimeoutException':
+        return STATUS_TIMEOUT
+    return STATUS_ERROR
+
+
+class PageExecutor:
+    """
+    페이지 실행 정책
+
+    - deadline: 페이지 하나(재시도 포함)에 허용하는 최대 시간. 넘으면 드라이버를 종료하고 timeout 처리
+    - retries: timeout/error 시 재시도 횟수 (지수 백오프)
+    - hedge: 지금까지 성공한 페이지 소요 시간의 p95를 넘으면 새 드라이버로 두 번째 시도를 띄움
+    """
+
+    def __init__(self, crawler_factory=None, deadline=120.0, attempt_timeout=60.0, retries=2,
+                 backoff=2.0, max_backoff=30.0, retry_on=(STATUS_TIMEOUT, STATUS_ERROR),
+                 hedge=False, hedge_percentile=95, hedge_min_samples=10, history_size=200):
+        """
+        초기화
+        Args:
+            crawler_factory (callable): 크롤러 생성 함수 (None이면 ComponentCrawler())
+            deadline (float): 페이지별 최대 시간 (초, 재시도 포함)
+            attempt_timeout (float): 시도 한 번의 최대 시간 (초)
+            retries (int): 최대 재시도 횟수
+            backoff (float): 첫 재시도 대기 시간 (초, 재시도마다 2배)
+            max_backoff (float): 최대 재시도 대기 시간 (초)
+            retry_on (tuple): 재시도할 결과 상태
+            hedge (bool): 헤징 사용 여부
+            hedge_percentile (int): 헤징 시작 기준 백분위수
+            hedge_min_samples (int): 헤징을 시작하기 위한 최소 성공 기록 수
+            history_size (int): 소요 시간 기록 개수
+        """
+        if crawler_factory is None:
+            from component_crawler import ComponentCrawler
+            crawler_factory = ComponentCrawler
+        self.crawler_factory = crawler_factory
+        self.deadline = deadline
+        self.attempt_timeout = attempt_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_on = tuple(retry_on)
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latencies = deque(maxlen=history_size)
+        self.crawler = None
+        self.columns = None  # 크롤러 설정에 따른 결과 컬럼 (실패 행에 사용)
+
+    def hedge_delay(self):
+        """
+        헤징 시작 지연 시간 (성공한 시도 소요 시간의 백분위수)
+        Returns:
+            float: 지연 시간 (초), 기록이 부족하거나 헤징을 쓰지 않으면 None
+        """
+        if not self.hedge or len(self.latencies) < self.hedge_min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        return ordered[index]
+
+    def _start_attempt(self, crawler, url):
+        """별도 스레드에서 시도 시작 (멈춘 시도가 다른 작업을 막지 않도록 전용 스레드 사용)"""
+        future = Future()
+
+        def target():
+            start = time.monotonic()
+            try:
+                rows = crawler.crawl_page(url)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result((rows, time.monotonic() - start))
+
+        thread = threading.Thread(target=target, name="page-attempt", daemon=True)
+        thread.start()
+        return future
+
+    def _abandon(self, crawler):
+        """멈춘 시도의 드라이버를 백그라운드에서 종료 (quit 자체가 멈출 수 있으므로)"""
+        if crawler is self.crawler:
+            self.crawler = None
+
+        def target():
+            try:
+                crawler.close()
+            except Exception as e:
+                print(f"   ⚠️  드라이버 종료 실패: {str(e)}")
+
+        threading.Thread(target=target, name="page-abandon", daemon=True).start()
+
+    def _attempt(self, url, time_left):
+        """
+        시도 한 번 실행 (필요하면 헤징 시도 추가)
+        Returns:
+            tuple: (상태, 결과 행, 오류 메시지, 시도 횟수, 헤징 여부)
+        """
+        if self.crawler is None:
+            self.crawler = self.crawler_factory()
+            if self.columns is None:
+                self.columns = self.crawler.result_columns()
+
+        timeout = min(self.attempt_timeout, time_left)
+        start = time.monotonic()
+        running = {self._start_attempt(self.crawler, url): self.crawler}
+        attempts = 1
+        hedged = False
+        hedge_after = self.hedge_delay()
+        last_error = None
+
+        while running:
+            remaining = timeout - (time.monotonic() - start)
+            if remaining <= 0:
+                break
+            wait_for = remaining
+            if hedge_after is not None and not hedged:
+                wait_for = min(remaining, max(0.0, hedge_after - (time.monotonic() - start)))
+
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            if not done:
+                if hedge_after is not None and not hedged and time.monotonic() - start >= hedge_after:
+                    print(f"   🪝 p{self.hedge_percentile} {hedge_after:.1f}초 초과 - 새 드라이버로 헤징 시도")
+                    hedge_crawler = self.crawler_factory()
+                    running[self._start_attempt(hedge_crawler, url)] = hedge_crawler
+                    attempts += 1
+                    hedged = True
+                continue
+
+            for future in done:
+                crawler = running.pop(future)
+                try:
+                    rows, elapsed = future.result()
+                except Exception as e:
+                    last_error = e
+                    # 드라이버가 망가졌을 수 있으므로 다음 시도는 새 드라이버 사용
+                    self._abandon(crawler)
+                    continue
+
+                # 먼저 끝난 시도를 사용하고 나머지는 종료
+                for other in running.values():
+                    self._abandon(other)
+                if crawler is not self.crawler:
+                    if self.crawler is not None:
+                        self._abandon(self.crawler)
+                    self.crawler = crawler
+                self.latencies.append(elapsed)
+                status = STATUS_OK if rows else STATUS_EMPTY
+                return status, rows, None, attempts, hedged
+
+        if running:
+            # 시간 초과: 남은 시도의 드라이버 종료
+            for crawler in running.values():
+                self._abandon(crawler)
+            return STATUS_TIMEOUT, [], f"{timeout:.0f}초 초과", attempts, hedged
+
+        return classify_exception(last_error), [], str(last_error), attempts, hedged
+
+    def run(self, url):
+        """
+        정책에 따라 페이지 실행
+        Args:
+            url (str): URL
+        Returns:
+            PageResult: 실행 결과
+        """
+        start = time.monotonic()
+        total_attempts = 0
+        any_hedged = False
+        retry = 0
+
+        while True:
+            time_left = self.deadline - (time.monotonic() - start)
+            status, rows, error, attempts, hedged = self._attempt(url, time_left)
+            total_attempts += attempts
+            any_hedged = any_hedged or hedged
+
+            if status not in self.retry_on or retry >= self.retries:
+                break
+
+            delay = min(self.max_backoff, self.backoff * (2 ** retry))
+            if time.monotonic() - start + delay >= self.deadline:
+                break
+            retry += 1
+            print(f"   🔁 {status} ({error}) - {delay:.1f}초 후 재시도 ({retry}/{self.retries})")
+            time.sleep(delay)
+
+        result = PageResult(url, status, rows, error, total_attempts, time.monotonic() - start, any_hedged,
+                            columns=self.columns)
+        if not result.ok:
+            print(f"   ❗ {url}: {status}{f' ({error})' if error else ''}")
+        return result
+
+    def run_many(self, urls):
+        """
+        URL 목록을 순서대로 실행
+        Args:
+            urls (list): URL 목록
+        Returns:
+            list: PageResult 리스트
+        """
+        return [self.run(url) for url in urls]
+
+    def close(self):
+        """사용 중인 크롤러 종료"""
+        if self.crawler is not None:
+            self.crawler.close()
+            self.crawler = None
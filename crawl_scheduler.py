@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+호스트별 크롤링 예절(politeness) 스케줄러
+호스트별 동시 실행 수 제한, 토큰 버킷 요청 속도 제한, robots.txt Crawl-delay를 지키고
+응답이 느리거나 오류가 나면 속도를 줄이고 정상이면 다시 늘리는 적응형 스케줄러
+"""
+
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
+from urllib.robotparser import RobotFileParser
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def parse_crawl_delay(lines, user_agent):
+    """
+    robots.txt의 Crawl-delay 읽기 (urllib.robotparser는 정수가 아닌 값(예: 0.5)을 무시하므로 직접 파싱)
+    User-agent 그룹이 user_agent와 맞는 값을 우선하고, 없으면 '*' 그룹 값을 사용
+    Args:
+        lines (list): robots.txt 줄 목록
+        user_agent (str): User-Agent
+    Returns:
+        float: Crawl-delay (초, 없으면 None)
+    """
+    agent = user_agent.split('/')[0].lower()
+    specific = default = None
+    group = []
+    in_rules = False
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        key, value = (part.strip() for part in line.split(':', 1))
+        key = key.lower()
+        if key == 'user-agent':
+            if in_rules:
+                group = []
+                in_rules = False
+            group.append(value.lower())
+            continue
+        in_rules = True
+        if key != 'crawl-delay':
+            continue
+        try:
+            delay = float(value)
+        except ValueError:
+            continue
+        if delay < 0:
+            continue
+        for token in group:
+            if token == '*':
+                default = delay if default is None else default
+            elif token in agent and specific is None:
+                specific = delay
+    return specific if specific is not None else default
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 (초당 rate개, 최대 capacity개까지 누적)"""
+
+    def __init__(self, rate, capacity):
+        """
+        초기화
+        Args:
+            rate (float): 초당 허용 요청 수
+            capacity (float): 최대 누적 토큰 수 (순간 허용 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """
+        토큰 하나 사용 (없으면 생길 때까지 대기)
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def set_rate(self, rate):
+        """속도 변경 (누적된 토큰은 유지)"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+
+class HostState:
+    """호스트 하나의 스케줄링 상태"""
+
+    def __init__(self, host, limit, rate, burst):
+        self.host = host
+        self.limit = float(limit)  # 적응형 동시 실행 한도 (소수점은 누적용)
+        self.active = 0
+        self.rate = rate
+        self.bucket = TokenBucket(rate, burst)
+        self.condition = threading.Condition()
+        self.robots = None
+        self.robots_ready = threading.Event()  # robots.txt 확인 완료 (다른 스레드는 완료까지 대기)
+        self.crawl_delay = None
+        self.completed = 0
+        self.errors = 0
+
+
+class PolitenessScheduler:
+    """
+    호스트별 크롤링 예절 스케줄러
+
+    - 호스트별 동시 실행 수 한도 (1 ~ max_concurrency 사이에서 자동 조절)
+    - 호스트별 토큰 버킷 속도 제한 (robots.txt Crawl-delay가 있으면 그 이하로 제한)
+    - 느린 응답/오류 시 한도와 속도를 줄이고(곱셈 감소), 정상 응답이면 조금씩 늘림(덧셈 증가)
+    """
+
+    def __init__(self, max_concurrency=4, initial_concurrency=2, rate=1.0, min_rate=0.1, max_rate=4.0,
+                 burst=2, slow_seconds=15.0, backoff=0.5, increase=0.25,
+                 respect_robots=True, user_agent=DEFAULT_USER_AGENT, robots_timeout=10):
+        """
+        초기화
+        Args:
+            max_concurrency (int): 호스트별 최대 동시 실행 수
+            initial_concurrency (int): 호스트별 시작 동시 실행 수
+            rate (float): 호스트별 시작 요청 속도 (초당)
+            min_rate (float): 최소 요청 속도 (초당)
+            max_rate (float): 최대 요청 속도 (초당)
+            burst (int): 토큰 버킷 크기
+            slow_seconds (float): 이 시간보다 오래 걸린 페이지는 느린 응답으로 간주
+            backoff (float): 느린 응답/오류 시 한도와 속도에 곱할 값
+            increase (float): 정상 응답 시 동시 실행 한도 증가량
+            respect_robots (bool): robots.txt(Disallow, Crawl-delay) 준수 여부
+            user_agent (str): robots.txt 확인에 사용할 User-Agent
+            robots_timeout (int): robots.txt 요청 타임아웃 (초)
+        """
+        self.max_concurrency = max_concurrency
+        self.initial_concurrency = min(initial_concurrency, max_concurrency)
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.slow_seconds = slow_seconds
+        self.backoff = backoff
+        self.increase = increase
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.robots_timeout = robots_timeout
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def host_state(self, url):
+        """URL의 호스트 상태 (처음이면 생성하고 robots.txt 확인)"""
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        with self.lock:
+            state = self.hosts.get(host)
+            created = state is None
+            if created:
+                state = HostState(host, self.initial_concurrency, self.rate, self.burst)
+                self.hosts[host] = state
+
+        # robots.txt는 전체 잠금 밖에서 읽음 (느린 호스트가 다른 호스트를 막지 않도록)
+        if created:
+            try:
+                if self.respect_robots:
+                    self._load_robots(state, f"{parsed.scheme or 'https'}://{parsed.netloc}/robots.txt")
+            finally:
+                state.robots_ready.set()
+        else:
+            state.robots_ready.wait()
+        return state
+
+    def _load_robots(self, state, robots_url):
+        """robots.txt 읽기 (없거나 실패하면 제한 없음)"""
+        robots = RobotFileParser(robots_url)
+        try:
+            request = Request(robots_url, headers={'User-Agent': self.user_agent})
+            with urlopen(request, timeout=self.robots_timeout) as response:
+                lines = response.read().decode('utf-8', errors='replace').splitlines()
+            robots.parse(lines)
+        except HTTPError as e:
+            if e.code not in (401, 403):
+                return
+            robots.disallow_all = True
+        except (URLError, OSError, ValueError) as e:
+            print(f"   ⚠️  robots.txt 확인 실패 ({robots_url}): {str(e)}")
+            return
+
+        state.robots = robots
+        delay = parse_crawl_delay(lines, self.user_agent)
+        if delay:
+            state.crawl_delay = float(delay)
+            state.rate = min(state.rate, 1.0 / state.crawl_delay)
+            state.bucket = TokenBucket(state.rate, 1)
+            print(f"   🤖 {state.host} Crawl-delay: {state.crawl_delay}초")
+
+    def allowed(self, url):
+        """robots.txt 기준 크롤링 허용 여부"""
+        state = self.host_state(url)
+        return state.robots is None or state.robots.can_fetch(self.user_agent, url)
+
+    @contextmanager
+    def slot(self, url):
+        """
+        호스트 슬롯 획득 (동시 실행 한도 + 속도 제한)
+        블록 안의 실행 시간과 예외 여부로 속도를 자동 조절합니다.
+
+        사용 예:
+            with scheduler.slot(url):
+                results = crawler.crawl_page(url)  # 실패 시 예외가 전달되어야 오류로 기록됨
+        """
+        state = self.host_state(url)
+        with state.condition:
+            while state.active >= max(1, int(state.limit)):
+                state.condition.wait()
+            state.active += 1
+
+        try:
+            state.bucket.acquire()
+            start = time.monotonic()
+            ok = False
+            try:
+                yield state
+                ok = True
+            finally:
+                self.report(state, time.monotonic() - start, ok)
+        finally:
+            with state.condition:
+                state.active -= 1
+                state.condition.notify_all()
+
+    def report(self, state, elapsed, ok):
+        """
+        페이지 결과를 반영하여 호스트 한도/속도 조절
+        Args:
+            state (HostState): 호스트 상태
+            elapsed (float): 페이지 처리 시간 (초)
+            ok (bool): 성공 여부
+        """
+        max_rate = self.max_rate
+        if state.crawl_delay:
+            max_rate = min(max_rate, 1.0 / state.crawl_delay)
+
+        with state.condition:
+            state.completed += 1
+            if not ok or elapsed > self.slow_seconds:
+                if not ok:
+                    state.errors += 1
+                state.limit = max(1.0, state.limit * self.backoff)
+                state.rate = max(self.min_rate, state.rate * self.backoff)
+                reason = "오류" if not ok else f"느린 응답 {elapsed:.1f}초"
+                print(f"   🐢 {state.host} 속도 감소 ({reason}): 동시 {int(state.limit)}개 / {state.rate:.2f}회/초")
+            else:
+                state.limit = min(float(self.max_concurrency), state.limit + self.increase)
+                state.rate = min(max_rate, state.rate * (1 + self.increase))
+            state.condition.notify_all()
+        state.bucket.set_rate(state.rate)
+
+    def run(self, urls, task, workers=8):
+        """
+        URL 목록을 스케줄러를 거쳐 병렬 실행
+        Args:
+            urls (list): URL 목록
+            task (callable): task(url) -> 결과 (예외 발생 시 오류로 간주)
+            workers (int): 작업 스레드 수 (호스트별 한도는 스케줄러가 적용)
+        Returns:
+            list: URL 목록과 같은 순서의 결과 (robots.txt로 제외되거나 실패한 URL은 None).
+                  같은 URL이 여러 번 있으면 각각 따로 실행합니다.
+        """
+        def run_one(url):
+            if self.respect_robots and not self.allowed(url):
+                print(f"   🚫 robots.txt에 의해 제외: {url}")
+                return None
+            try:
+                with self.slot(url):
+                    return task(url)
+            except Exception as e:
+                print(f"   ❌ 실패 ({url}): {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_one, urls))
+
+    def crawl_many(self, urls, crawler_factory=None, workers=4):
+        """
+        여러 URL을 작업 스레드별 크롤러로 병렬 크롤링
+        Args:
+            urls (list): URL 목록
+            crawler_factory (callable): 크롤러 생성 함수 (None이면 ComponentCrawler())
+            workers (int): 작업 스레드 수 (= 최대 Chrome 인스턴스 수)
+        Returns:
+            list: 모든 페이지의 결과 딕셔너리 리스트 (URL 목록 순서)
+        """
+        if crawler_factory is None:
+            from component_crawler import ComponentCrawler
+            crawler_factory = ComponentCrawler
+
+        local = threading.local()
+        crawlers = []
+        crawlers_lock = threading.Lock()
+
+        def crawl(url):
+            crawler = getattr(local, 'crawler', None)
+            if crawler is None:
+                crawler = crawler_factory()
+                local.crawler = crawler
+                with crawlers_lock:
+                    crawlers.append(crawler)
+            # crawl_page는 실패 시 예외를 전달하므로 slot()이 오류로 기록하여 속도를 줄임
+            return crawler.crawl_page(url)
+
+        try:
+            results = self.run(urls, crawl, workers=workers)
+        finally:
+            for crawler in crawlers:
+                crawler.close()
+
+        rows = []
+        for result in results:
+            rows.extend(result or [])
+        return rows
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """대역 서버 핸들러 (server.stand_in에 StandInServer)"""
+
+    def do_GET(self):
+        stand_in = self.server.stand_in
+        if self.path == '/robots.txt':
+            body = "User-agent: *\nDisallow: /private/\n"
+            if stand_in.crawl_delay:
+                body += f"Crawl-delay: {stand_in.crawl_delay}\n"
+            self._send(200, body, 'text/plain')
+            return
+
+        stand_in.enter()
+        try:
+            time.sleep(stand_in.latency)
+            if stand_in.random.random() < stand_in.error_rate:
+                stand_in.errors += 1
+                self._send(stand_in.error_status, "Service Unavailable", 'text/plain')
+                return
+            self._send(200, f'<html><body><div class="co76-feature-kv">{self.path}</div></body></html>', 'text/html')
+        finally:
+            stand_in.leave()
+
+    def _send(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer:
+    """
+    스케줄러 확인용 로컬 대역 서버
+    latency, error_rate, crawl_delay는 실행 중에도 바꿀 수 있으며,
+    요청 수와 최대 동시 요청 수를 기록하여 호스트별 한도가 지켜지는지 확인할 수 있습니다.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, crawl_delay=None, error_status=503, port=0, seed=None):
+        """
+        초기화
+        Args:
+            latency (float): 페이지 응답 지연 (초)
+            error_rate (float): 오류 응답 비율 (0.0 ~ 1.0)
+            crawl_delay (float): robots.txt Crawl-delay (None이면 없음)
+            error_status (int): 오류 응답 상태 코드 (예: 503, 429)
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            seed (int): 오류 발생 난수 시드
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.crawl_delay = crawl_delay
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), StandInHandler)
+        self.server.daemon_threads = True
+        self.server.stand_in = self
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def enter(self):
+        with self.lock:
+            self.requests += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+    def start(self):
+        """백그라운드 스레드에서 서버 실행"""
+        self.thread = threading.Thread(target=self.server.serve_forever, name="stand-in-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def fetch_status(url, timeout=30):
+    """
+    HTTP GET 후 본문 길이 반환 (브라우저 없이 스케줄러를 확인하는 작업 함수, 오류 응답은 예외)
+    Args:
+        url (str): URL
+        timeout (float): 타임아웃 (초)
+    Returns:
+        int: 본문 길이
+    """
+    with urlopen(Request(url, headers={'User-Agent': DEFAULT_USER_AGENT}), timeout=timeout) as response:
+        return len(response.read())
+
+
+def main():
+    """
+    대역 서버에 지연/오류를 주입하여 스케줄러 동작 확인 (브라우저 불필요)
+    사용법: python crawl_scheduler.py [페이지 수] [지연(초)] [오류 비율] [Crawl-delay]
+    """
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    error_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    crawl_delay = float(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    with StandInServer(latency=latency, error_rate=error_rate, crawl_delay=crawl_delay, seed=0) as stand_in:
+        scheduler = PolitenessScheduler(max_concurrency=4, rate=2.0, max_rate=10.0, slow_seconds=max(1.0, latency * 4))
+        urls = [f"{stand_in.url}/page/{i}" for i in range(pages)] + [f"{stand_in.url}/private/0"]
+        start = time.monotonic()
+        results = scheduler.run(urls, fetch_status, workers=8)
+        elapsed = time.monotonic() - start
+
+        ok = sum(1 for result in results if result is not None)
+        print(f"🏁 {len(urls)}개 URL / {elapsed:.1f}초 / 성공 {ok}개")
+        print(f"   └ 서버 요청 {stand_in.requests}회 / 오류 응답 {stand_in.errors}회 / 최대 동시 요청 {stand_in.max_active}개")
+        for state in scheduler.hosts.values():
+            print(f"   └ {state.host}: 동시 한도 {int(state.limit)}개 / {state.rate:.2f}회/초 "
+                  f"(완료 {state.completed}, 오류 {state.errors})")
+
+
+if __name__ == "__main__":
+    main()
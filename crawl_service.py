@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+로컬 크롤링 서비스 (HTTP/JSON)
+크롤링 작업(job)을 받아 공유된 크롤러 풀(최대 Chrome 인스턴스 수 제한)에서 실행하고,
+작업 상태와 결과 행을 HTTP로 제공
+
+API:
+    POST   /jobs             {"urls": [...]} -> 작업 생성 (202)
+    GET    /jobs             작업 목록
+    GET    /jobs/<id>        작업 상태
+    GET    /jobs/<id>/rows   결과 행 (NDJSON, 작업이 끝날 때까지 이어서 전송, ?follow=0이면 현재까지만)
+    DELETE /jobs/<id>        남은 URL 취소
+"""
+
+import itertools
+import json
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_CANCELLED = 'cancelled'
+
+
+class QueueFullError(Exception):
+    """대기 중인 URL이 너무 많아 작업을 받을 수 없음"""
+
+
+class CrawlJob:
+    """크롤링 작업 하나 (URL 목록)"""
+
+    def __init__(self, job_id, urls):
+        self.id = job_id
+        self.urls = list(urls)
+        self.status = JOB_QUEUED
+        self.rows = []
+        self.completed = 0
+        self.queued = 0  # 아직 큐에서 꺼내지 않은 URL 수 (CrawlService.lock으로 보호)
+        self.errors = []
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.condition = threading.Condition()
+
+    @property
+    def finished_or_cancelled(self):
+        return self.status in (JOB_DONE, JOB_CANCELLED)
+
+    def record(self, url, rows, error=None):
+        """URL 하나의 결과 반영"""
+        with self.condition:
+            self.rows.extend(rows)
+            self.completed += 1
+            if error:
+                self.errors.append({'url': url, 'error': error})
+            if self.completed >= len(self.urls) and self.status != JOB_CANCELLED:
+                self.status = JOB_DONE
+                self.finished = time.time()
+            self.condition.notify_all()
+
+    def cancel(self):
+        """남은 URL 취소 (실행 중인 URL은 끝까지 실행)"""
+        with self.condition:
+            if not self.finished_or_cancelled:
+                self.status = JOB_CANCELLED
+                self.finished = time.time()
+            self.condition.notify_all()
+
+    def follow_rows(self, start=0, follow=True, poll=1.0):
+        """
+        결과 행을 순서대로 반환 (follow이면 작업이 끝날 때까지 새 행을 기다림)
+        Args:
+            start (int): 시작 행 위치
+            follow (bool): 작업 종료까지 대기 여부
+            poll (float): 대기 간격 (초)
+        Returns:
+            generator: 결과 딕셔너리
+        """
+        position = start
+        while True:
+            with self.condition:
+                while follow and position >= len(self.rows) and not self.finished_or_cancelled:
+                    self.condition.wait(poll)
+                rows = self.rows[position:]
+                done = self.finished_or_cancelled or not follow
+            yield from rows
+            position += len(rows)
+            if done and position >= len(self.rows):
+                return
+
+    def summary(self):
+        """작업 상태 딕셔너리"""
+        with self.condition:
+            return {
+                'id': self.id,
+                'status': self.status,
+                'urls': len(self.urls),
+                'completed': self.completed,
+                'rows': len(self.rows),
+                'errors': list(self.errors),
+                'created': self.created,
+                'started': self.started,
+                'finished': self.finished,
+            }
+
+
+class CrawlService:
+    """
+    크롤링 작업 큐 + 공유 크롤러 풀
+
+    작업의 URL은 하나의 큐에 들어가고, workers개의 작업 스레드가 각자 크롤러(Chrome)를
+    하나씩 유지하며 처리합니다. 여러 클라이언트가 같은 브라우저를 재사용하므로
+    Chrome 인스턴스 수는 workers개를 넘지 않습니다.
+    """
+
+    def __init__(self, workers=2, crawler_factory=None, max_pending=1000, max_finished_jobs=100):
+        """
+        초기화
+        Args:
+            workers (int): 작업 스레드 수 (= 최대 Chrome 인스턴스 수)
+            crawler_factory (callable): 크롤러 생성 함수 (None이면 ComponentCrawler())
+            max_pending (int): 대기 가능한 최대 URL 수
+            max_finished_jobs (int): 보관할 완료 작업 수 (넘으면 오래된 작업부터 삭제)
+        """
+        if crawler_factory is None:
+            from component_crawler import ComponentCrawler
+            crawler_factory = ComponentCrawler
+        self.crawler_factory = crawler_factory
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_finished_jobs = max_finished_jobs
+        self.tasks = queue.Queue()
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.threads = []
+        self.crawlers = {}
+        self.busy = 0
+
+    def start(self):
+        """작업 스레드 시작"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, args=(index,), name=f"crawl-worker-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self):
+        """작업 스레드 종료 및 크롤러 종료 (실행 중인 URL은 끝까지 실행, 대기 중인 URL의 작업은 취소)"""
+        # 종료 표시(None)는 큐 맨 뒤에 들어가므로, 먼저 대기 중인 URL을 비우고 해당 작업을 취소
+        cancelled = {}
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is None:
+                continue
+            job, _ = task
+            with self.lock:
+                job.queued -= 1
+            cancelled[job.id] = job
+        for job in cancelled.values():
+            job.cancel()
+        if cancelled:
+            print(f"🛑 대기 중인 작업 {len(cancelled)}개 취소")
+
+        for _ in self.threads:
+            self.tasks.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def submit(self, urls):
+        """
+        작업 생성
+        Args:
+            urls (list): URL 목록
+        Returns:
+            CrawlJob: 생성된 작업
+        Raises:
+            QueueFullError: 대기 중인 URL이 max_pending을 넘는 경우
+        """
+        with self.lock:
+            pending = self._pending()
+            if pending + len(urls) > self.max_pending:
+                raise QueueFullError(f"대기 중인 URL이 너무 많습니다 ({pending}/{self.max_pending})")
+            job = CrawlJob(str(next(self.ids)), urls)
+            job.queued = len(urls)
+            self.jobs[job.id] = job
+            self._trim_jobs()
+        if not urls:
+            job.status = JOB_DONE
+            job.finished = time.time()
+        for url in urls:
+            self.tasks.put((job, url))
+        print(f"📥 작업 {job.id}: {len(urls)}개 URL")
+        return job
+
+    def _pending(self):
+        """대기 중인 URL 수 (취소된 작업의 URL은 큐에 남아 있어도 제외, self.lock 안에서 호출)"""
+        return sum(job.queued for job in self.jobs.values() if job.status != JOB_CANCELLED)
+
+    def _trim_jobs(self):
+        """오래된 완료 작업 삭제"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished_or_cancelled]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """작업 상태 목록"""
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return [job.summary() for job in jobs]
+
+    def status(self):
+        """서비스 상태 (대기 URL 수, 실행 중인 작업 스레드 수)"""
+        with self.lock:
+            return {'workers': self.workers, 'busy': self.busy, 'pending': self._pending(), 'jobs': len(self.jobs)}
+
+    def _work(self, index):
+        """작업 스레드: 큐에서 URL을 꺼내 이 스레드의 크롤러로 실행"""
+        crawler = None
+        try:
+            while True:
+                task = self.tasks.get()
+                if task is None:
+                    return
+                job, url = task
+                with self.lock:
+                    job.queued -= 1
+                if job.status == JOB_CANCELLED:
+                    continue
+
+                with job.condition:
+                    if job.status == JOB_QUEUED:
+                        job.status = JOB_RUNNING
+                        job.started = time.time()
+
+                if crawler is None:
+                    crawler = self.crawler_factory()
+                    self.crawlers[index] = crawler
+
+                with self.lock:
+                    self.busy += 1
+                try:
+                    rows = crawler.crawl_page(url)
+                    job.record(url, rows)
+                except Exception as e:
+                    print(f"   ❌ 작업 {job.id} 실패 ({url}): {str(e)}")
+                    job.record(url, [], error=str(e))
+                finally:
+                    with self.lock:
+                        self.busy -= 1
+        finally:
+            if crawler is not None:
+                crawler.close()
+                self.crawlers.pop(index, None)
+
+
+class CrawlRequestHandler(BaseHTTPRequestHandler):
+    """크롤링 서비스 HTTP 핸들러 (server.service에 CrawlService)"""
+
+    server_version = 'ComponentCrawlService/1.0'
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        """경로를 (작업 ID, 하위 경로)로 분리"""
+        parts = [part for part in urlparse(self.path).path.split('/') if part]
+        if not parts or parts[0] != 'jobs':
+            return None
+        return (parts[1] if len(parts) > 1 else None), (parts[2] if len(parts) > 2 else None)
+
+    def do_GET(self):
+        service = self.server.service
+        if urlparse(self.path).path.rstrip('/') in ('', '/status'):
+            self._send_json(200, service.status())
+            return
+
+        route = self._route()
+        if route is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+        job_id, sub = route
+        if job_id is None:
+            self._send_json(200, {'jobs': service.list_jobs()})
+            return
+
+        job = service.get(job_id)
+        if job is None:
+            self._send_json(404, {'error': f'job {job_id} not found'})
+        elif sub is None:
+            self._send_json(200, job.summary())
+        elif sub == 'rows':
+            self._stream_rows(job)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def _stream_rows(self, job):
+        """결과 행을 NDJSON으로 전송 (연결 종료로 끝을 알림)"""
+        query = parse_qs(urlparse(self.path).query)
+        follow = query.get('follow', ['1'])[0] not in ('0', 'false')
+        try:
+            start = int(query.get('start', ['0'])[0])
+            if start < 0:
+                raise ValueError
+        except ValueError:
+            self._send_json(400, {'error': "'start'는 0 이상의 정수여야 합니다"})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        try:
+            for row in job.follow_rows(start=start, follow=follow):
+                self.wfile.write(json.dumps(row, ensure_ascii=False).encode('utf-8') + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 중간에 연결을 끊음
+            pass
+        self.close_connection = True
+
+    def do_POST(self):
+        route = self._route()
+        if route is None or route[0] is not None:
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            urls = payload.get('urls') or ([payload['url']] if payload.get('url') else [])
+            if not isinstance(urls, list) or not all(isinstance(url, str) and url for url in urls):
+                raise ValueError("'urls'는 URL 문자열 목록이어야 합니다")
+        except (ValueError, AttributeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        try:
+            job = self.server.service.submit(urls)
+        except QueueFullError as e:
+            self._send_json(503, {'error': str(e)})
+            return
+        self._send_json(202, job.summary())
+
+    def do_DELETE(self):
+        route = self._route()
+        job = self.server.service.get(route[0]) if route and route[0] else None
+        if job is None:
+            self._send_json(404, {'error': 'not found'})
+            return
+        job.cancel()
+        self._send_json(200, job.summary())
+
+    def log_message(self, format, *args):
+        # 요청마다 출력하지 않음 (작업 단위로 출력)
+        pass
+
+
+def serve(service, host='127.0.0.1', port=8765):
+    """
+    HTTP 서버 생성 (serve_forever()로 실행)
+    Args:
+        service (CrawlService): 크롤링 서비스
+        host (str): 바인드 주소 (기본값: 로컬 전용)
+        port (int): 포트
+    Returns:
+        ThreadingHTTPServer: 서버
+    """
+    server = ThreadingHTTPServer((host, port), CrawlRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main():
+    """
+    크롤링 서비스 실행
+    사용법: python crawl_service.py [포트] [작업 스레드 수]
+    """
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+
+    service = CrawlService(workers=workers)
+    service.start()
+    server = serve(service, port=port)
+    print(f"🌐 크롤링 서비스 시작: http://127.0.0.1:{port} (Chrome 최대 {workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  서비스 종료 중...")
+    finally:
+        server.server_close()
+        service.stop()
+
+
+if __name__ == "__main__":
+    main()
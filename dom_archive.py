@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+렌더링된 DOM 아카이브
+크롤링 시 렌더링된 DOM(계산된 display 상태 포함)을 압축하여 내용 주소 방식으로 저장하고,
+브라우저 없이 저장된 DOM에서 컴포넌트를 다시 추출하는 모듈
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from html.parser import HTMLParser
+
+from component_core import ComponentClassifier
+
+# 크롤링 시 계산된 display 값을 기록하는 속성 (DIV_SNAPSHOT_SCRIPT 참고)
+DISPLAY_ATTRIBUTE = 'data-cc-display'
+
+# display 속성이 없는 HTML(직접 저장한 페이지 등)에서 사용하는 인라인 스타일 확인
+INLINE_DISPLAY_NONE = re.compile(r'display\s*:\s*none', re.IGNORECASE)
+
+
+class DivSnapshotParser(HTMLParser):
+    """HTML에서 div의 (class 속성, 표시 여부)를 문서 순서대로 수집하는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.records = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'div':
+            return
+        attributes = dict(attrs)
+        display = attributes.get(DISPLAY_ATTRIBUTE)
+        if display is not None:
+            is_displayed = display != 'none'
+        else:
+            is_displayed = not INLINE_DISPLAY_NONE.search(attributes.get('style') or '')
+        self.records.append((attributes.get('class') or '', is_displayed))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_div_records(html):
+    """
+    HTML에서 div 정보 추출
+    Args:
+        html (str): HTML 문자열
+    Returns:
+        list: (class 속성 문자열, 표시 여부) 튜플 리스트
+    """
+    parser = DivSnapshotParser()
+    parser.feed(html)
+    parser.close()
+    return parser.records
+
+
+class DomArchive:
+    """
+    내용 주소(content-addressed) 방식 DOM 저장소
+
+    구조:
+        <root>/objects/<해시 앞 2자리>/<sha256>.html.gz  - 압축된 DOM (같은 내용은 한 번만 저장)
+        <root>/index.jsonl                             - URL별 저장 기록 (한 줄에 하나)
+    """
+
+    def __init__(self, root='dom_archive'):
+        """
+        초기화
+        Args:
+            root (str): 아카이브 디렉토리
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.index_path = os.path.join(root, 'index.jsonl')
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def object_path(self, digest):
+        """DOM 해시에 해당하는 저장 파일 경로"""
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.html.gz")
+
+    def store(self, url, html, site_code, page_type):
+        """
+        렌더링된 DOM 저장
+        Args:
+            url (str): URL
+            html (str): DOM (outerHTML)
+            site_code (str): Site Code
+            page_type (str): Page Type
+        Returns:
+            str: 저장된 DOM의 sha256 해시
+        """
+        data = html.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, 'wb', compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        entry = {
+            'url': url,
+            'site_code': site_code,
+            'page_type': page_type,
+            'digest': digest,
+            'archived_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return digest
+
+    def load(self, digest):
+        """
+        저장된 DOM 읽기
+        Args:
+            digest (str): sha256 해시
+        Returns:
+            str: DOM (outerHTML)
+        """
+        with gzip.open(self.object_path(digest), 'rb') as f:
+            return f.read().decode('utf-8')
+
+    def entries(self, latest_only=True):
+        """
+        저장 기록 목록
+        Args:
+            latest_only (bool): URL별 가장 최근 기록만 반환할지 여부
+        Returns:
+            list: 저장 기록 딕셔너리 리스트
+        """
+        if not os.path.exists(self.index_path):
+            return []
+
+        entries = []
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entries.append(json.loads(line))
+
+        if not latest_only:
+            return entries
+        latest = {}
+        for entry in entries:
+            latest[entry['url']] = entry
+        return list(latest.values())
+
+
+def extract_from_html(html, url, site_code, page_type, classifier):
+    """
+    저장된 DOM에서 컴포넌트 추출 (crawl_divs와 같은 결과 형식)
+    Args:
+        html (str): DOM (outerHTML)
+        url (str): URL
+        site_code (str): Site Code
+        page_type (str): Page Type
+        classifier (ComponentClassifier): 분류기 (ComponentCrawler도 사용 가능, 드라이버 불필요)
+    Returns:
+        list: 결과 딕셔너리 리스트
+    """
+    components_data, _ = classifier.collect_components(parse_div_records(html), site=url)
+    return classifier.build_results(components_data, site_code, page_type, url)
+
+
+def reextract_archive(archive, classifier=None):
+    """
+    아카이브 전체를 브라우저 없이 다시 분석
+    Args:
+        archive (DomArchive): DOM 저장소
+        classifier (ComponentClassifier): 분류기 (None이면 기본 규칙)
+    Returns:
+        list: 모든 페이지의 결과 딕셔너리 리스트
+    """
+    if classifier is None:
+        classifier = ComponentClassifier()
+
+    results = []
+    for entry in archive.entries():
+        html = archive.load(entry['digest'])
+        results.extend(extract_from_html(html, entry['url'], entry['site_code'], entry['page_type'], classifier))
+    return results
+
+
+def main():
+    """
+    아카이브 재분석 실행
+    사용법: python dom_archive.py [아카이브 디렉토리] [저장 파일(.xlsx)]
+    """
+    import time
+    from excel_export import write_excel_streaming
+
+    root = sys.argv[1] if len(sys.argv) > 1 else 'dom_archive'
+    output = sys.argv[2] if len(sys.argv) > 2 else f"archive_components_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+    archive = DomArchive(root)
+    start = time.perf_counter()
+    results = reextract_archive(archive)
+    elapsed = time.perf_counter() - start
+    print(f"📊 {len(archive.entries())}개 페이지에서 {len(results)}개 컴포넌트 추출 ({elapsed:.2f}초)")
+
+    if results:
+        write_excel_streaming(results, output)
+        print(f"✅ 파일 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
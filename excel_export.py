@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+크롤링 결과 내보내기
+openpyxl write-only 모드로 행을 바로 기록하는 저메모리 엑셀 저장 모듈
+"""
+
+import csv
+import re
+import sys
+import time
+import tracemalloc
+
+# 엑셀 시트당 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1048576
+
+# 시트 이름 제한 (최대 31자, 일부 특수문자 불가)
+SHEET_NAME_MAX_LENGTH = 31
+SHEET_NAME_INVALID_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+DEFAULT_SHEET_NAME = 'Components'
+
+
+def _sheet_title(value, used_titles):
+    """
+    시트 이름 생성 (엑셀 규칙에 맞게 정리하고 중복 방지)
+    Args:
+        value: 시트 분리 기준 값 (예: Site Code)
+        used_titles (set): 이미 사용한 시트 이름 (소문자)
+    Returns:
+        str: 시트 이름
+    """
+    base = SHEET_NAME_INVALID_CHARS.sub('_', str(value) if value not in (None, '') else 'Unknown').strip("' ")
+    base = base[:SHEET_NAME_MAX_LENGTH] or 'Unknown'
+
+    title = base
+    suffix = 2
+    while title.lower() in used_titles:
+        tail = f" ({suffix})"
+        title = base[:SHEET_NAME_MAX_LENGTH - len(tail)] + tail
+        suffix += 1
+    used_titles.add(title.lower())
+    return title
+
+
+def write_excel_streaming(rows, target, split_by=None, columns=None):
+    """
+    write-only 모드로 엑셀 저장 (행 수와 관계없이 메모리 사용량 일정)
+    Args:
+        rows (iterable): 결과 딕셔너리 (제너레이터 가능)
+        target (str | file-like): 저장 경로 또는 BytesIO
+        split_by (str): 시트를 나눌 컬럼 (예: 'Site Code', 'Page Type'), None이면 단일 시트
+        columns (list): 컬럼 순서 (None이면 첫 행의 키 순서)
+    Returns:
+        dict: 저장 결과 (rows: 행 수, sheets: 시트 이름 목록)
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    used_titles = set()
+    # 분리 기준 값 -> [현재 시트, 현재 시트 행 수, 기본 시트 이름]
+    sheets = {}
+    sheet_titles = []
+    row_count = 0
+
+    for row in rows:
+        if columns is None:
+            columns = list(row.keys())
+
+        key = row.get(split_by) if split_by else DEFAULT_SHEET_NAME
+        state = sheets.get(key)
+
+        # 시트가 없거나 최대 행 수를 넘으면 새 시트 생성 (예: "UK", "UK (2)")
+        if state is None or state[1] >= EXCEL_MAX_ROWS:
+            title = _sheet_title(key if state is None else state[2], used_titles)
+            worksheet = workbook.create_sheet(title=title)
+            worksheet.append(columns)
+            state = [worksheet, 1, state[2] if state else title]
+            sheets[key] = state
+            sheet_titles.append(title)
+
+        state[0].append([row.get(column) for column in columns])
+        state[1] += 1
+        row_count += 1
+
+    if not sheet_titles:
+        worksheet = workbook.create_sheet(title=DEFAULT_SHEET_NAME)
+        if columns:
+            worksheet.append(columns)
+        sheet_titles.append(DEFAULT_SHEET_NAME)
+
+    workbook.save(target)
+    return {'rows': row_count, 'sheets': sheet_titles}
+
+
+def write_excel_pandas(rows, target, split_by=None, columns=None):
+    """
+    기존 방식(pandas DataFrame + openpyxl)으로 엑셀 저장 (비교용)
+    Args:
+        rows (iterable): 결과 딕셔너리
+        target (str | file-like): 저장 경로 또는 BytesIO
+        split_by (str): 시트를 나눌 컬럼 (None이면 단일 시트)
+        columns (list): 컬럼 순서
+    Returns:
+        dict: 저장 결과 (rows: 행 수, sheets: 시트 이름 목록)
+    """
+    import pandas as pd
+
+    df = pd.DataFrame(list(rows), columns=columns)
+    used_titles = set()
+    sheet_titles = []
+
+    with pd.ExcelWriter(target, engine='openpyxl') as writer:
+        if split_by and split_by in df.columns and len(df) > 0:
+            for key, group in df.groupby(split_by, sort=False):
+                title = _sheet_title(key, used_titles)
+                group.to_excel(writer, index=False, sheet_name=title)
+                sheet_titles.append(title)
+        else:
+            df.to_excel(writer, index=False, sheet_name=DEFAULT_SHEET_NAME)
+            sheet_titles.append(DEFAULT_SHEET_NAME)
+
+    return {'rows': len(df), 'sheets': sheet_titles}
+
+
+def write_csv_streaming(rows, target, columns=None):
+    """
+    CSV 저장 (엑셀에서 한글이 깨지지 않도록 utf-8-sig)
+    Args:
+        rows (iterable): 결과 딕셔너리
+        target (str): 저장 경로
+        columns (list): 컬럼 순서
+    Returns:
+        dict: 저장 결과 (rows: 행 수)
+    """
+    row_count = 0
+    with open(target, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=columns or list(row.keys()), extrasaction='ignore')
+                writer.writeheader()
+            writer.writerow(row)
+            row_count += 1
+        if writer is None and columns:
+            csv.writer(f).writerow(columns)
+    return {'rows': row_count}
+
+
+def measure_export(export_fn, *args, measure_memory=False, **kwargs):
+    """
+    내보내기 함수 실행 시간과 최대 메모리 측정
+    Args:
+        export_fn (callable): write_excel_streaming 등 내보내기 함수
+        measure_memory (bool): tracemalloc으로 최대 메모리 측정 여부
+                               (측정 중에는 몇 배 느려지므로 시간은 측정하지 않은 실행 기준으로 비교)
+    Returns:
+        dict: 내보내기 결과 + seconds(소요 시간), peak_mb(최대 메모리, 측정하지 않으면 None)
+    """
+    started_tracing = measure_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    elif measure_memory:
+        tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    try:
+        stats = dict(export_fn(*args, **kwargs))
+        stats['seconds'] = time.perf_counter() - start
+        stats['peak_mb'] = tracemalloc.get_traced_memory()[1] / (1024 * 1024) if measure_memory else None
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return stats
+
+
+def format_export_stats(stats):
+    """내보내기 측정 결과를 출력용 문자열로 변환"""
+    text = f"⏱️ {stats['seconds']:.2f}초"
+    if stats.get('peak_mb') is not None:
+        text += f" / 최대 메모리 {stats['peak_mb']:.1f}MB"
+    return text
+
+
+def compare_export_paths(rows, split_by=None):
+    """
+    기존 openpyxl 경로와 스트리밍 경로의 시간/메모리 비교 (메모리 내 저장)
+    tracemalloc이 시간을 왜곡하므로 경로마다 시간 측정과 메모리 측정을 따로 실행합니다.
+    Args:
+        rows (list): 결과 딕셔너리
+        split_by (str): 시트를 나눌 컬럼
+    Returns:
+        dict: {'pandas': 측정 결과, 'streaming': 측정 결과}
+    """
+    import io
+
+    results = {}
+    for name, export_fn in (('pandas', write_excel_pandas), ('streaming', write_excel_streaming)):
+        stats = measure_export(export_fn, rows, io.BytesIO(), split_by=split_by)
+        traced = measure_export(export_fn, rows, io.BytesIO(), split_by=split_by, measure_memory=True)
+        stats['peak_mb'] = traced['peak_mb']
+        results[name] = stats
+    return results
+
+
+def main():
+    """
+    내보내기 경로 비교 실행
+    사용법: python excel_export.py [CSV 파일] [반복 횟수] [분리 컬럼]
+    """
+    source = sys.argv[1] if len(sys.argv) > 1 else 'samsung_components.csv'
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    split_by = sys.argv[3] if len(sys.argv) > 3 else None
+
+    with open(source, newline='', encoding='utf-8-sig') as f:
+        base_rows = list(csv.DictReader(f))
+    rows = base_rows * repeat
+
+    print(f"📊 {len(rows)}행 내보내기 비교 ({source} x {repeat})")
+    for name, stats in compare_export_paths(rows, split_by=split_by).items():
+        print(f"   └ {name}: {format_export_stats(stats)} (시트 {len(stats['sheets'])}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+변경 여부 사전 확인 (Conditional Fetch)
+브라우저를 띄우기 전에 ETag/Last-Modified 조건부 요청 또는 원본 HTML 해시로
+페이지 변경 여부를 확인하고, 변경이 없으면 이전 크롤링 결과를 재사용
+"""
+
+import hashlib
+import json
+import os
+from collections import namedtuple
+from datetime import datetime
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# unchanged: 변경 없음 여부, rows: 재사용할 이전 결과, validators: 이번 응답의 검증 정보
+PrecheckResult = namedtuple('PrecheckResult', ['unchanged', 'rows', 'validators'])
+
+
+class PageCache:
+    """
+    URL별 이전 크롤링 결과와 검증 정보(ETag, Last-Modified, HTML 해시) 저장소
+    JSON 파일 하나에 저장합니다.
+    """
+
+    def __init__(self, path='crawl_cache.json', timeout=10, user_agent=DEFAULT_USER_AGENT):
+        """
+        초기화
+        Args:
+            path (str): 캐시 파일 경로
+            timeout (int): 사전 확인 요청 타임아웃 (초)
+            user_agent (str): 사전 확인 요청 User-Agent
+        """
+        self.path = path
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """캐시 파일 읽기 (없거나 손상된 경우 빈 캐시)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️  캐시 파일을 읽을 수 없습니다 ({self.path}): {str(e)}")
+            self.entries = {}
+
+    def save(self):
+        """캐시 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.dirty or not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def precheck(self, url, config=None):
+        """
+        페이지 변경 여부 사전 확인
+        1. 이전 ETag/Last-Modified로 조건부 요청 -> 304면 변경 없음
+        2. 200이면 원본 HTML 해시를 이전 해시와 비교
+
+        Args:
+            url (str): 확인할 URL
+            config (str): 결과에 영향을 주는 크롤러 설정 (뷰포트, 네이밍 규칙 등).
+                          저장된 결과의 설정과 다르면 페이지가 같아도 재사용하지 않음
+        Returns:
+            PrecheckResult: 확인 결과 (요청 실패 시 변경된 것으로 간주)
+        """
+        entry = self.entries.get(url)
+        if entry and entry.get('config') != config:
+            entry = None
+        headers = {'User-Agent': self.user_agent}
+        if entry and entry.get('rows'):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            with urlopen(Request(url, headers=headers), timeout=self.timeout) as response:
+                body = response.read()
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'html_hash': hashlib.sha256(body).hexdigest(),
+                }
+        except HTTPError as e:
+            if e.code == 304 and entry and entry.get('rows'):
+                return PrecheckResult(True, entry['rows'], {
+                    'etag': e.headers.get('ETag') or entry.get('etag'),
+                    'last_modified': e.headers.get('Last-Modified') or entry.get('last_modified'),
+                    'html_hash': entry.get('html_hash'),
+                })
+            print(f"   ⚠️  사전 확인 실패 (HTTP {e.code})")
+            return PrecheckResult(False, None, None)
+        except (URLError, OSError, ValueError) as e:
+            print(f"   ⚠️  사전 확인 실패: {str(e)}")
+            return PrecheckResult(False, None, None)
+
+        if entry and entry.get('rows') and entry.get('html_hash') == validators['html_hash']:
+            return PrecheckResult(True, entry['rows'], validators)
+        return PrecheckResult(False, None, validators)
+
+    def store(self, url, rows, validators, config=None):
+        """
+        크롤링 결과 저장
+        Args:
+            url (str): URL
+            rows (list): crawl_divs 결과
+            validators (dict): precheck에서 받은 검증 정보
+            config (str): 결과를 만든 크롤러 설정 (precheck와 같은 값)
+        """
+        self.entries[url] = {
+            'etag': validators.get('etag'),
+            'last_modified': validators.get('last_modified'),
+            'html_hash': validators.get('html_hash'),
+            'crawled_at': datetime.now().isoformat(timespec='seconds'),
+            'config': config,
+            'rows': rows,
+        }
+        self.dirty = True
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+저장된 HTML 멀티코어 오프라인 추출
+HTML 파일 디렉토리(.html, .htm, .gz) 또는 DOM 아카이브를 프로세스 풀로 나누어
+분석하고, 결과를 표준 결과 형식(번호, Site Code, Page Type, URL, ...)으로 병합
+"""
+
+import gzip
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from component_core import ComponentClassifier
+from component_stats import ComponentUsageStats
+from dom_archive import DomArchive, parse_div_records
+
+HTML_EXTENSIONS = ('.html', '.htm', '.html.gz', '.htm.gz')
+
+# 저장된 HTML에서 원래 URL과 Page Type을 찾기 위한 패턴
+CANONICAL_PATTERN = re.compile(
+    r'<link[^>]+rel=["\']canonical["\'][^>]*href=["\']([^"\']+)["\']'
+    r'|<meta[^>]+property=["\']og:url["\'][^>]*content=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+PAGE_TRACK_PATTERN = re.compile(r'pageTrack["\']?\s*[:=]\s*["\']([^"\']+)["\']')
+
+# 작업 프로세스별 분류기 (프로세스 시작 시 한 번 생성)
+_worker_classifier = None
+
+
+def _init_worker(pattern_engine):
+    """작업 프로세스 초기화 (분류기만 사용하므로 selenium을 import하지 않음)"""
+    global _worker_classifier
+    _worker_classifier = ComponentClassifier(pattern_engine=pattern_engine)
+
+
+def _read_html(path):
+    """HTML 파일 읽기 (.gz 압축 파일 지원)"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        return f.read().decode('utf-8', errors='replace')
+
+
+def discover_tasks(source):
+    """
+    분석할 파일 목록 생성
+    Args:
+        source (str): HTML 디렉토리 또는 DOM 아카이브 디렉토리
+    Returns:
+        list: (파일 경로, URL, Site Code, Page Type) 튜플 리스트
+              URL 등이 None이면 HTML 내용에서 찾음
+    """
+    if os.path.exists(os.path.join(source, 'index.jsonl')):
+        archive = DomArchive(source)
+        return [
+            (archive.object_path(entry['digest']), entry['url'], entry['site_code'], entry['page_type'])
+            for entry in archive.entries()
+        ]
+
+    tasks = []
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower().endswith(HTML_EXTENSIONS):
+                tasks.append((os.path.join(root, file), None, None, None))
+    return tasks
+
+
+def extract_file(task, classifier):
+    """
+    HTML 파일 하나 분석
+    Args:
+        task (tuple): (파일 경로, URL, Site Code, Page Type)
+        classifier (ComponentClassifier): 분류기
+    Returns:
+        list: 결과 딕셔너리 리스트
+    """
+    path, url, site_code, page_type = task
+    html = _read_html(path)
+
+    if url is None:
+        found = CANONICAL_PATTERN.search(html)
+        url = (found.group(1) or found.group(2)) if found else f"file://{os.path.abspath(path)}"
+    if site_code is None:
+        site_code = classifier.extract_site_code(url) if not url.startswith('file://') else "UNKNOWN"
+    if page_type is None:
+        found = PAGE_TRACK_PATTERN.search(html)
+        page_type = found.group(1).title() if found else "Unknown"
+
+    components_data, _ = classifier.collect_components(parse_div_records(html), site=url)
+    return classifier.build_results(components_data, site_code, page_type, url)
+
+
+def _extract_shard(shard, with_usage=False):
+    """
+    작업 프로세스에서 파일 묶음(shard) 분석
+    with_usage가 True이면 묶음의 사용 통계(부분 집계)도 함께 반환
+    """
+    rows = []
+    failed = []
+    usage = ComponentUsageStats() if with_usage else None
+    for task in shard:
+        try:
+            page_rows = extract_file(task, _worker_classifier)
+        except Exception as e:
+            failed.append((task[0], str(e)))
+            continue
+        rows.extend(page_rows)
+        if usage is not None:
+            # 파일 하나 = 페이지 하나 (같은 canonical URL을 가진 파일도 각각 집계)
+            usage.add_page(page_rows)
+    return rows, len(shard), failed, usage.to_dict() if usage is not None else None
+
+
+def extract_parallel(source, workers=None, shard_size=32, pattern_engine=None, usage=None):
+    """
+    디렉토리 전체를 프로세스 풀로 분석 (파일 순서대로 결과를 하나씩 반환)
+    Args:
+        source (str): HTML 디렉토리 또는 DOM 아카이브 디렉토리
+        workers (int): 프로세스 수 (None이면 CPU 코어 수)
+        shard_size (int): 프로세스에 한 번에 넘길 최대 파일 수 (파일이 적으면 모든 프로세스가 일하도록 줄임)
+        pattern_engine (PatternEngine): 분류 규칙 (None이면 Samsung 규칙)
+        usage (ComponentUsageStats): 지정하면 묶음별 부분 집계를 병합해 사용 통계 누적
+    Returns:
+        generator: 결과 딕셔너리
+    """
+    tasks = discover_tasks(source)
+    workers = workers or os.cpu_count() or 1
+    # 묶음 수가 프로세스 수보다 적으면 나머지 프로세스가 놀게 되므로 파일 수에 맞춰 묶음 크기 조정
+    shard_size = max(1, min(shard_size, math.ceil(len(tasks) / workers)))
+    shards = [tasks[i:i + shard_size] for i in range(0, len(tasks), shard_size)]
+
+    print(f"📂 {len(tasks)}개 파일 / {len(shards)}개 묶음 / 프로세스 {workers}개")
+
+    done = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pattern_engine,)) as executor:
+        results = executor.map(_extract_shard, shards, [usage is not None] * len(shards))
+        for rows, count, failed, partial in results:
+            done += count
+            for path, error in failed:
+                print(f"   ⚠️  분석 실패 ({path}): {error}")
+            if partial is not None:
+                usage.merge(ComponentUsageStats.from_dict(partial))
+            yield from rows
+
+    elapsed = time.perf_counter() - start
+    print(f"📊 {done}개 파일 분석 완료 ({elapsed:.2f}초, {done / elapsed if elapsed else 0:.1f}파일/초)")
+
+
+def main():
+    """
+    오프라인 추출 실행
+    사용법: python offline_extract.py [HTML 디렉토리] [저장 파일(.xlsx)] [프로세스 수]
+    컴포넌트 사용 통계는 '<저장 파일>_usage.csv'로 함께 저장
+    """
+    from excel_export import measure_export, format_export_stats, write_csv_streaming, write_excel_streaming
+
+    source = sys.argv[1] if len(sys.argv) > 1 else 'dom_archive'
+    output = sys.argv[2] if len(sys.argv) > 2 else f"offline_components_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    usage = ComponentUsageStats()
+    rows = extract_parallel(source, workers=workers, usage=usage)
+    stats = measure_export(write_excel_streaming, rows, output, measure_memory=False)
+
+    print(f"✅ 파일 저장 완료: {output}")
+    print(f"   └ {stats['rows']}개 컴포넌트 / {format_export_stats(stats)}")
+
+    usage_output = f"{os.path.splitext(output)[0]}_usage.csv"
+    write_csv_streaming(usage.to_rows(), usage_output)
+    print(f"📈 사용 통계 저장: {usage_output} ({usage.pages}개 페이지 / {len(usage.components)}개 컴포넌트)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+템플릿 지문(fingerprint) 기반 샘플링 크롤링
+같은 템플릿을 쓰는 페이지(예: 수천 개의 제품 상세 페이지)를 URL 경로 패턴과
+컴포넌트 순서 지문으로 묶고, 몇 페이지로 같은 템플릿임이 확인되면
+나머지는 샘플만 크롤링하고 결과를 추정(extrapolate)
+"""
+
+import hashlib
+import re
+import sys
+from urllib.parse import urlparse
+
+EXTRAPOLATED_COLUMN = 'Extrapolated From'
+
+# 군집 상태
+CLUSTER_SAMPLING = 'sampling'    # 확인 샘플 수집 중
+CLUSTER_CONFIRMED = 'confirmed'  # 지문이 일치하여 샘플링 중
+CLUSTER_DIVERGED = 'diverged'    # 지문이 달라 전체 크롤링
+
+# 숫자가 들어 있거나 긴 경로 조각은 상품/모델 식별자로 보고 와일드카드로 치환
+ID_SEGMENT_PATTERN = re.compile(r'\d')
+MAX_SLUG_LENGTH = 40
+
+
+def path_pattern(url):
+    """
+    URL 경로 패턴 (호스트 + 식별자 조각을 '*'로 치환한 경로)
+    예: https://www.samsung.com/uk/smartphones/galaxy-s24/buy/ -> www.samsung.com/uk/smartphones/*/buy
+    Args:
+        url (str): URL
+    Returns:
+        str: 경로 패턴
+    """
+    parsed = urlparse(url)
+    segments = [segment for segment in parsed.path.split('/') if segment]
+    pattern = []
+    for index, segment in enumerate(segments):
+        # 첫 조각(국가 코드 등)은 그대로 유지
+        if index > 0 and (ID_SEGMENT_PATTERN.search(segment) or len(segment) > MAX_SLUG_LENGTH):
+            segment = '*'
+        pattern.append(segment.lower())
+    return '/'.join([parsed.netloc.lower()] + pattern)
+
+
+def template_fingerprint(rows):
+    """
+    페이지의 컴포넌트 순서 지문
+    결과 행은 DOM에서 컴포넌트가 처음 나타난 순서이므로 같은 템플릿이면 같은 지문이 나옵니다.
+    Args:
+        rows (list): 페이지 하나의 결과 딕셔너리 리스트
+    Returns:
+        str: 지문 (sha1 앞 12자리)
+    """
+    sequence = '|'.join(row.get('컴포넌트명', '') for row in rows)
+    return hashlib.sha1(sequence.encode('utf-8')).hexdigest()[:12]
+
+
+class TemplateCluster:
+    """경로 패턴 하나의 샘플링 상태"""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.status = CLUSTER_SAMPLING
+        self.fingerprints = {}      # 지문 -> 페이지 수
+        self.crawled = 0
+        self.failed = 0             # 크롤링 실패 (지문에 포함하지 않음)
+        self.extrapolated = 0
+        self.representative = None  # (URL, 결과 행) - 추정에 사용할 대표 페이지
+
+    @property
+    def fingerprint(self):
+        """가장 많이 나온 지문"""
+        if not self.fingerprints:
+            return None
+        return max(self.fingerprints.items(), key=lambda item: item[1])[0]
+
+
+class TemplateSampler:
+    """
+    템플릿 샘플링 정책
+
+    - 경로 패턴별로 처음 confirm_samples개 페이지의 지문이 모두 같으면 템플릿 확인
+    - 확인된 군집은 sample_size개까지만 크롤링하고 나머지는 대표 페이지 결과로 추정
+    - 샘플 중 지문이 다른 페이지가 나오면 그 군집은 전체 크롤링으로 전환
+    """
+
+    def __init__(self, confirm_samples=3, sample_size=5, pattern_fn=path_pattern):
+        """
+        초기화
+        Args:
+            confirm_samples (int): 템플릿 확인에 필요한 지문 일치 페이지 수
+            sample_size (int): 확인된 군집에서 크롤링할 최대 페이지 수
+            pattern_fn (callable): URL -> 경로 패턴 함수
+        """
+        self.confirm_samples = max(1, confirm_samples)
+        self.sample_size = max(self.confirm_samples, sample_size)
+        self.pattern_fn = pattern_fn
+        self.clusters = {}
+
+    def cluster(self, url):
+        """URL의 군집 (처음이면 생성)"""
+        pattern = self.pattern_fn(url)
+        cluster = self.clusters.get(pattern)
+        if cluster is None:
+            cluster = TemplateCluster(pattern)
+            self.clusters[pattern] = cluster
+        return cluster
+
+    def should_crawl(self, url):
+        """URL을 실제로 크롤링해야 하는지 여부"""
+        cluster = self.cluster(url)
+        return cluster.status != CLUSTER_CONFIRMED or cluster.crawled < self.sample_size
+
+    def observe(self, url, rows):
+        """
+        크롤링한 페이지 결과 반영
+        Args:
+            url (str): URL
+            rows (list): 결과 딕셔너리 리스트
+        """
+        cluster = self.cluster(url)
+        fingerprint = template_fingerprint(rows)
+        cluster.crawled += 1
+        cluster.fingerprints[fingerprint] = cluster.fingerprints.get(fingerprint, 0) + 1
+        if cluster.representative is None and rows:
+            cluster.representative = (url, rows)
+
+        if cluster.status == CLUSTER_DIVERGED:
+            return
+        if len(cluster.fingerprints) > 1:
+            cluster.status = CLUSTER_DIVERGED
+            print(f"   🧩 템플릿 불일치 - 전체 크롤링: {cluster.pattern}")
+        elif cluster.status == CLUSTER_SAMPLING and cluster.crawled >= self.confirm_samples and rows:
+            cluster.status = CLUSTER_CONFIRMED
+            print(f"   🧩 템플릿 확인 ({cluster.fingerprint}): {cluster.pattern}")
+
+    def extrapolate(self, url):
+        """
+        대표 페이지 결과로 URL 결과 추정
+        Returns:
+            list: 결과 딕셔너리 리스트 ('Extrapolated From' 컬럼에 대표 URL)
+        """
+        cluster = self.cluster(url)
+        source_url, rows = cluster.representative
+        cluster.extrapolated += 1
+        return [dict(row, URL=url, **{EXTRAPOLATED_COLUMN: source_url}) for row in rows]
+
+    def run(self, urls, task):
+        """
+        URL 목록을 샘플링하며 실행
+        Args:
+            urls (list): URL 목록
+            task (callable): task(url) -> 결과 딕셔너리 리스트, 실패 시 예외 (예: crawler.crawl_page)
+        Returns:
+            list: 모든 페이지의 결과 딕셔너리 리스트 (URL 목록 순서)
+        """
+        results = {}
+        skipped = []
+        for url in urls:
+            if self.should_crawl(url):
+                try:
+                    rows = task(url) or []
+                except Exception as e:
+                    # 일시적인 오류가 빈 지문으로 기록되어 군집이 불일치로 바뀌지 않도록 제외
+                    self.cluster(url).failed += 1
+                    print(f"   ❌ 실패 ({url}): {str(e)}")
+                    results[url] = []
+                    continue
+                self.observe(url, rows)
+                results[url] = [dict(row, **{EXTRAPOLATED_COLUMN: ''}) for row in rows]
+            else:
+                skipped.append(url)
+
+        for url in skipped:
+            results[url] = self.extrapolate(url)
+
+        if skipped:
+            print(f"📉 {len(urls)}개 중 {len(skipped)}개 페이지는 샘플 결과로 추정")
+
+        rows = []
+        for url in urls:
+            rows.extend(results.get(url) or [])
+        return rows
+
+    def report(self):
+        """
+        군집별 샘플링 보고서
+        Returns:
+            list: 군집별 딕셔너리 리스트
+        """
+        return [
+            {
+                '경로 패턴': cluster.pattern,
+                '상태': cluster.status,
+                '지문': cluster.fingerprint or '',
+                '지문 종류': len(cluster.fingerprints),
+                '크롤링': cluster.crawled,
+                '실패': cluster.failed,
+                '추정': cluster.extrapolated,
+                '대표 URL': cluster.representative[0] if cluster.representative else '',
+            }
+            for cluster in self.clusters.values()
+        ]
+
+
+def main():
+    """
+    URL 목록 파일을 샘플링 크롤링
+    사용법: python template_sampler.py [URL 목록 파일] [확인 페이지 수] [샘플 수]
+    """
+    from component_crawler import ComponentCrawler
+    from excel_export import write_csv_streaming
+
+    path = sys.argv[1] if len(sys.argv) > 1 else 'urls.txt'
+    confirm_samples = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sample_size = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    with open(path, encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+    sampler = TemplateSampler(confirm_samples=confirm_samples, sample_size=sample_size)
+    crawler = ComponentCrawler(headless=True)
+    try:
+        rows = sampler.run(urls, crawler.crawl_page)
+        if rows:
+            filename = crawler.save_to_excel(rows, urls[0])
+            report_file = f"{filename.rsplit('.', 1)[0]}_templates.csv"
+            write_csv_streaming(sampler.report(), report_file)
+            print(f"🧩 템플릿 보고서 저장: {report_file}")
+    finally:
+        crawler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+from browser_profiles import BrowserProfileManager
+
+
+def test_manager_removes_clones_of_dead_processes(tmp_path):
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait()
+    clones = tmp_path / 'samsung.com' / 'clones'
+    (clones / f'{dead.pid}-deadbeef' / 'DiskCache').mkdir(parents=True)
+    (clones / f'{os.getpid()}-live0001').mkdir()
+
+    BrowserProfileManager(root=str(tmp_path))
+
+    assert sorted(os.listdir(clones)) == [f'{os.getpid()}-live0001']
+
+
+def test_chrome_arguments_use_absolute_paths(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    profile = BrowserProfileManager(root='profiles').checkout('https://www.samsung.com/uk/')
+    for argument in profile.chrome_arguments():
+        assert os.path.isabs(argument.split('=', 1)[1])
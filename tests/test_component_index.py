@@ -0,0 +1,40 @@
+import threading
+
+from component_index import ComponentSearchIndex
+
+NAMES = ['co76-feature-kv', 'hd08-hero-kv', 'co78-carousel', None]
+CLASSES = ['co76-feature-kv, co78-carousel', 'hd08-hero-kv', 'co78-carousel, co76-feature-kv__title', None]
+
+
+def substring_rows(query):
+    query = query.lower()
+    return [
+        row for row, (name, classes) in enumerate(zip(NAMES, CLASSES))
+        if (isinstance(name, str) and query in name.lower()) or (isinstance(classes, str) and query in classes.lower())
+    ]
+
+
+def test_search_matches_plain_substring_semantics():
+    index = ComponentSearchIndex(NAMES, CLASSES)
+    for query in ['kv, co', 'kv', 'CO76', ' co76', 'carousel, ', 'feature-kv__t', 'zz']:
+        assert index.search(query) == substring_rows(query), query
+
+
+def test_cache_is_safe_across_threads():
+    index = ComponentSearchIndex(NAMES * 50, CLASSES * 50, cache_size=4)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(300):
+                index.search(['co7', 'kv', 'hd0', 'carousel', 'kv, co', 'feature'][(i + offset) % 6])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(index._cache) <= 4
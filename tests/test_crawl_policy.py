@@ -0,0 +1,30 @@
+from component_crawler import DEFAULT_VIEWPORTS, ComponentCrawler
+from crawl_policy import PageExecutor
+from excel_export import write_csv_streaming
+
+
+class FailingFirstCrawler(ComponentCrawler):
+    def crawl_page(self, url):
+        if url.endswith('/broken/'):
+            raise RuntimeError('boom')
+        return [{
+            '번호': 1, 'Site Code': 'UK', 'Page Type': 'Home', 'URL': url, '컴포넌트명': 'co76-feature-kv',
+            '전체 클래스 목록': 'co76-feature-kv', 'Display': 'Y:1 / N:0',
+            'Display (desktop)': 'Y:1 / N:0', 'Display (mobile)': 'Y:0 / N:1',
+        }]
+
+    def close(self):
+        pass
+
+
+def test_failed_first_page_keeps_viewport_columns(tmp_path):
+    executor = PageExecutor(lambda: FailingFirstCrawler(viewports=DEFAULT_VIEWPORTS), retries=0)
+    results = executor.run_many(['https://www.samsung.com/uk/broken/', 'https://www.samsung.com/uk/'])
+    rows = [row for result in results for row in result.to_rows()]
+
+    target = tmp_path / 'rows.csv'
+    write_csv_streaming(rows, str(target))
+    header = target.read_text(encoding='utf-8-sig').splitlines()[0].split(',')
+
+    assert 'Display (desktop)' in header and 'Display (mobile)' in header
+    assert rows[0]['Site Code'] == 'UK' and rows[0]['Status'].startswith('error')
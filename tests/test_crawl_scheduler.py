@@ -0,0 +1,41 @@
+import time
+
+from crawl_scheduler import PolitenessScheduler, StandInServer, fetch_status, parse_crawl_delay
+
+
+def test_parse_crawl_delay_accepts_fractions():
+    lines = ['User-agent: Googlebot', 'Crawl-delay: 3', '', 'User-agent: *', 'Crawl-delay: 0.5']
+    assert parse_crawl_delay(lines, 'Mozilla/5.0') == 0.5
+    assert parse_crawl_delay(lines, 'Googlebot/2.1') == 3.0
+    assert parse_crawl_delay(['User-agent: *', 'Disallow: /x/'], 'Mozilla/5.0') is None
+
+
+def test_fractional_crawl_delay_is_honored():
+    with StandInServer(crawl_delay=0.5) as stand_in:
+        scheduler = PolitenessScheduler(rate=10.0, max_rate=10.0)
+        urls = [f"{stand_in.url}/page/{i}" for i in range(4)]
+        start = time.monotonic()
+        results = scheduler.run(urls, fetch_status, workers=4)
+        elapsed = time.monotonic() - start
+
+    state = next(iter(scheduler.hosts.values()))
+    assert state.crawl_delay == 0.5
+    assert all(results)
+    # 첫 요청 이후 0.5초 간격
+    assert elapsed >= 1.4
+
+
+def test_run_keeps_duplicate_urls_by_position():
+    calls = []
+
+    def task(url):
+        calls.append(url)
+        return [{'URL': url, '번호': len(calls)}]
+
+    scheduler = PolitenessScheduler(respect_robots=False, rate=100.0, max_rate=100.0)
+    urls = ['https://example.com/a', 'https://example.com/b', 'https://example.com/a']
+    results = scheduler.run(urls, task, workers=1)
+
+    assert len(results) == 3 and len(calls) == 3
+    assert [result[0]['URL'] for result in results] == urls
+    assert results[0] is not results[2]
@@ -0,0 +1,38 @@
+import threading
+import time
+
+from crawl_service import JOB_CANCELLED, CrawlService
+
+
+class SlowCrawler:
+    def __init__(self, started, release):
+        self.started = started
+        self.release = release
+
+    def crawl_page(self, url):
+        self.started.set()
+        self.release.wait(5)
+        return [{'URL': url}]
+
+    def close(self):
+        pass
+
+
+def test_stop_cancels_queued_jobs():
+    started = threading.Event()
+    release = threading.Event()
+    service = CrawlService(workers=1, crawler_factory=lambda: SlowCrawler(started, release))
+    service.start()
+    running = service.submit(['https://example.com/0'])
+    assert started.wait(5)
+    queued = service.submit([f'https://example.com/{i}' for i in range(1, 11)])
+
+    threading.Timer(0.2, release.set).start()
+    start = time.monotonic()
+    service.stop()
+
+    assert time.monotonic() - start < 3
+    assert running.completed == 1
+    assert queued.status == JOB_CANCELLED
+    assert queued.completed == 0
+    assert service.status()['pending'] == 0
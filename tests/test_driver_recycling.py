@@ -0,0 +1,42 @@
+from component_crawler import ComponentCrawler
+
+
+class FakeDriver:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def get(self, url):
+        if self.fail:
+            raise RuntimeError('net::ERR_NAME_NOT_RESOLVED')
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, prefixes, budget):
+        return {'divs': [['co76-feature-kv', 'block']], 'found': prefixes, 'settled': True, 'elapsed': 10}
+
+    def execute_script(self, script, *args):
+        return 'Home'
+
+
+def make_crawler(driver):
+    crawler = ComponentCrawler()
+    crawler.driver = driver
+    crawler.driver_process_id = lambda: None
+    crawler.recycle_reason = lambda: None
+    return crawler
+
+
+def test_successful_load_counts_page():
+    crawler = make_crawler(FakeDriver())
+    crawler.fetch_page('https://www.samsung.com/uk/', audit_prefixes=['co76-'])
+    assert crawler.pages_on_driver == 1
+
+
+def test_failed_load_does_not_count_page():
+    crawler = make_crawler(FakeDriver(fail=True))
+    try:
+        crawler.fetch_page('https://www.samsung.com/uk/', audit_prefixes=['co76-'])
+    except RuntimeError:
+        pass
+    assert crawler.pages_on_driver == 0
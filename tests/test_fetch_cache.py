@@ -0,0 +1,80 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fetch_cache import PageCache
+
+LAST_MODIFIED = 'Mon, 19 Oct 2026 00:00:00 GMT'
+
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    """ETag/Last-Modified를 보내고 If-None-Match가 맞으면 304를 돌려주는 가짜 페이지"""
+
+    page = {'etag': '"v1"', 'body': b'<html>v1</html>'}
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == self.page['etag']:
+            self.send_response(304)
+            self.send_header('ETag', self.page['etag'])
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', self.page['etag'])
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(self.page['body'])))
+        self.end_headers()
+        self.wfile.write(self.page['body'])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    ConditionalHandler.page = {'etag': '"v1"', 'body': b'<html>v1</html>'}
+    ConditionalHandler.requests = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ConditionalHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/page"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_reuses_rows_and_changed_etag_refreshes(server, tmp_path):
+    cache = PageCache(str(tmp_path / 'cache.json'), timeout=5)
+    rows = [{'컴포넌트명': 'co76-feature-kv'}]
+
+    first = cache.precheck(server, 'cfg')
+    assert not first.unchanged
+    assert first.validators['etag'] == '"v1"'
+    cache.store(server, rows, first.validators, 'cfg')
+    cache.save()
+
+    # 새 프로세스처럼 파일에서 다시 읽은 캐시로 확인 -> 304
+    cache = PageCache(str(tmp_path / 'cache.json'), timeout=5)
+    second = cache.precheck(server, 'cfg')
+    assert ConditionalHandler.requests[-1]['If-None-Match'] == '"v1"'
+    assert ConditionalHandler.requests[-1]['If-Modified-Since'] == LAST_MODIFIED
+    assert second.unchanged
+    assert second.rows == rows
+
+    # 페이지가 바뀌면 (새 ETag + 새 본문) 다시 렌더링해야 함
+    ConditionalHandler.page = {'etag': '"v2"', 'body': b'<html>v2</html>'}
+    third = cache.precheck(server, 'cfg')
+    assert not third.unchanged
+    assert third.rows is None
+    assert third.validators['etag'] == '"v2"'
+
+
+def test_config_change_skips_conditional_request(server, tmp_path):
+    cache = PageCache(str(tmp_path / 'cache.json'), timeout=5)
+    first = cache.precheck(server, 'cfg')
+    cache.store(server, [{'컴포넌트명': 'hd08'}], first.validators, 'cfg')
+
+    result = cache.precheck(server, 'other-cfg')
+    assert 'If-None-Match' not in ConditionalHandler.requests[-1]
+    assert not result.unchanged
@@ -0,0 +1,15 @@
+from offline_extract import extract_parallel
+
+
+def test_small_inputs_are_split_across_workers(tmp_path, capsys):
+    for i in range(4):
+        (tmp_path / f'page{i}.html').write_text(
+            '<link rel="canonical" href="https://www.samsung.com/uk/">'
+            f'<div class="co76-feature-kv"></div><div class="hd08-hero-{i}"></div>',
+            encoding='utf-8',
+        )
+
+    rows = list(extract_parallel(str(tmp_path), workers=4))
+
+    assert len(rows) == 8
+    assert '4개 묶음' in capsys.readouterr().out
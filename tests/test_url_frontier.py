@@ -0,0 +1,19 @@
+from url_frontier import Frontier
+
+
+def test_frontier_crawls_original_links_and_dedupes_normalized():
+    frontier = Frontier(['https://www.samsung.com/uk'], max_depth=2, max_pages=10)
+    added = frontier.add_links([
+        'https://www.samsung.com/uk/buy?x=a%20b',
+        'https://www.samsung.com/uk/buy/?x=a+b&utm_source=mail',
+        'https://www.samsung.com/de/',
+    ], depth=1)
+
+    assert added == 1
+    assert [url for url, _ in frontier] == ['https://www.samsung.com/uk', 'https://www.samsung.com/uk/buy?x=a%20b']
+
+
+def test_frontier_queue_is_capped_by_max_pages():
+    frontier = Frontier(['https://www.samsung.com/uk/'], max_pages=5)
+    frontier.add_links([f'https://www.samsung.com/uk/p{i}' for i in range(1000)], depth=1)
+    assert len(frontier.queue) == 5
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+크롤링 중 링크 발견 (사이트맵 없이 사이트 전체 크롤링)
+URL 정규화(추적 파라미터 제거, 호스트 소문자, 끝 슬래시 통일), 메모리가 고정된
+Bloom filter 중복 제거, 깊이/페이지 수 제한이 있는 너비 우선(BFS) 프런티어
+"""
+
+import hashlib
+import math
+import sys
+from collections import deque
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# 결과에 영향을 주지 않는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'gclid', 'gbraid', 'wbraid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga', '_gl',
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# 페이지가 아닌 파일 링크
+SKIP_EXTENSIONS = (
+    '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.mp4', '.webm', '.mp3',
+    '.zip', '.gz', '.exe', '.dmg', '.apk', '.xml', '.json', '.css', '.js', '.txt', '.csv', '.xlsx',
+)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """
+    URL 정규화 (중복 판정용)
+    - scheme/호스트 소문자, 기본 포트와 #fragment 제거
+    - utm_*, gclid, fbclid 등 추적 파라미터 제거, 나머지 파라미터 정렬
+    - 연속된 '/' 정리, 확장자가 없는 경로는 '/'로 끝나도록 통일
+    Args:
+        url (str): URL
+    Returns:
+        str: 정규화된 URL (http/https가 아니면 None)
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+
+    host = parsed.hostname.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        return None
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parsed.path or '/'
+    while '//' in path:
+        path = path.replace('//', '/')
+    last_segment = path.rsplit('/', 1)[-1]
+    if last_segment and '.' not in last_segment:
+        path += '/'
+
+    params = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(params))
+    return urlunparse((scheme, host, path, '', query, ''))
+
+
+def site_host(url):
+    """사이트 비교용 호스트 ('www.' 제외)"""
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def same_site(base_url, link):
+    """링크가 기준 URL과 같은 사이트인지 여부"""
+    return site_host(base_url) == site_host(link)
+
+
+class BloomFilter:
+    """
+    Bloom filter (확률적 집합)
+    URL 문자열을 저장하지 않고 고정 크기 비트 배열만 사용합니다.
+    이미 본 URL은 항상 걸러지며, 처음 보는 URL을 본 것으로 잘못 판단할 확률이 error_rate입니다.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        """
+        초기화
+        Args:
+            capacity (int): 예상 항목 수
+            error_rate (float): capacity개 저장 시 목표 오탐률
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        # 128비트 해시 하나를 둘로 나누어 k개의 위치 생성 (double hashing)
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def add(self, item):
+        """
+        항목 추가
+        Returns:
+            bool: 새 항목이면 True (이미 있었던 것으로 보이면 False)
+        """
+        added = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def memory_bytes(self):
+        return len(self.bits)
+
+
+class Frontier:
+    """
+    너비 우선 URL 프런티어
+
+    - 시작 URL과 같은 호스트, 같은 경로 아래(예: /uk/)의 링크만 추가
+    - 깊이(max_depth)와 전체 페이지 수(max_pages) 제한 (대기열도 max_pages까지만 보관)
+    - 정규화된 URL을 Bloom filter 키로 중복 제거 (크롤링은 원래 링크 그대로)
+    """
+
+    def __init__(self, seeds, max_depth=2, max_pages=1000, bloom_capacity=1_000_000, error_rate=0.001,
+                 scope=None):
+        """
+        초기화
+        Args:
+            seeds (list): 시작 URL 목록
+            max_depth (int): 시작 URL로부터의 최대 링크 깊이
+            max_pages (int): 최대 크롤링 페이지 수
+            bloom_capacity (int): 중복 제거용 Bloom filter 예상 URL 수
+            error_rate (float): Bloom filter 오탐률
+            scope (callable): scope(url) -> 추가 여부 (None이면 시작 URL의 호스트/경로 아래)
+        """
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.seen = BloomFilter(bloom_capacity, error_rate)
+        self.queue = deque()
+        self.dispatched = 0
+        self.discovered = 0
+
+        normalized = [(seed.strip(), normalize_url(seed)) for seed in seeds]
+        normalized = [(seed, key) for seed, key in normalized if key]
+        self.prefixes = [self._prefix(key) for _, key in normalized]
+        self.scope = scope or self.in_scope
+        for seed, key in normalized:
+            self._push(seed, key, 0)
+
+    @staticmethod
+    def _prefix(url):
+        parsed = urlparse(url)
+        directory = parsed.path.rsplit('/', 1)[0] + '/'
+        return site_host(url), directory
+
+    def in_scope(self, url):
+        """시작 URL과 같은 사이트, 같은 경로 아래인지 여부"""
+        host = site_host(url)
+        path = urlparse(url).path
+        return any(host == seed_host and path.startswith(directory) for seed_host, directory in self.prefixes)
+
+    def _push(self, url, key, depth):
+        # 정규화는 중복 판정에만 사용 (끝 슬래시/쿼리 인코딩이 바뀐 URL은 다른 페이지일 수 있음)
+        if self.seen.add(key):
+            self.queue.append((url, depth))
+            self.discovered += 1
+
+    def add_links(self, links, depth):
+        """
+        페이지에서 발견한 링크 추가
+        Args:
+            links (iterable): 링크 URL 목록
+            depth (int): 링크의 깊이 (링크가 있던 페이지 깊이 + 1)
+        Returns:
+            int: 새로 추가된 URL 수
+        """
+        if depth > self.max_depth:
+            return 0
+        before = self.discovered
+        for link in links:
+            # 페이지 수 제한만큼 대기열이 차면 더 담지 않음 (크롤링하지 않을 URL 문자열을 보관하지 않도록)
+            if len(self.queue) + self.dispatched >= self.max_pages:
+                break
+            key = normalize_url(link)
+            if not key or urlparse(key).path.lower().endswith(SKIP_EXTENSIONS) or not self.scope(key):
+                continue
+            self._push(link.strip(), key, depth)
+        return self.discovered - before
+
+    def __iter__(self):
+        """(URL, 깊이)를 너비 우선 순서로 반환 (페이지 수 제한까지)"""
+        while self.queue and self.dispatched < self.max_pages:
+            self.dispatched += 1
+            yield self.queue.popleft()
+
+    def crawl(self, crawler):
+        """
+        프런티어를 따라 크롤링 (한 번의 추출에서 링크도 함께 수집)
+        Args:
+            crawler (ComponentCrawler): 크롤러
+        Returns:
+            list: 모든 페이지의 결과 딕셔너리 리스트
+        """
+        rows = []
+        for url, depth in self:
+            rows.extend(crawler.crawl_divs(url, harvest_links=True))
+            added = self.add_links(crawler.last_links, depth + 1)
+            print(f"   🔗 깊이 {depth}: 링크 {len(crawler.last_links)}개 / 새 URL {added}개 "
+                  f"(대기 {len(self.queue)}개, 완료 {self.dispatched}/{self.max_pages})")
+        print(f"🧭 {self.dispatched}개 페이지 크롤링 / {self.discovered}개 URL 발견 "
+              f"(중복 제거 {self.seen.memory_bytes / 1024:.0f}KB)")
+        return rows
+
+
+def main():
+    """
+    시작 URL부터 링크를 따라 크롤링
+    사용법: python url_frontier.py [시작 URL] [최대 깊이] [최대 페이지 수]
+    """
+    from component_crawler import ComponentCrawler
+
+    seed = sys.argv[1] if len(sys.argv) > 1 else input("시작 URL을 입력하세요: ").strip()
+    max_depth = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    frontier = Frontier([seed], max_depth=max_depth, max_pages=max_pages)
+    crawler = ComponentCrawler(headless=True)
+    try:
+        rows = frontier.crawl(crawler)
+        if rows:
+            crawler.save_to_excel(rows, seed)
+    finally:
+        crawler.close()
+
+
+if __name__ == "__main__":
+    main()